@@ -0,0 +1,259 @@
+"""
+Compressed, append-only archive of aged-out audit trail records.
+
+Each export writes a new gzip-compressed NDJSON segment (one AuditLog row per
+line) next to a small JSON sidecar index holding the record count, the
+created_at range and per-day / per-user counts. Segments are never rewritten,
+so an archive directory can be copied or synced incrementally.
+
+The reader consults the sidecar indexes first and only decompresses segments
+that can contain matching records.
+"""
+
+import gzip
+import json
+import mmap
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from audit.models import AuditLog
+
+SEGMENT_SUFFIX = ".ndjson.gz"
+INDEX_SUFFIX = ".index.json"
+
+ARCHIVE_FIELDS = [
+    "id",
+    "audit_module",
+    "audit_type",
+    "status",
+    "correspondence_id",
+    "user_id",
+    "user_name",
+    "user_role",
+    "user_email",
+    "action",
+    "request_meta",
+    "ip_address",
+    "country",
+    "old_values",
+    "new_values",
+    "request_id",
+    "created_at",
+]
+
+
+def get_archive_dir(directory=None) -> Path:
+    path = Path(directory or settings.AUDIT_ARCHIVE_DIR)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _encode(record: dict) -> bytes:
+    # Compact separators keep lines small and make the raw-bytes pre-filter in
+    # the reader predictable.
+    return (
+        json.dumps(record, cls=DjangoJSONEncoder, separators=(",", ":")) + "\n"
+    ).encode("utf-8")
+
+
+@dataclass
+class SegmentIndex:
+    segment: str
+    records: int = 0
+    start: Optional[str] = None
+    end: Optional[str] = None
+    dates: Dict[str, int] = field(default_factory=dict)
+    users: Dict[str, int] = field(default_factory=dict)
+
+    def add(self, record: dict):
+        # Rows arrive ordered by created_at, so the first and last row bound
+        # the segment.
+        created_at = record["created_at"]
+        if self.start is None:
+            self.start = created_at.isoformat()
+        self.end = created_at.isoformat()
+        day = created_at.date().isoformat()
+        self.dates[day] = self.dates.get(day, 0) + 1
+        user_id = record["user_id"]
+        self.users[user_id] = self.users.get(user_id, 0) + 1
+        self.records += 1
+
+    def covers(self, start=None, end=None, user_id=None) -> bool:
+        """Return False when the segment cannot contain a matching record."""
+        if not self.records:
+            return False
+        if user_id is not None and str(user_id) not in self.users:
+            return False
+        if start is not None and datetime.fromisoformat(self.end) < _as_datetime(start):
+            return False
+        if end is not None and datetime.fromisoformat(self.start) > _as_datetime(
+            end, upper=True
+        ):
+            return False
+        return True
+
+    @classmethod
+    def load(cls, path: Path) -> "SegmentIndex":
+        with open(path, "r", encoding="utf-8") as fh:
+            return cls(**json.load(fh))
+
+
+def _as_datetime(value, upper=False) -> datetime:
+    """Normalise a date/datetime bound; date upper bounds cover the whole day."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time.max if upper else time.min)
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+def export_audit_logs(
+    queryset=None,
+    before=None,
+    after=None,
+    directory=None,
+    purge=False,
+    batch_size=2000,
+) -> Optional[SegmentIndex]:
+    """
+    Export AuditLog rows created in [after, before) to a new segment.
+
+    Returns the segment index, or None when no rows matched. When ``purge`` is
+    set the exported rows are deleted once the segment is safely on disk.
+    """
+    if queryset is None:
+        queryset = AuditLog.objects.all()
+    if before is not None:
+        queryset = queryset.filter(created_at__lt=before)
+    if after is not None:
+        queryset = queryset.filter(created_at__gte=after)
+    queryset = queryset.order_by("created_at", "id")
+
+    archive_dir = get_archive_dir(directory)
+    name = "audit-{}".format(timezone.now().strftime("%Y%m%dT%H%M%S%f"))
+    segment_path = archive_dir / f"{name}{SEGMENT_SUFFIX}"
+    tmp_path = archive_dir / f".{name}{SEGMENT_SUFFIX}.part"
+
+    index = SegmentIndex(segment=segment_path.name)
+    exported_ids: List = []
+
+    with open(tmp_path, "wb") as raw, gzip.GzipFile(
+        fileobj=raw, mode="wb", compresslevel=6
+    ) as gz:
+        for record in queryset.values(*ARCHIVE_FIELDS).iterator(chunk_size=batch_size):
+            gz.write(_encode(record))
+            index.add(record)
+            if purge:
+                exported_ids.append(record["id"])
+        gz.flush()
+        raw.flush()
+        os.fsync(raw.fileno())
+
+    if not index.records:
+        tmp_path.unlink(missing_ok=True)
+        return None
+
+    os.replace(tmp_path, segment_path)
+    index_path = archive_dir / f"{name}{INDEX_SUFFIX}"
+    with open(index_path, "w", encoding="utf-8") as fh:
+        json.dump(index.__dict__, fh, separators=(",", ":"))
+
+    if purge:
+        for offset in range(0, len(exported_ids), batch_size):
+            with transaction.atomic():
+                AuditLog.objects.filter(
+                    id__in=exported_ids[offset : offset + batch_size]
+                ).delete()
+
+    return index
+
+
+class AuditArchiveReader:
+    """
+    Scan archived segments without loading them into the database.
+
+    ``use_mmap`` memory-maps each segment and decompresses from the mapping,
+    which avoids copying large files through Python buffers; otherwise the
+    segment is streamed from disk.
+    """
+
+    def __init__(self, directory=None, use_mmap=False):
+        self.directory = get_archive_dir(directory)
+        self.use_mmap = use_mmap
+
+    def indexes(self) -> List[SegmentIndex]:
+        return sorted(
+            (
+                SegmentIndex.load(path)
+                for path in self.directory.glob(f"*{INDEX_SUFFIX}")
+            ),
+            key=lambda index: index.start or "",
+        )
+
+    def segments(self, start=None, end=None, user_id=None) -> List[SegmentIndex]:
+        return [
+            index
+            for index in self.indexes()
+            if index.covers(start=start, end=end, user_id=user_id)
+        ]
+
+    def _lines(self, segment: str) -> Iterator[bytes]:
+        path = self.directory / segment
+        with open(path, "rb") as fh:
+            if not self.use_mmap:
+                with gzip.GzipFile(fileobj=fh, mode="rb") as gz:
+                    yield from gz
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with gzip.GzipFile(fileobj=mapped, mode="rb") as gz:
+                    yield from gz
+
+    def scan(
+        self,
+        start=None,
+        end=None,
+        user_id=None,
+        audit_module=None,
+        audit_type=None,
+        status=None,
+    ) -> Iterator[dict]:
+        """Yield archived records matching every given filter."""
+        start = _as_datetime(start) if start is not None else None
+        end = _as_datetime(end, upper=True) if end is not None else None
+        user_needle = (
+            _encode({"user_id": str(user_id)})[1:-2] if user_id is not None else None
+        )
+        filters = {
+            key: value
+            for key, value in (
+                ("audit_module", audit_module),
+                ("audit_type", audit_type),
+                ("status", status),
+            )
+            if value is not None
+        }
+
+        for index in self.segments(start=start, end=end, user_id=user_id):
+            for line in self._lines(index.segment):
+                # Cheap byte-level rejection before decoding the JSON.
+                if user_needle is not None and user_needle not in line:
+                    continue
+                record = json.loads(line)
+                created_at = datetime.fromisoformat(record["created_at"])
+                if start is not None and created_at < start:
+                    continue
+                if end is not None and created_at > end:
+                    continue
+                if any(record.get(key) != value for key, value in filters.items()):
+                    continue
+                yield record
@@ -27,6 +27,11 @@ class AuditStatusEnum(CustomEnum):
     PENDING = "pending", "Pending"
 
 
+class AuditRollupGranularityEnum(CustomEnum):
+    HOUR = "hour", "Hourly"
+    DAY = "day", "Daily"
+
+
 class AuditModuleEnum(CustomEnum):
     AUTH = "auth", "Authentication"
     USER = "user", "User Management"
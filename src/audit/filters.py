@@ -1,4 +1,5 @@
 import django_filters
+from django.db.models.functions import Upper
 
 from audit.enums import AuditModuleEnum, AuditStatusEnum, AuditTypeEnum
 from audit.models import AuditLog
@@ -11,6 +12,12 @@ class AuditLogFilter(DateFilter):
     status = django_filters.ChoiceFilter(choices=AuditStatusEnum.choices())
     user_name = django_filters.CharFilter(lookup_expr="icontains")
     user_email = django_filters.CharFilter(lookup_expr="icontains")
+    ip_address = django_filters.CharFilter(method="filter_ip_address")
+    country = django_filters.CharFilter(method="filter_country")
+    user_agent = django_filters.CharFilter(
+        field_name="request_meta__user_agent", lookup_expr="icontains"
+    )
+    correspondence = django_filters.NumberFilter(field_name="correspondence_id")
 
     class Meta:
         model = AuditLog
@@ -20,6 +27,23 @@ class AuditLogFilter(DateFilter):
             "status",
             "user_name",
             "user_email",
+            "ip_address",
+            "country",
+            "user_agent",
+            "correspondence",
             "start",
             "end",
         ]
+
+    def filter_country(self, queryset, name, value):
+        # UPPER(country) rather than iexact's UPPER(country::text), so the
+        # functional index applies.
+        return queryset.alias(country_upper=Upper("country")).filter(
+            country_upper=value.strip().upper()
+        )
+
+    def filter_ip_address(self, queryset, name, value):
+        ip_address = AuditLog.clean_ip_address(value)
+        if ip_address is None:
+            return queryset.none()
+        return queryset.filter(ip_address=ip_address)
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from audit.archive import export_audit_logs
+
+
+def _parse_date(value):
+    try:
+        return timezone.make_aware(datetime.strptime(value, "%Y-%m-%d"))
+    except ValueError:
+        raise CommandError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+class Command(BaseCommand):
+    help = "Export audit logs to a compressed NDJSON archive segment"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=None,
+            help="Archive logs older than this many days (defaults to AUDIT_RETENTION_DAYS)",
+        )
+        parser.add_argument("--before", help="Archive logs created before this date (YYYY-MM-DD)")
+        parser.add_argument("--after", help="Archive logs created on or after this date (YYYY-MM-DD)")
+        parser.add_argument("--dir", dest="directory", help="Archive directory (defaults to AUDIT_ARCHIVE_DIR)")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Delete the exported rows once the segment has been written",
+        )
+
+    def handle(self, *args, **options):
+        if options["before"]:
+            before = _parse_date(options["before"])
+        else:
+            days = options["older_than_days"]
+            if days is None:
+                days = settings.AUDIT_RETENTION_DAYS
+            before = timezone.now() - timedelta(days=days)
+        after = _parse_date(options["after"]) if options["after"] else None
+
+        index = export_audit_logs(
+            before=before,
+            after=after,
+            directory=options["directory"],
+            purge=options["purge"],
+            batch_size=options["batch_size"],
+        )
+        if index is None:
+            self.stdout.write("No audit logs to archive.")
+            return
+
+        action = "Archived and purged" if options["purge"] else "Archived"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{action} {index.records} audit logs ({index.start} - {index.end}) to {index.segment}"
+            )
+        )
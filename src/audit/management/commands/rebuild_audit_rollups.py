@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from audit.rollups import rebuild_rollups
+
+
+def _parse_date(value):
+    try:
+        return timezone.make_aware(datetime.strptime(value, "%Y-%m-%d"))
+    except ValueError:
+        raise CommandError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+class Command(BaseCommand):
+    help = "Rebuild audit activity rollups from the live audit log table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="Rebuild buckets from this date (YYYY-MM-DD)")
+        parser.add_argument("--end", help="Rebuild buckets before this date (YYYY-MM-DD)")
+
+    def handle(self, *args, **options):
+        start = _parse_date(options["start"]) if options["start"] else None
+        end = _parse_date(options["end"]) if options["end"] else None
+        created = rebuild_rollups(start=start, end=end)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {created} audit activity rollups"))
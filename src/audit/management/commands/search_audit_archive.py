@@ -0,0 +1,48 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from audit.archive import AuditArchiveReader
+
+
+class Command(BaseCommand):
+    help = "Search archived audit logs and print matches as NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", help="Created on or after (ISO date or datetime)")
+        parser.add_argument("--end", help="Created on or before (ISO date or datetime)")
+        parser.add_argument("--user-id")
+        parser.add_argument("--audit-module")
+        parser.add_argument("--audit-type")
+        parser.add_argument("--status")
+        parser.add_argument("--dir", dest="directory", help="Archive directory (defaults to AUDIT_ARCHIVE_DIR)")
+        parser.add_argument("--limit", type=int, default=None)
+        parser.add_argument("--mmap", action="store_true", help="Memory-map segments instead of streaming them")
+        parser.add_argument(
+            "--segments",
+            action="store_true",
+            help="Only list the segments that could contain matches",
+        )
+
+    def handle(self, *args, **options):
+        reader = AuditArchiveReader(directory=options["directory"], use_mmap=options["mmap"])
+
+        if options["segments"]:
+            for index in reader.segments(
+                start=options["start"], end=options["end"], user_id=options["user_id"]
+            ):
+                self.stdout.write(f"{index.segment}\t{index.records}\t{index.start}\t{index.end}")
+            return
+
+        matches = reader.scan(
+            start=options["start"],
+            end=options["end"],
+            user_id=options["user_id"],
+            audit_module=options["audit_module"],
+            audit_type=options["audit_type"],
+            status=options["status"],
+        )
+        for count, record in enumerate(matches, start=1):
+            self.stdout.write(json.dumps(record, separators=(",", ":")))
+            if options["limit"] and count >= options["limit"]:
+                break
@@ -0,0 +1,66 @@
+# Generated by Django 5.1.2 on 2026-10-19 00:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0006_auditlog_correspondence_alter_auditlog_audit_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditActivityRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("hour", "Hourly"), ("day", "Daily")], max_length=10
+                    ),
+                ),
+                ("bucket", models.DateTimeField()),
+                ("audit_module", models.CharField(max_length=50)),
+                ("audit_type", models.CharField(max_length=100)),
+                ("status", models.CharField(max_length=10)),
+                ("user_id", models.CharField(max_length=255)),
+                ("count", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "ordering": ["granularity", "bucket"],
+                "indexes": [
+                    models.Index(
+                        fields=["granularity", "bucket"],
+                        name="audit_audit_granula_97bccc_idx",
+                    ),
+                    models.Index(
+                        fields=["granularity", "user_id", "bucket"],
+                        name="audit_audit_granula_b8b70d_idx",
+                    ),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=(
+                            "granularity",
+                            "bucket",
+                            "audit_module",
+                            "audit_type",
+                            "status",
+                            "user_id",
+                        ),
+                        name="unique_audit_activity_rollup",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-19 00:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0007_auditactivityrollup"),
+        ("correspondence", "0023_remove_correspondence_forward"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auditlog",
+            name="country",
+            field=models.CharField(blank=True, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name="auditlog",
+            name="ip_address",
+            field=models.GenericIPAddressField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["ip_address", "created_at"],
+                name="audit_audit_ip_addr_a8150a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["country", "created_at"], name="audit_audit_country_617d3f_idx"
+            ),
+        ),
+    ]
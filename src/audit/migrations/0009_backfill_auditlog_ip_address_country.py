@@ -0,0 +1,44 @@
+import ipaddress
+
+from django.db import migrations
+
+
+def _clean_ip_address(value):
+    if not value:
+        return None
+    try:
+        return str(ipaddress.ip_address(str(value).strip()))
+    except ValueError:
+        return None
+
+
+def backfill_request_fields(apps, schema_editor):
+    AuditLog = apps.get_model("audit", "AuditLog")
+    queryset = AuditLog.objects.filter(request_meta__isnull=False).only(
+        "id", "request_meta"
+    )
+
+    batch = []
+    for log in queryset.iterator(chunk_size=2000):
+        meta = log.request_meta or {}
+        if not isinstance(meta, dict):
+            continue
+        log.ip_address = _clean_ip_address(meta.get("ip_address"))
+        log.country = (meta.get("country") or "")[:100] or None
+        batch.append(log)
+        if len(batch) >= 2000:
+            AuditLog.objects.bulk_update(batch, ["ip_address", "country"])
+            batch = []
+    if batch:
+        AuditLog.objects.bulk_update(batch, ["ip_address", "country"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0008_auditlog_ip_address_country"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_request_fields, migrations.RunPython.noop),
+    ]
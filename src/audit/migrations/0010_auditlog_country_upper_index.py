@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:18
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0009_backfill_auditlog_ip_address_country"),
+        ("correspondence", "0023_remove_correspondence_forward"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="auditlog",
+            name="audit_audit_country_617d3f_idx",
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                django.db.models.functions.text.Upper("country"),
+                models.F("created_at"),
+                name="audit_log_country_upper_idx",
+            ),
+        ),
+    ]
@@ -1,8 +1,16 @@
+import ipaddress
 import uuid
 
 from django.db import models
+from django.db.models.functions import Upper
 
-from .enums import AuditModuleEnum, AuditStatusEnum, AuditTypeEnum, LogParams
+from .enums import (
+    AuditModuleEnum,
+    AuditRollupGranularityEnum,
+    AuditStatusEnum,
+    AuditTypeEnum,
+    LogParams,
+)
 from correspondence.models import Correspondence
 
 
@@ -27,6 +35,9 @@ class AuditLog(models.Model):
 
     action = models.TextField()
     request_meta = models.JSONField(null=True, blank=True)
+    # Promoted out of request_meta so security reviews can use an index.
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    country = models.CharField(max_length=100, null=True, blank=True)
     old_values = models.JSONField(null=True, blank=True)
     new_values = models.JSONField(null=True, blank=True)
     request_id = models.CharField(
@@ -40,10 +51,36 @@ class AuditLog(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["ip_address", "created_at"]),
+            # Matches the case-insensitive country filter (see audit.filters).
+            models.Index(Upper("country"), "created_at", name="audit_log_country_upper_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user_name} <{self.user_email}> - {self.action}"
 
+    @staticmethod
+    def clean_ip_address(value):
+        """Return a normalised IP address, or None if the value is not one."""
+        if not value:
+            return None
+        try:
+            return str(ipaddress.ip_address(str(value).strip()))
+        except ValueError:
+            return None
+
+    def populate_request_fields(self):
+        meta = self.request_meta or {}
+        if self.ip_address is None:
+            self.ip_address = self.clean_ip_address(meta.get("ip_address"))
+        if self.country is None and meta.get("country"):
+            self.country = meta["country"][:100]
+
+    def save(self, *args, **kwargs):
+        self.populate_request_fields()
+        super().save(*args, **kwargs)
+
     @classmethod
     def log_action(cls, params: LogParams):
         """
@@ -64,3 +101,45 @@ class AuditLog(models.Model):
             new_values=params.new_values,
             request_id=params.request_id,
         )
+
+
+class AuditActivityRollup(models.Model):
+    """
+    Pre-aggregated audit event counts per hour/day bucket, kept up to date as
+    audit logs are written (see audit.rollups). Rows outlive the AuditLog rows
+    they were built from, so archived history still shows up in analytics.
+    """
+
+    granularity = models.CharField(
+        max_length=10, choices=AuditRollupGranularityEnum.choices()
+    )
+    bucket = models.DateTimeField()
+    audit_module = models.CharField(max_length=50)
+    audit_type = models.CharField(max_length=100)
+    status = models.CharField(max_length=10)
+    user_id = models.CharField(max_length=255)
+    count = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["granularity", "bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=[
+                    "granularity",
+                    "bucket",
+                    "audit_module",
+                    "audit_type",
+                    "status",
+                    "user_id",
+                ],
+                name="unique_audit_activity_rollup",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["granularity", "bucket"]),
+            models.Index(fields=["granularity", "user_id", "bucket"]),
+        ]
+
+    def __str__(self):
+        return f"{self.granularity} {self.bucket:%Y-%m-%d %H:%M} {self.audit_type}: {self.count}"
@@ -1,17 +1,41 @@
 from rest_framework import serializers
 
+from audit.enums import (
+    AuditModuleEnum,
+    AuditRollupGranularityEnum,
+    AuditStatusEnum,
+    AuditTypeEnum,
+)
 from audit.models import AuditLog
+from audit.rollups import DIMENSIONS
+from utils.serialization import SparseFieldsMixin, ValuesListSerializer
 
 
-class AuditLogSerializer(serializers.ModelSerializer):
-    ip_address = serializers.SerializerMethodField()
+class AuditLogSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = AuditLog
+        list_serializer_class = ValuesListSerializer
         fields = ["user_name", "correspondence", "user_role", "action", "audit_type", "audit_module",
-                  "ip_address", "created_at", ]
-        
-    def get_ip_address(self, obj):
-        if not obj.request_meta:
-            return None
-        return obj.request_meta.get('ip_address')
-    
\ No newline at end of file
+                  "ip_address", "country", "created_at", ]
+
+
+class AuditAnalyticsQuerySerializer(serializers.Serializer):
+    granularity = serializers.ChoiceField(
+        choices=AuditRollupGranularityEnum.choices(),
+        default=AuditRollupGranularityEnum.DAY.raw_value,
+    )
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    group_by = serializers.ChoiceField(choices=DIMENSIONS, required=False)
+    audit_module = serializers.ChoiceField(
+        choices=AuditModuleEnum.choices(), required=False
+    )
+    audit_type = serializers.ChoiceField(choices=AuditTypeEnum.choices(), required=False)
+    status = serializers.ChoiceField(choices=AuditStatusEnum.choices(), required=False)
+    user_id = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        start, end = attrs.get("start"), attrs.get("end")
+        if start and end and start > end:
+            raise serializers.ValidationError({"end": "End date must be after start date."})
+        return attrs
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from audit.models import AuditLog
+from audit.rollups import record_activity
+
+
+@receiver(post_save, sender=AuditLog)
+def update_activity_rollups(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        record_activity(instance)
@@ -1,5 +1,10 @@
+from datetime import timedelta
+
 from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
 
+from audit.archive import export_audit_logs
 from audit.contrib.logger import log_event
 from correspondence.models import Correspondence
 
@@ -11,3 +16,13 @@ def log_audit_event_task(payload):
     if correspondence_id:
         payload["correspondence"] = Correspondence.objects.get(id=correspondence_id)
     return log_event(payload)
+
+
+@shared_task
+def archive_audit_logs_task(older_than_days=None, purge=True):
+    if older_than_days is None:
+        older_than_days = settings.AUDIT_RETENTION_DAYS
+    index = export_audit_logs(
+        before=timezone.now() - timedelta(days=older_than_days), purge=purge
+    )
+    return index.records if index else 0
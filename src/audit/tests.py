@@ -1,3 +1,51 @@
-from django.test import TestCase
+from audit.models import AuditLog
+from utils.testing import APIQueryBudgetTestCase
 
-# Create your tests here.
+ANALYTICS_VIEWERS = {
+    "super_admin": 200,
+    "managing_director": 200,
+    "general_manager": 403,
+    "hr": 403,
+    "staff": 403,
+    "no_role": 403,
+}
+
+
+class AuditLogQueryTests(APIQueryBudgetTestCase):
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        user = self.users["super_admin"]
+        for url in (
+            "/v1/audit/",
+            "/v1/audit/?audit_module=correspondence&ordering=-created_at",
+            "/v1/audit/?search=logged",
+        ):
+            with self.subTest(url=url):
+                self.assertConstantQueries(url, user)
+
+    def test_list(self):
+        self.assertQueryBudget(2, "get", "/v1/audit/", self.users["super_admin"], status=200)
+
+    def test_retrieve(self):
+        log = AuditLog.objects.order_by("created_at").first()
+        self.assertQueryBudget(
+            1, "get", f"/v1/audit/{log.pk}/", self.users["super_admin"], status=200
+        )
+
+    def test_analytics(self):
+        user = self.users["super_admin"]
+        for query in ("", "?granularity=hour", "?group_by=audit_module"):
+            with self.subTest(query=query):
+                self.assertQueryBudget(2, "get", f"/v1/audit/analytics/{query}", user, status=200)
+        self.assertQueryBudgetByRole(2, "get", "/v1/audit/analytics/", ANALYTICS_VIEWERS)
+
+    def test_analytics_requires_authentication(self):
+        response, _ = self.request("get", "/v1/audit/analytics/")
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_country_filter_is_case_insensitive(self):
+        response = self.assertQueryBudget(
+            2, "get", "/v1/audit/?country=nigeria", self.users["super_admin"], status=200
+        )
+        expected = AuditLog.objects.filter(country="Nigeria").count()
+        self.assertGreater(expected, 0)
+        self.assertEqual(response.json()["meta"]["total_results"], expected)
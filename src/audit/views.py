@@ -1,17 +1,23 @@
-# from django_filters.rest_framework import DjangoFilterBackend
+from datetime import datetime, time
+
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
+from rest_framework.decorators import action
 
 from audit.models import AuditLog
 from audit.filters import AuditLogFilter
-from audit.serializers import AuditLogSerializer
+from audit.rollups import activity_series
+from audit.serializers import AuditAnalyticsQuerySerializer, AuditLogSerializer
 from console.permissions import IsSuperAdmin, permissions_required
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from utils.pagination import CustomPagination
 from utils.permissions import PERMISSIONS
 from utils.response import Response
+from utils.serialization import ValuesListMixin
 
 
-class AuditLogViewSets(viewsets.ModelViewSet):
+class AuditLogViewSets(ValuesListMixin, viewsets.ModelViewSet):
     """Admin Audit Log"""
 
     queryset = AuditLog.objects.all()
@@ -20,7 +26,7 @@ class AuditLogViewSets(viewsets.ModelViewSet):
     permission_classes = (AllowAny,)
     http_method_names = ["get"]
     filter_backends = [
-        # DjangoFilterBackend,
+        DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
@@ -28,7 +34,6 @@ class AuditLogViewSets(viewsets.ModelViewSet):
     search_fields = ["user_name", "user_email", "action", "audit_type"]
     ordering_fields = ["created_at"]
 
-    
     def list(self, request, *args, **kwargs):
         try:
             filtered_queryset = self.filter_queryset(self.get_queryset())
@@ -56,3 +61,39 @@ class AuditLogViewSets(viewsets.ModelViewSet):
             message="Audit trail record retrieved successfully.",
             data=serializer.data,
         )
+
+    @action(detail=False, methods=["get"], permission_classes=[IsAuthenticated])
+    @permissions_required([PERMISSIONS.CAN_ACCESS_SYSTEM_ADMIN])
+    def analytics(self, request):
+        """Hourly/daily audit activity counts served from the rollup table."""
+        serializer = AuditAnalyticsQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(
+                success=False,
+                errors=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+        params = dict(serializer.validated_data)
+        granularity = params.pop("granularity")
+        group_by = params.pop("group_by", None)
+        start, end = params.pop("start", None), params.pop("end", None)
+        if start:
+            start = timezone.make_aware(datetime.combine(start, time.min))
+        if end:
+            end = timezone.make_aware(datetime.combine(end, time.max))
+
+        series = activity_series(
+            granularity, start=start, end=end, group_by=group_by, **params
+        )
+        return Response(
+            success=True,
+            status_code=status.HTTP_200_OK,
+            message="Audit activity retrieved successfully.",
+            data={
+                "granularity": granularity,
+                "group_by": group_by,
+                "total": sum(row["count"] for row in series),
+                "series": series,
+            },
+        )
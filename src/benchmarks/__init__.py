@@ -0,0 +1,12 @@
+"""
+Micro-benchmarks for hot paths, run in-process against a throwaway in-memory
+SQLite database so they never touch a real one:
+
+    cd src && python -m benchmarks serializers
+
+Store a baseline before a change and compare against it afterwards; the
+comparison exits 1 when any metric is more than --threshold slower:
+
+    python -m benchmarks --save-baseline
+    python -m benchmarks --compare
+"""
@@ -0,0 +1,82 @@
+import argparse
+import io
+import sys
+
+from benchmarks import baseline, bootstrap
+
+SUITES = ["serializers", "renderers", "throughput", "permissions", "writes", "stats"]
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("suites", nargs="*", metavar="suite", help=", ".join(SUITES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--correspondence", type=int, default=2000)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--audit-logs", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=baseline.DEFAULT_PATH,
+        metavar="PATH",
+        help=f"Store this run's metrics (defaults to {baseline.DEFAULT_PATH.name})",
+    )
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=baseline.DEFAULT_PATH,
+        metavar="PATH",
+        help="Compare against a stored baseline; exits 1 if anything got slower",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=baseline.DEFAULT_THRESHOLD,
+        help="Relative slowdown reported as a regression (default 0.10)",
+    )
+    args = parser.parse_args()
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(sorted(unknown))}")
+    previous = baseline.load(args.compare) if args.compare else None
+
+    bootstrap.setup()
+
+    from django.core.management import call_command
+
+    from benchmarks import data
+
+    dataset = {
+        "users": args.users,
+        "correspondence": args.correspondence,
+        "tasks": args.tasks,
+        "audit_logs": args.audit_logs,
+        "seed": args.seed,
+    }
+    call_command("seed_roles_permissions", stdout=io.StringIO())
+    data.seed(**dataset)
+
+    meta = baseline.environment(dataset, args.repeat)
+    suites = {}
+    for suite in args.suites or SUITES:
+        module = __import__(f"benchmarks.{suite}", fromlist=["run", "report", "metrics"])
+        results = module.run(repeat=args.repeat)
+        print(f"== {suite}")
+        print(module.report(results))
+        suites[suite] = module.metrics(results)
+
+    if args.save_baseline:
+        baseline.save(args.save_baseline, suites, meta)
+        print(f"Baseline saved to {args.save_baseline}")
+    if previous is not None:
+        text, regressions = baseline.compare(previous, suites, meta, args.threshold)
+        print("== comparison")
+        print(text)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
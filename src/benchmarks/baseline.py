@@ -0,0 +1,89 @@
+"""
+Stored baselines and the comparison report. A baseline is a JSON file with
+each suite's metrics (microseconds per operation, lower is better) and the
+conditions they were measured under. Timings are only comparable on the same
+dataset; to absorb a faster or busier machine, each run also times a fixed
+pure-Python workload and comparisons are scaled by the ratio.
+"""
+import json
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+
+import django
+
+from benchmarks.timing import best_of
+
+DEFAULT_PATH = Path(__file__).resolve().parent / "baselines" / "default.json"
+DEFAULT_THRESHOLD = 0.10
+
+
+def calibrate(repeat=5):
+    """Microseconds for a fixed mix of dict, string and sorting work."""
+
+    def workload():
+        rows = [{"id": index, "name": f"row {index}"} for index in range(20000)]
+        return sorted(rows, key=lambda row: row["name"])[-1]["id"]
+
+    seconds, _ = best_of(workload, repeat)
+    return round(seconds * 1e6, 2)
+
+
+def environment(dataset, repeat):
+    return {
+        "calibration_us": calibrate(repeat),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "dataset": dataset,
+        "repeat": repeat,
+    }
+
+
+def save(path, suites, meta):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    suites = {
+        suite: {name: round(value, 2) for name, value in metrics.items()}
+        for suite, metrics in suites.items()
+    }
+    path.write_text(json.dumps({"meta": meta, "suites": suites}, indent=2, sort_keys=True) + "\n")
+
+
+def load(path):
+    return json.loads(Path(path).read_text())
+
+
+def compare(baseline, suites, meta, threshold=DEFAULT_THRESHOLD):
+    """Return (report text, names of metrics slower than the threshold)."""
+    lines, regressions = [], []
+    if baseline["meta"].get("dataset") != meta["dataset"]:
+        lines.append(
+            f"warning: baseline dataset {baseline['meta'].get('dataset')} "
+            f"differs from this run's {meta['dataset']}"
+        )
+    # >1 when this machine (or run) is slower than the baseline's.
+    scale = meta["calibration_us"] / baseline["meta"]["calibration_us"]
+    lines.append(f"calibration: timings scaled by {1 / scale:.2f} to the baseline machine")
+    lines.append(f"{'metric':<56}{'baseline us':>13}{'current us':>13}{'change':>9}")
+    for suite, metrics in suites.items():
+        previous = baseline["suites"].get(suite, {})
+        for name, current in metrics.items():
+            label = f"{suite}: {name}"
+            current = current / scale
+            if name not in previous:
+                lines.append(f"{label:<56}{'-':>13}{current:>13,.1f}{'new':>9}")
+                continue
+            change = current / previous[name] - 1
+            flag = ""
+            if change > threshold:
+                flag = "  slower"
+                regressions.append(label)
+            elif change < -threshold:
+                flag = "  faster"
+            lines.append(
+                f"{label:<56}{previous[name]:>13,.1f}{current:>13,.1f}{change:>+9.1%}{flag}"
+            )
+    return "\n".join(lines), regressions
+
@@ -0,0 +1,22 @@
+"""Set up Django on an in-memory database for benchmark runs."""
+import os
+
+import django
+
+
+def setup():
+    os.environ["DATABASE_URL"] = "sqlite://:memory:"
+    # Keep runs hermetic: local-memory cache, Celery tasks run inline.
+    os.environ["CACHE_BACKEND"] = "locmem"
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+    django.setup()
+
+    from django.conf import settings
+    from django.core.management import call_command
+
+    from core.celery import app
+
+    app.conf.task_always_eager = True
+    settings.DEBUG = False
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, "testserver"]
+    call_command("migrate", verbosity=0, interactive=False)
@@ -0,0 +1,19 @@
+"""Deterministic fixture data for benchmarks, from common.synthetic."""
+from datetime import date
+
+# Fixed so that timings don't drift with the calendar.
+ANCHOR = date(2025, 1, 31)
+
+
+def seed(users=200, correspondence=2000, tasks=2000, audit_logs=2000, seed=0):
+    from common.synthetic import generate
+
+    return generate(
+        users=users,
+        correspondence=correspondence,
+        tasks=tasks,
+        audit_logs=audit_logs,
+        departments=10,
+        seed=seed,
+        anchor=ANCHOR,
+    )
@@ -0,0 +1,67 @@
+"""
+The permission check behind every protected view: CustomUser.has_permissions
+with the role snapshot warm in process memory, after the process copy has been
+evicted (as an invalidation does), and with nothing cached at all; plus the
+full permissions_required decorator around a no-op view method.
+"""
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.timing import op_metrics, op_report, op_result, per_op
+
+
+def cases():
+    from console.permissions import permissions_required
+    from core.resources.cache import Cache
+    from user import permission_cache
+    from user.models.admin import Role
+    from user.models.models import CustomUser
+    from utils.permissions import PERMISSIONS
+
+    role = Role.objects.get(code="MANAGING_DIRECTOR")
+    user = CustomUser.objects.filter(role=role).first() or CustomUser.objects.create_user(
+        email="benchmark.md@bench.local", password="password", name="Benchmark MD", role=role
+    )
+    required = [PERMISSIONS.CAN_VIEW_CORRESPONDENCE, PERMISSIONS.CAN_ASSIGN_TASKS]
+
+    def check():
+        return user.has_permissions(required)
+
+    def evicted():
+        permission_cache._local.pop(role.id, None)
+        return check()
+
+    def uncached():
+        Cache().flush()
+        return evicted()
+
+    class View:
+        @permissions_required(required)
+        def get(self, request):
+            return True
+
+    view, request = View(), APIRequestFactory().get("/")
+    request.user = user
+
+    return [
+        ("has_permissions (warm)", check),
+        ("has_permissions (process copy evicted)", evicted),
+        ("has_permissions (nothing cached)", uncached),
+        ("permissions_required view", lambda: view.get(request)),
+    ]
+
+
+def run(repeat=5):
+    results = []
+    for name, func in cases():
+        if not func():
+            raise AssertionError(f"{name}: permission check failed")
+        results.append(op_result(name, per_op(func, repeat, number=1000)))
+    return results
+
+
+def report(results):
+    return op_report(results, "check")
+
+
+def metrics(results):
+    return op_metrics(results)
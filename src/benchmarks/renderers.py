@@ -0,0 +1,90 @@
+"""
+Response encoding: DRF's JSONRenderer versus the orjson and MessagePack
+renderers (utils.renderers), on full correspondence and audit pages wrapped
+in the standard response envelope. Reports encode time and payload size, and
+checks the orjson output is byte-identical to the stock renderer's.
+"""
+from rest_framework.renderers import JSONRenderer
+
+from benchmarks.timing import best_of
+from utils.renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+
+
+def envelope(data):
+    return {
+        "success": True,
+        "message": "Results retrieved successfully",
+        "data": data,
+        "errors": None,
+        "meta": {
+            "current_page": 1,
+            "total_pages": 1,
+            "page_size": len(data),
+            "total_results": len(data),
+        },
+    }
+
+
+def pages():
+    from audit.models import AuditLog
+    from audit.serializers import AuditLogSerializer
+    from correspondence.models import Correspondence
+    from correspondence.serializers import CorrespondenceListSerializer
+
+    return [
+        (
+            "correspondence page",
+            envelope(CorrespondenceListSerializer(Correspondence.objects.all(), many=True).data),
+        ),
+        (
+            "audit page",
+            envelope(AuditLogSerializer(AuditLog.objects.all(), many=True).data),
+        ),
+    ]
+
+
+def run(repeat=5):
+    renderers = [("json", JSONRenderer()), ("orjson", ORJSONRenderer())]
+    if msgpack is not None:
+        renderers.append(("msgpack", MessagePackRenderer()))
+
+    results = []
+    for name, payload in pages():
+        baseline = None
+        for renderer_name, renderer in renderers:
+            seconds, body = best_of(lambda: renderer.render(payload), repeat)
+            if baseline is None:
+                baseline = (seconds, body)
+            results.append(
+                {
+                    "name": f"{name} ({len(payload['data'])} rows)",
+                    "renderer": renderer_name,
+                    "ms": seconds * 1000,
+                    "bytes": len(body),
+                    "speedup": baseline[0] / seconds,
+                    "identical": (
+                        body == baseline[1] if renderer_name == "orjson" else None
+                    ),
+                }
+            )
+    return results
+
+
+def report(results):
+    lines = [
+        f"{'page':<32}{'renderer':<10}{'ms':>9}{'bytes':>11}{'speedup':>9}  identical"
+    ]
+    for result in results:
+        identical = "" if result["identical"] is None else result["identical"]
+        lines.append(
+            f"{result['name']:<32}{result['renderer']:<10}{result['ms']:>9.2f}"
+            f"{result['bytes']:>11,}{result['speedup']:>8.1f}x  {identical}"
+        )
+    return "\n".join(lines)
+
+
+def metrics(results):
+    return {
+        f"{result['name']} {result['renderer']}": result["ms"] * 1000
+        for result in results
+    }
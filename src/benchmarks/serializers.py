@@ -0,0 +1,82 @@
+"""
+List serializer throughput: the regular DRF path over model instances versus
+the values_list() path (utils.serialization), on the querysets the list
+views use. Also checks that both render to identical JSON. For
+fragment-cached serializers (utils.fragments) the "after" figure is a warm
+cache, since only the first repetition renders the rows.
+"""
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.timing import best_of
+
+
+def cases():
+    # user.serializers first: tasks.serializers imports it back.
+    from user.models.models import CustomUser
+    from user.serializers import StaffListSerializer
+    from correspondence.models import Correspondence
+    from correspondence.serializers import CorrespondenceListSerializer
+    from tasks.models import Task
+    from tasks.serializers import TaskSerializer
+
+    return [
+        ("correspondence list", CorrespondenceListSerializer, Correspondence.objects.all()),
+        (
+            "task list",
+            TaskSerializer,
+            Task.objects.select_related("assigned_to", "assigned_by").all(),
+        ),
+        ("staff list", StaffListSerializer, CustomUser.objects.order_by("name")),
+    ]
+
+
+def run(repeat=5):
+    request = Request(APIRequestFactory().get("/"))
+    context = {"request": request}
+    renderer = JSONRenderer()
+    results = []
+    for name, serializer_class, queryset in cases():
+
+        def instances():
+            child = serializer_class(context=context)
+            return serializers.ListSerializer(list(queryset.all()), child=child).data
+
+        def values():
+            return serializer_class(queryset.all(), many=True, context=context).data
+
+        before, expected = best_of(instances, repeat)
+        after, actual = best_of(values, repeat)
+        rows = len(expected)
+        results.append(
+            {
+                "name": name,
+                "rows": rows,
+                "before_rows_per_sec": rows / before,
+                "after_rows_per_sec": rows / after,
+                "speedup": before / after,
+                "identical": renderer.render(expected) == renderer.render(actual),
+            }
+        )
+    return results
+
+
+def report(results):
+    lines = [
+        f"{'serializer':<22}{'rows':>7}{'before rows/s':>16}{'after rows/s':>15}"
+        f"{'speedup':>9}  identical"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['name']:<22}{result['rows']:>7}"
+            f"{result['before_rows_per_sec']:>16,.0f}{result['after_rows_per_sec']:>15,.0f}"
+            f"{result['speedup']:>8.1f}x  {result['identical']}"
+        )
+    return "\n".join(lines)
+
+
+def metrics(results):
+    # Microseconds per row on the path the views use.
+    return {result["name"]: 1e6 / result["after_rows_per_sec"] for result in results}
@@ -0,0 +1,54 @@
+"""
+Stats helpers: correspondence statistics over the whole table and over one
+receiver's items, the task summary on the staff profile, and the per-user
+average task time recalculation (rolled back afterwards).
+"""
+from django.db import transaction
+
+from benchmarks.timing import op_metrics, op_report, op_result, per_op
+
+
+def cases():
+    # user.serializers first: tasks.serializers imports it back.
+    import user.serializers  # noqa: F401
+    from correspondence.models import Correspondence
+    from correspondence.utils import get_correspondence_stats
+    from tasks.models import Task
+    from tasks.serializers import TaskSummarySerializer
+    from user.models.models import CustomUser
+    from user.service import update_user_avg_task_time
+
+    staff = (
+        CustomUser.objects.filter(assigned_tasks__status="completed").order_by("id").first()
+        or CustomUser.objects.order_by("id").first()
+    )
+
+    return [
+        ("correspondence stats (all)", get_correspondence_stats),
+        (
+            "correspondence stats (one receiver)",
+            lambda: get_correspondence_stats(Correspondence.objects.filter(receiver=staff)),
+        ),
+        (
+            "task summary (one assignee)",
+            lambda: TaskSummarySerializer(Task.objects.filter(assigned_to=staff)).data,
+        ),
+        ("update_user_avg_task_time", lambda: update_user_avg_task_time(staff)),
+    ]
+
+
+def run(repeat=5):
+    results = []
+    with transaction.atomic():
+        for name, func in cases():
+            results.append(op_result(name, per_op(func, repeat, number=20)))
+        transaction.set_rollback(True)
+    return results
+
+
+def report(results):
+    return op_report(results, "helper")
+
+
+def metrics(results):
+    return op_metrics(results)
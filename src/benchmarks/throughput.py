@@ -0,0 +1,82 @@
+"""
+Serializer throughput as the views drive it, queries included: a page (up to
+PAGE_SIZE rows) of the correspondence, task, staff and role lists, and a
+single correspondence retrieve with its replies and forwards. Fragment-cached
+list rows (utils.fragments) are warm after the first repetition, as they are
+in steady-state traffic.
+"""
+import itertools
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from benchmarks.timing import op_metrics, op_report, op_result, per_op
+
+PAGE_SIZE = 50
+
+
+def cases(context):
+    # user.serializers first: tasks.serializers imports it back.
+    from user.models.admin import Role
+    from user.models.models import CustomUser
+    from user.serializers import StaffListSerializer
+    from user.serializers.permissions import RoleSerializer
+    from correspondence.models import Correspondence
+    from correspondence.serializers import (
+        CorrespondenceListSerializer,
+        CorrespondenceRetrieveSerializer,
+    )
+    from tasks.models import Task
+    from tasks.serializers import TaskSerializer
+
+    def page(serializer_class, queryset):
+        return lambda: serializer_class(
+            queryset.all()[:PAGE_SIZE], many=True, context=context
+        ).data
+
+    # Cycle through threads that have replies, so the notes are exercised.
+    thread_ids = list(
+        Correspondence.objects.filter(replies__isnull=False)
+        .order_by("id")
+        .values_list("id", flat=True)
+        .distinct()[:PAGE_SIZE]
+    )
+    next_id = itertools.cycle(thread_ids).__next__
+    retrieve_queryset = Correspondence.objects.select_related("sender", "receiver", "through")
+
+    def retrieve():
+        instance = retrieve_queryset.get(pk=next_id())
+        return CorrespondenceRetrieveSerializer(instance, context=context).data
+
+    return [
+        (
+            "correspondence list page",
+            page(CorrespondenceListSerializer, Correspondence.objects.order_by("-created_at")),
+        ),
+        ("correspondence retrieve", retrieve),
+        (
+            "task list page",
+            page(TaskSerializer, Task.objects.select_related("assigned_to", "assigned_by")),
+        ),
+        ("staff list page", page(StaffListSerializer, CustomUser.objects.order_by("name"))),
+        (
+            "role list page",
+            page(RoleSerializer, Role.objects.select_related("parent").order_by("name")),
+        ),
+    ]
+
+
+def run(repeat=5):
+    context = {"request": Request(APIRequestFactory().get("/"))}
+    return [
+        op_result(name, per_op(func, repeat, number=10))
+        for name, func in cases(context)
+    ]
+
+
+def report(results):
+    return op_report(results, "serializer")
+
+
+def metrics(results):
+    return op_metrics(results)
@@ -0,0 +1,43 @@
+import time
+
+
+def best_of(func, repeat=5):
+    """Run ``func`` ``repeat`` times; return (fastest seconds, last result)."""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def per_op(func, repeat=5, number=100):
+    """
+    Best-of-``repeat`` seconds per call, timing ``number`` calls per round so
+    that fast operations rise above timer resolution.
+    """
+
+    def batch():
+        for _ in range(number):
+            func()
+
+    seconds, _ = best_of(batch, repeat)
+    return seconds / number
+
+
+def op_result(name, seconds, **extra):
+    return {"name": name, "us_per_op": seconds * 1e6, "ops_per_sec": 1 / seconds, **extra}
+
+
+def op_report(results, label="operation"):
+    lines = [f"{label:<44}{'us/op':>12}{'ops/s':>14}"]
+    for result in results:
+        lines.append(
+            f"{result['name']:<44}{result['us_per_op']:>12,.1f}{result['ops_per_sec']:>14,.0f}"
+        )
+    return "\n".join(lines)
+
+
+def op_metrics(results):
+    return {result["name"]: result["us_per_op"] for result in results}
@@ -0,0 +1,63 @@
+"""
+Write paths: Correspondence.save allocating the next daily reference number,
+and audit event writing, both directly through log_event (the insert plus
+the rollup signal) and through the Celery task the views call, run eagerly.
+Everything runs in a transaction that is rolled back, so the dataset is the
+same for the suites that follow.
+"""
+from django.db import transaction
+
+from benchmarks.timing import op_metrics, op_report, op_result, per_op
+
+
+def cases():
+    from audit.contrib.logger import log_event
+    from audit.enums import AuditModuleEnum, AuditStatusEnum, AuditTypeEnum, LogParams
+    from audit.tasks import log_audit_event_task
+    from correspondence.models import Correspondence
+    from user.models.models import CustomUser
+
+    sender, receiver = CustomUser.objects.exclude(role=None).order_by("id")[:2]
+
+    def save_correspondence():
+        Correspondence(
+            subject="Benchmark correspondence",
+            note="Kindly find attached.",
+            sender=sender,
+            receiver=receiver,
+        ).save()
+
+    event = LogParams(
+        audit_type=AuditTypeEnum.USER_LOGIN.raw_value,
+        audit_module=AuditModuleEnum.USER.raw_value,
+        status=AuditStatusEnum.SUCCESS.raw_value,
+        user_id=str(sender.id),
+        user_name=sender.name.upper(),
+        user_email=sender.email,
+        user_role=sender.role.name,
+        action=f"{sender.name.upper()} logged in",
+        request_meta={"ip_address": "10.0.0.1", "user_agent": "Mozilla/5.0", "path": "/v1/auth/login"},
+    ).__dict__
+
+    return [
+        ("Correspondence.save (new reference)", save_correspondence),
+        ("audit log_event", lambda: log_event(dict(event))),
+        ("audit log_audit_event_task (eager)", lambda: log_audit_event_task.delay(dict(event))),
+    ]
+
+
+def run(repeat=5):
+    results = []
+    with transaction.atomic():
+        for name, func in cases():
+            results.append(op_result(name, per_op(func, repeat, number=100)))
+        transaction.set_rollback(True)
+    return results
+
+
+def report(results):
+    return op_report(results, "write")
+
+
+def metrics(results):
+    return op_metrics(results)
@@ -1,3 +1,51 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import RequestProfile, SlowQuery
+
+
+@admin.register(SlowQuery)
+class SlowQueryAdmin(admin.ModelAdmin):
+    list_display = [
+        'short_sql', 'source', 'occurrences', 'mean_duration', 'max_duration_ms', 'last_seen'
+    ]
+    list_filter = ['source', 'plan_analyzed']
+    search_fields = ['normalized_sql', 'source']
+    ordering = ['-last_seen']
+    readonly_fields = [
+        'fingerprint', 'normalized_sql', 'source', 'stack', 'plan', 'plan_analyzed',
+        'occurrences', 'last_duration_ms', 'max_duration_ms', 'total_duration_ms',
+        'first_seen', 'last_seen',
+    ]
+
+    def short_sql(self, obj):
+        return obj.normalized_sql[:120]
+    short_sql.short_description = 'SQL'
+
+    def mean_duration(self, obj):
+        return f"{obj.mean_duration_ms:.1f}"
+    mean_duration.short_description = 'Mean (ms)'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = ['method', 'path', 'route', 'mode', 'status_code', 'duration_ms', 'size', 'created_at']
+    list_filter = ['mode', 'route']
+    search_fields = ['path', 'route']
+    ordering = ['-created_at']
+    exclude = ['data']
+    readonly_fields = [
+        'user', 'method', 'path', 'route', 'mode', 'format', 'status_code',
+        'duration_ms', 'size', 'created_at',
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class CommonConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "common"
+
+    def ready(self):
+        from django.conf import settings
+        from django.db.backends.signals import connection_created
+
+        if settings.SLOW_QUERY_THRESHOLD_MS:
+            from common.slow_queries import install
+
+            connection_created.connect(install, dispatch_uid="slow-queries.install")
@@ -0,0 +1,116 @@
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from common.synthetic import DEFAULT_CHUNK_SIZE, DEFAULT_PASSWORD, EMAIL_DOMAIN, generate
+
+PRESETS = {
+    "small": {
+        "users": 200,
+        "correspondence": 2000,
+        "tasks": 2000,
+        "audit_logs": 2000,
+        "departments": 20,
+    },
+    "medium": {
+        "users": 1000,
+        "correspondence": 200_000,
+        "tasks": 50_000,
+        "audit_logs": 1_000_000,
+        "departments": 40,
+    },
+    "production": {
+        "users": 5000,
+        "correspondence": 2_000_000,
+        "tasks": 500_000,
+        "audit_logs": 10_000_000,
+        "departments": 60,
+    },
+}
+
+
+class Command(BaseCommand):
+    help = "Generate deterministic synthetic data at production volumes"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--preset", choices=PRESETS, default="small")
+        parser.add_argument("--users", type=int, help="Overrides the preset")
+        parser.add_argument("--correspondence", type=int, help="Overrides the preset")
+        parser.add_argument("--tasks", type=int, help="Overrides the preset")
+        parser.add_argument("--audit-logs", type=int, help="Overrides the preset")
+        parser.add_argument("--departments", type=int, help="Overrides the preset")
+        parser.add_argument(
+            "--replies",
+            type=float,
+            default=0.4,
+            help="Share of correspondence that replies to or forwards a thread",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--days", type=int, default=365, help="Spread rows over this many days")
+        parser.add_argument("--anchor", help="Last day of the window (YYYY-MM-DD, defaults to today)")
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument(
+            "--password",
+            default=DEFAULT_PASSWORD,
+            help="Password for every generated user",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Allow running with DEBUG off",
+        )
+
+    def handle(self, *args, **options):
+        from user.models.models import CustomUser
+
+        if not settings.DEBUG and not options["force"]:
+            raise CommandError("DEBUG is off; pass --force to write synthetic data anyway.")
+        if not 0 <= options["replies"] < 1:
+            raise CommandError("--replies must be between 0 and 1.")
+        anchor = None
+        if options["anchor"]:
+            try:
+                anchor = datetime.strptime(options["anchor"], "%Y-%m-%d").date()
+            except ValueError:
+                raise CommandError(f"Invalid date '{options['anchor']}', expected YYYY-MM-DD")
+
+        seed = options["seed"]
+        if CustomUser.objects.filter(email__endswith=f".s{seed}@{EMAIL_DOMAIN}").exists():
+            raise CommandError(f"Seed {seed} has already been generated; pick another --seed.")
+
+        volumes = {
+            name: options[name] if options[name] is not None else default
+            for name, default in PRESETS[options["preset"]].items()
+        }
+        self._steps = {}
+        started = time.monotonic()
+        try:
+            counts = generate(
+                **volumes,
+                replies=options["replies"],
+                seed=seed,
+                days=options["days"],
+                anchor=anchor,
+                chunk_size=options["chunk_size"],
+                password=options["password"],
+                progress=self.progress,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {sum(counts.values()):,} rows in {elapsed:.1f}s: "
+                + ", ".join(f"{count:,} {label}" for label, count in counts.items())
+            )
+        )
+
+    def progress(self, label, done, total):
+        # One line per tenth of each table, not one per chunk.
+        step = done * 10 // max(total, 1)
+        if step != self._steps.get(label):
+            self._steps[label] = step
+            self.stdout.write(f"  {label}: {done:,}/{total:,}")
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.2 on 2026-10-19 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SlowQuery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("fingerprint", models.CharField(max_length=40, unique=True)),
+                ("normalized_sql", models.TextField()),
+                (
+                    "source",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        help_text="Route (view name) or Celery task that last ran the query",
+                        max_length=255,
+                    ),
+                ),
+                (
+                    "stack",
+                    models.TextField(
+                        blank=True,
+                        help_text="Innermost project frames, outermost first",
+                    ),
+                ),
+                ("plan", models.TextField(blank=True)),
+                ("plan_analyzed", models.BooleanField(default=False)),
+                ("occurrences", models.PositiveIntegerField(default=1)),
+                ("last_duration_ms", models.FloatField()),
+                ("max_duration_ms", models.FloatField()),
+                ("total_duration_ms", models.FloatField()),
+                ("first_seen", models.DateTimeField(auto_now_add=True)),
+                ("last_seen", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name_plural": "slow queries",
+                "ordering": ["-last_seen"],
+            },
+        ),
+    ]
@@ -1,3 +1,65 @@
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class SlowQuery(models.Model):
+    """
+    One normalized SQL shape that ran above SLOW_QUERY_THRESHOLD_MS (see
+    common.slow_queries). Repeats update the counters rather than adding rows.
+    """
+
+    fingerprint = models.CharField(max_length=40, unique=True)
+    normalized_sql = models.TextField()
+    source = models.CharField(
+        max_length=255, blank=True, db_index=True,
+        help_text="Route (view name) or Celery task that last ran the query",
+    )
+    stack = models.TextField(blank=True, help_text="Innermost project frames, outermost first")
+    plan = models.TextField(blank=True)
+    plan_analyzed = models.BooleanField(default=False)
+    occurrences = models.PositiveIntegerField(default=1)
+    last_duration_ms = models.FloatField()
+    max_duration_ms = models.FloatField()
+    total_duration_ms = models.FloatField()
+    first_seen = models.DateTimeField(auto_now_add=True)
+    last_seen = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ["-last_seen"]
+        verbose_name_plural = "slow queries"
+
+    def __str__(self):
+        return f"{self.normalized_sql[:80]} ({self.max_duration_ms:.0f} ms)"
+
+    @property
+    def mean_duration_ms(self):
+        return self.total_duration_ms / self.occurrences
+
+
+class RequestProfile(models.Model):
+    """A profiled request (see common.profiling); ``data`` is the download."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=2048)
+    route = models.CharField(max_length=255, blank=True)
+    mode = models.CharField(max_length=20)
+    format = models.CharField(max_length=20)
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    size = models.PositiveIntegerField()
+    data = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.mode}, {self.duration_ms:.0f} ms)"
+
+    @property
+    def filename(self):
+        extension = {"pstats": "prof", "collapsed": "folded"}.get(self.format, "txt")
+        return f"profile-{self.pk}.{extension}"
@@ -0,0 +1,246 @@
+"""
+On-demand profiling of live requests, for admins.
+
+An admin asks for a token (``POST /v1/common/profiles/token``), then sends
+it with the request to profile, either as the ``X-Profile-Token`` header or
+the ``profile`` query parameter. Tokens are signed, expire after
+PROFILE_TOKEN_MAX_AGE seconds and name the profiler:
+
+- ``cprofile``: deterministic cProfile, stored as a pstats dump (load it with
+  ``pstats.Stats`` or snakeviz),
+- ``sampling``: a thread samples the request's stack every
+  PROFILE_SAMPLE_INTERVAL seconds, stored as collapsed stacks for
+  flamegraph.pl / speedscope.
+
+The result is saved as a RequestProfile and its id returned in the
+``X-Profile-Id`` response header; download it from
+``/v1/common/profiles/<id>/download``.
+
+To keep this safe on production traffic:
+
+- only one request per process is profiled at a time,
+- each admin gets PROFILE_RATE_LIMIT profiles per hour,
+- results are capped at PROFILE_MAX_BYTES (a pstats dump that doesn't fit is
+  replaced by a text summary, collapsed stacks keep the heaviest ones),
+- only the PROFILE_MAX_ROWS most recent profiles are kept.
+
+A skipped profile is reported in ``X-Profile-Skipped``; the request itself
+always runs normally.
+"""
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from redis.exceptions import RedisError
+
+from core.resources.cache import Cache
+
+TOKEN_HEADER = "X-Profile-Token"
+TOKEN_PARAM = "profile"
+TOKEN_SALT = "common.profiling"
+
+MODE_CPROFILE = "cprofile"
+MODE_SAMPLING = "sampling"
+MODES = (MODE_CPROFILE, MODE_SAMPLING)
+
+FORMAT_PSTATS = "pstats"
+FORMAT_PSTATS_TEXT = "pstats-text"
+FORMAT_COLLAPSED = "collapsed"
+
+PSTATS_TEXT_LIMIT = 200
+PROJECT_DIR = str(settings.BASE_DIR)
+
+_busy = threading.Lock()
+
+
+def make_token(user, mode=MODE_CPROFILE) -> str:
+    return signing.dumps({"user": user.pk, "mode": mode}, salt=TOKEN_SALT)
+
+
+def read_token(token):
+    """The token's payload, or None if it is forged or expired."""
+    try:
+        payload = signing.loads(
+            token, salt=TOKEN_SALT, max_age=settings.PROFILE_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return None
+    if payload.get("mode") not in MODES:
+        return None
+    return payload
+
+
+def _within_rate_limit(user_id) -> bool:
+    window = int(time.time() // 3600)
+    key = f"request-profile:rate:{user_id}:{window}"
+    cache = Cache()
+    try:
+        cache.add(key, 0, ttl=3600)
+        return cache.incr(key) <= settings.PROFILE_RATE_LIMIT
+    except RedisError:
+        return False
+
+
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    if filename.startswith(PROJECT_DIR):
+        filename = os.path.relpath(filename, PROJECT_DIR)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """Sample one thread's stack from a background thread."""
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        max_samples = settings.PROFILE_MAX_SAMPLES
+        samples = 0
+        while not self._stop.wait(self.interval) and samples < max_samples:
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+                samples += 1
+
+    def result(self, max_bytes):
+        out, size = [], 0
+        for stack, count in self.stacks.most_common():
+            line = f"{stack} {count}\n".encode()
+            if size + len(line) > max_bytes:
+                break
+            out.append(line)
+            size += len(line)
+        return b"".join(out), FORMAT_COLLAPSED
+
+
+def _pstats_result(profiler, max_bytes):
+    stats = pstats.Stats(profiler)
+    data = marshal.dumps(stats.stats)
+    if len(data) <= max_bytes:
+        return data, FORMAT_PSTATS
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(
+        PSTATS_TEXT_LIMIT
+    )
+    return stream.getvalue().encode()[:max_bytes], FORMAT_PSTATS_TEXT
+
+
+def _trim():
+    from common.models import RequestProfile
+
+    stale = list(
+        RequestProfile.objects.order_by("-created_at").values_list("pk", flat=True)[
+            settings.PROFILE_MAX_ROWS:
+        ]
+    )
+    if stale:
+        RequestProfile.objects.filter(pk__in=stale).delete()
+
+
+class RequestProfilingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = request.headers.get(TOKEN_HEADER) or request.GET.get(TOKEN_PARAM)
+        if not token:
+            return self.get_response(request)
+
+        payload = read_token(token)
+        skipped = self._check(payload)
+        if skipped is not None:
+            response = self.get_response(request)
+            response["X-Profile-Skipped"] = skipped
+            return response
+
+        try:
+            return self._profile(request, payload)
+        finally:
+            _busy.release()
+
+    def _check(self, payload):
+        """Why this request can't be profiled, or None (holding the lock)."""
+        from user.models import CustomUser
+
+        if payload is None:
+            return "invalid-token"
+        is_admin = CustomUser.objects.filter(
+            Q(is_superuser=True) | Q(is_admin=True), pk=payload["user"], is_active=True
+        ).exists()
+        if not is_admin:
+            return "not-admin"
+        if not _within_rate_limit(payload["user"]):
+            return "rate-limited"
+        if not _busy.acquire(blocking=False):
+            return "busy"
+        return None
+
+    def _profile(self, request, payload):
+        from common.models import RequestProfile
+
+        max_bytes = settings.PROFILE_MAX_BYTES
+        started = time.perf_counter()
+        if payload["mode"] == MODE_SAMPLING:
+            profiler = SamplingProfiler(threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL)
+            profiler.start()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.stop()
+            data, data_format = profiler.result(max_bytes)
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+            data, data_format = _pstats_result(profiler, max_bytes)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        query = request.GET.copy()
+        query.pop(TOKEN_PARAM, None)
+        path = f"{request.path}?{query.urlencode()}" if query else request.path
+        match = getattr(request, "resolver_match", None)
+        profile = RequestProfile.objects.create(
+            user_id=payload["user"],
+            method=request.method,
+            path=path[:2048],
+            route=match.view_name if match is not None else "",
+            mode=payload["mode"],
+            format=data_format,
+            status_code=response.status_code,
+            duration_ms=duration_ms,
+            size=len(data),
+            data=data,
+        )
+        _trim()
+        response["X-Profile-Id"] = str(profile.pk)
+        return response
@@ -1,6 +1,9 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from common.models import RequestProfile
+from common.profiling import MODE_CPROFILE, MODES
+
 
 class UploadMediaSerializer(serializers.Serializer):
     
@@ -11,4 +14,16 @@ class UploadMediaSerializer(serializers.Serializer):
 
 
 class DeleteMediaSerializer(serializers.Serializer):
-    public_id = serializers.CharField()
\ No newline at end of file
+    public_id = serializers.CharField()
+
+class ProfileTokenSerializer(serializers.Serializer):
+    mode = serializers.ChoiceField(choices=MODES, default=MODE_CPROFILE)
+
+
+class RequestProfileSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RequestProfile
+        fields = [
+            'id', 'user', 'method', 'path', 'route', 'mode', 'format',
+            'status_code', 'duration_ms', 'size', 'created_at',
+        ]
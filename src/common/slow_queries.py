@@ -0,0 +1,203 @@
+"""
+Opt-in capture of slow SQL from real traffic.
+
+With SLOW_QUERY_THRESHOLD_MS set, every database connection gets an execute
+wrapper that times each statement. Statements at or above the threshold are
+stored as SlowQuery rows, one per normalized shape (literals and parameters
+replaced by ``?``, ``IN`` lists collapsed), with:
+
+- the route or Celery task that ran it,
+- a summary of the project frames on the stack,
+- for a new SELECT shape, its EXPLAIN plan (EXPLAIN ANALYZE with
+  SLOW_QUERY_EXPLAIN_ANALYZE, which runs the query a second time).
+
+Repeats of a known shape only update its counters. The table is capped at
+SLOW_QUERY_MAX_ROWS shapes, dropping the least recently seen. Rows are
+written once the caller's transaction commits (straight away in autocommit),
+so the upsert never holds a lock on a shape's row for the rest of a business
+transaction; captures from transactions that roll back are dropped.
+"""
+import hashlib
+import logging
+import os
+import re
+import time
+import traceback
+from contextvars import ContextVar
+
+from celery.signals import task_postrun, task_prerun
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from core.resources import metrics
+
+logger = logging.getLogger(__name__)
+
+STACK_DEPTH = 8
+PROJECT_DIR = str(settings.BASE_DIR)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.\"])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_DATA_MODIFYING = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+_capturing = ContextVar("slow_query_capturing", default=False)
+_task = ContextVar("slow_query_task", default=None)
+
+
+def normalize(sql: str) -> str:
+    sql = _STRING.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = _IN_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def fingerprint(normalized_sql: str) -> str:
+    return hashlib.sha1(normalized_sql.encode(), usedforsecurity=False).hexdigest()
+
+
+def _source() -> str:
+    task = _task.get()
+    if task:
+        return task
+    stats = metrics.current()
+    return (stats.route if stats is not None else None) or ""
+
+
+def _stack_summary() -> str:
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(PROJECT_DIR)
+        and "site-packages" not in frame.filename
+        and frame.filename != __file__
+    ]
+    return "\n".join(
+        f"{os.path.relpath(frame.filename, PROJECT_DIR)}:{frame.lineno} in {frame.name}"
+        for frame in frames[-STACK_DEPTH:]
+    )
+
+
+def _is_select(sql: str) -> bool:
+    """True for reads that are safe to EXPLAIN (ANALYZE runs them again)."""
+    statement = sql.lstrip().upper()
+    if statement.startswith("SELECT"):
+        return True
+    # A CTE may wrap a data-modifying statement; only plain reads qualify.
+    return statement.startswith("WITH") and not _DATA_MODIFYING.search(_STRING.sub("?", sql))
+
+
+def _explain(connection, sql, params):
+    analyze = settings.SLOW_QUERY_EXPLAIN_ANALYZE
+    try:
+        prefix = connection.ops.explain_query_prefix(analyze=analyze) if analyze else None
+    except ValueError:
+        # The backend can't ANALYZE (e.g. SQLite).
+        analyze, prefix = False, None
+    if prefix is None:
+        prefix = connection.ops.explain_query_prefix()
+    with connection.cursor() as cursor:
+        cursor.execute(f"{prefix} {sql}", params)
+        rows = cursor.fetchall()
+    return "\n".join(" ".join(str(column) for column in row) for row in rows), analyze
+
+
+def _trim(queryset):
+    stale = list(
+        queryset.order_by("-last_seen").values_list("pk", flat=True)[
+            settings.SLOW_QUERY_MAX_ROWS:
+        ]
+    )
+    if stale:
+        queryset.filter(pk__in=stale).delete()
+
+
+def _record(connection, sql, params, many, duration_ms, source, stack, now):
+    from common.models import SlowQuery
+
+    normalized = normalize(sql)
+    key = fingerprint(normalized)
+    queryset = SlowQuery.objects.using(connection.alias)
+
+    with transaction.atomic(using=connection.alias):
+        updated = queryset.filter(fingerprint=key).update(
+            occurrences=F("occurrences") + 1,
+            last_duration_ms=duration_ms,
+            max_duration_ms=Greatest(F("max_duration_ms"), Value(duration_ms)),
+            total_duration_ms=F("total_duration_ms") + duration_ms,
+            last_seen=now,
+            source=source,
+        )
+        if updated:
+            return
+
+        plan, analyzed = "", False
+        if not many and _is_select(sql):
+            plan, analyzed = _explain(connection, sql, params)
+        queryset.create(
+            fingerprint=key,
+            normalized_sql=normalized,
+            source=source,
+            stack=stack,
+            plan=plan,
+            plan_analyzed=analyzed,
+            last_duration_ms=duration_ms,
+            max_duration_ms=duration_ms,
+            total_duration_ms=duration_ms,
+            last_seen=now,
+        )
+        _trim(queryset)
+
+
+def capture_slow_queries(execute, sql, params, many, context):
+    """Database execute wrapper recording statements above the threshold."""
+    if _capturing.get():
+        # Our own EXPLAIN and bookkeeping statements.
+        return execute(sql, params, many, context)
+
+    started = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration_ms = (time.perf_counter() - started) * 1000
+
+    if duration_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+        connection = context["connection"]
+        # The route, task and stack are only known now; the write waits.
+        args = (connection, sql, params, many, duration_ms)
+        args += (_source(), _stack_summary(), timezone.now())
+        transaction.on_commit(lambda: _record_safely(*args), using=connection.alias)
+    return result
+
+
+def _record_safely(*args):
+    token = _capturing.set(True)
+    try:
+        _record(*args)
+    except Exception as exc:
+        # e.g. during migrations, before the table exists.
+        logger.warning("Could not record slow query: %s", exc)
+    finally:
+        _capturing.reset(token)
+
+
+def install(sender=None, connection=None, **kwargs):
+    """connection_created receiver adding the wrapper once per connection."""
+    if connection is not None and capture_slow_queries not in connection.execute_wrappers:
+        # First, so wrappers pushed and popped by execute_wrapper() blocks
+        # (e.g. request metrics) stay on top.
+        connection.execute_wrappers.insert(0, capture_slow_queries)
+
+
+@task_prerun.connect(weak=False, dispatch_uid="slow-queries.task-started")
+def _task_started(sender=None, **kwargs):
+    _task.set(getattr(sender, "name", None))
+
+
+@task_postrun.connect(weak=False, dispatch_uid="slow-queries.task-finished")
+def _task_finished(sender=None, **kwargs):
+    _task.set(None)
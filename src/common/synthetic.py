@@ -0,0 +1,461 @@
+"""
+Synthetic data at production volumes, for load tests and benchmarks.
+
+generate() writes departments, users, correspondence threads with their
+replies and forwards, tasks (with the matching performance records) and
+audit logs, all with ``bulk_create`` in chunks, so memory stays flat and
+millions of rows take minutes. Audit rollups are rebuilt for the generated
+window at the end, since bulk_create bypasses the signals that maintain them.
+
+Rows are deterministic: on a fresh database, the same seed, volumes and
+anchor date produce the same data. Each table draws from its own random
+stream, so changing one volume doesn't reshuffle the others. Rows from different seeds can live in
+one database; emails, employee ids and reference numbers are namespaced by
+the seed.
+
+Timestamps are spread over the ``days`` before the anchor date and increase
+with the primary key, as in real traffic. Reference numbers follow
+Correspondence.save (a daily serial per ``serial_date``), so correspondence
+created after a run continues each day's sequence.
+"""
+import random
+import uuid
+from array import array
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from utils.caching import bump_model_version
+
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_PASSWORD = "password"
+EMAIL_DOMAIN = "synthetic.local"
+
+LOREM = (
+    "Kindly find attached the documents for your review and necessary action. "
+    "Please treat as urgent and revert with your comments. "
+    "This is further to our earlier correspondence on the matter. "
+    "The committee has approved the recommendations as presented. "
+)
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/126.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) AppleWebKit/605.1.15 Version/17.5 Safari/605.1.15",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_5 like Mac OS X) AppleWebKit/605.1.15 Mobile/15E148",
+    "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 Chrome/126.0 Mobile Safari/537.36",
+]
+COUNTRIES = ["Nigeria"] * 8 + ["Ghana", "United Kingdom"]
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+@contextmanager
+def _explicit_timestamps(*models):
+    """Let bulk_create keep the created_at/updated_at values we set."""
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Generator:
+    def __init__(
+        self,
+        seed=0,
+        days=365,
+        anchor=None,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        password=DEFAULT_PASSWORD,
+        progress=None,
+    ):
+        self.seed = seed
+        self.tag = f"s{seed}"
+        self.chunk_size = chunk_size
+        self.password = password
+        self.progress = progress or (lambda label, done, total: None)
+        anchor = anchor or timezone.localdate()
+        self.end = timezone.make_aware(datetime.combine(anchor, time.max))
+        self.start = self.end - timedelta(days=days)
+        self.span = (self.end - self.start).total_seconds()
+        # serial_date -> last daily_serial handed out.
+        self.serials = {}
+
+    def rng(self, name):
+        return random.Random(f"{self.seed}:{name}")
+
+    def timestamp(self, rng, index, total):
+        """Spread ``total`` rows over the window in index order, with jitter."""
+        offset = (index + rng.random()) / max(total, 1) * self.span
+        return self.start + timedelta(seconds=offset)
+
+    def bulk_create(self, model, label, objs, total, collect=None):
+        done = 0
+        for chunk in _chunks(objs, self.chunk_size):
+            with transaction.atomic():
+                created = model.objects.bulk_create(chunk)
+            if collect is not None:
+                collect(created)
+            done += len(chunk)
+            self.progress(label, done, total)
+
+    def reference(self, created_at):
+        day = timezone.localdate(created_at)
+        serial = self.serials.get(day)
+        if serial is None:
+            # Continue after anything already allocated that day.
+            from correspondence.models import Correspondence
+
+            serial = (
+                Correspondence.objects.filter(serial_date=day)
+                .aggregate(Max("daily_serial"))["daily_serial__max"]
+                or 0
+            )
+        self.serials[day] = serial = serial + 1
+        return f"SYN{self.seed}-{day:%d/%m/%Y}/{serial}", serial, day
+
+    # Users
+
+    def departments(self, count):
+        from user.models.models import Department
+
+        return Department.objects.bulk_create(
+            Department(name=f"Department {index} ({self.tag})") for index in range(count)
+        )
+
+    def roles(self):
+        from user.models.admin import Role
+
+        roles = list(Role.objects.all())
+        if not roles:
+            # Run seed_roles_permissions first for the real role catalogue.
+            roles = Role.objects.bulk_create(
+                Role(name=f"Synthetic role {index}", code=f"SYNTHETIC_{index}")
+                for index in range(5)
+            )
+        return roles
+
+    def users(self, count, departments):
+        from user.models.models import CustomUser
+
+        rng = self.rng("users")
+        roles = self.roles()
+        locations = [choice for choice, _ in CustomUser.LOCATION_CHOICES]
+        # Hashed once (hashing per user would dominate), with a fixed salt.
+        password = make_password(self.password, salt=f"synthetic{self.tag}")
+
+        def rows():
+            for index in range(count):
+                created_at = self.timestamp(rng, index, count)
+                yield CustomUser(
+                    name=f"Staff Member {index}",
+                    email=f"user{index}.{self.tag}@{EMAIL_DOMAIN}",
+                    password=password,
+                    employee_id=f"SYN{self.seed}-{index:06d}",
+                    role=rng.choice(roles),
+                    department=rng.choice(departments) if rng.random() < 0.95 else None,
+                    location=rng.choice(locations),
+                    profile_photo=(
+                        f"https://cdn.{EMAIL_DOMAIN}/{self.tag}/{index}.jpg"
+                        if rng.random() < 0.3
+                        else None
+                    ),
+                    is_active=rng.random() < 0.97,
+                    is_verified=True,
+                    date_joined=created_at,
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+
+        users = []
+        self.bulk_create(
+            CustomUser,
+            "users",
+            rows(),
+            count,
+            collect=lambda created: users.extend(
+                (user.pk, user.name, user.email, user.role.name) for user in created
+            ),
+        )
+        return users
+
+    # Correspondence
+
+    def correspondence(self, count, users, replies):
+        from correspondence.models import Correspondence
+
+        user_ids = [user[0] for user in users]
+        thread_count = max(count - int(count * replies), min(count, 1))
+        statuses = [
+            choice
+            for choice, _ in Correspondence.STATUS_CHOICES
+            if choice not in ("replied", "forwarded")
+        ]
+        priorities = [choice for choice, _ in Correspondence.PRIORITY_CHOICES]
+        categories = [choice for choice, _ in Correspondence.CATEGORY_CHOICES]
+        # Parallel arrays for the threads, to thread replies without
+        # keeping the instances around.
+        thread_ids, thread_times = array("q"), array("d")
+        thread_senders, thread_receivers = array("q"), array("q")
+
+        rng = self.rng("correspondence")
+
+        def threads():
+            for index in range(thread_count):
+                created_at = self.timestamp(rng, index, thread_count)
+                reference, serial, day = self.reference(created_at)
+                requires_action = rng.random() < 0.3
+                yield Correspondence(
+                    reference_number=reference,
+                    daily_serial=serial,
+                    serial_date=day,
+                    subject=f"Correspondence {index} ({self.tag})",
+                    note=LOREM[: rng.randint(0, len(LOREM))],
+                    status="pending_action" if requires_action else rng.choice(statuses),
+                    priority=rng.choice(priorities),
+                    category=rng.choice(categories + [None]),
+                    type="external" if rng.random() < 0.2 else "internal",
+                    requires_action=requires_action,
+                    is_confidential=rng.random() < 0.1,
+                    due_date=(
+                        timezone.localdate(created_at) + timedelta(days=rng.randint(1, 30))
+                        if requires_action
+                        else None
+                    ),
+                    sender_id=rng.choice(user_ids),
+                    receiver_id=rng.choice(user_ids) if rng.random() < 0.95 else None,
+                    through_id=rng.choice(user_ids) if rng.random() < 0.3 else None,
+                    image_urls=(
+                        [f"https://cdn.{EMAIL_DOMAIN}/{self.tag}/scan-{index}.png"]
+                        if rng.random() < 0.2
+                        else None
+                    ),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+
+        def collect(created):
+            for item in created:
+                thread_ids.append(item.pk)
+                thread_times.append(item.created_at.timestamp())
+                thread_senders.append(item.sender_id)
+                thread_receivers.append(item.receiver_id or 0)
+
+        self.bulk_create(
+            Correspondence, "correspondence threads", threads(), thread_count, collect
+        )
+
+        reply_count = count - thread_count
+        rng = self.rng("replies")
+        end = self.end.timestamp()
+
+        def reply_rows():
+            for index in range(reply_count):
+                thread = rng.randrange(thread_count)
+                created_at = datetime.fromtimestamp(
+                    min(thread_times[thread] + rng.uniform(600, 14 * 86400), end),
+                    tz=self.end.tzinfo,
+                )
+                reference, serial, day = self.reference(created_at)
+                forwarded = rng.random() < 0.3
+                # Replies usually go back from the receiver to the sender.
+                sender = thread_receivers[thread] or rng.choice(user_ids)
+                receiver = rng.choice(user_ids) if forwarded else thread_senders[thread]
+                yield Correspondence(
+                    parent_id=thread_ids[thread],
+                    reference_number=reference,
+                    daily_serial=serial,
+                    serial_date=day,
+                    subject=f"{'Fwd' if forwarded else 'Re'}: Correspondence {thread} ({self.tag})",
+                    note=LOREM[: rng.randint(20, len(LOREM))],
+                    status="forwarded" if forwarded else "replied",
+                    sender_id=sender,
+                    receiver_id=receiver or None,
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+
+        self.bulk_create(Correspondence, "correspondence replies", reply_rows(), reply_count)
+        return thread_ids
+
+    # Tasks
+
+    def tasks(self, count, users):
+        from tasks.models import Task
+        from user.models.models import PerformanceRecord
+
+        rng = self.rng("tasks")
+        user_ids = [user[0] for user in users]
+        priorities = [choice for choice, _ in Task.PRIORITY_CHOICES]
+        statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+        assigned, completed = {}, {}
+
+        def rows():
+            for index in range(count):
+                created_at = self.timestamp(rng, index, count)
+                assigned_to, assigned_by = rng.sample(user_ids, 2)
+                status = rng.choice(statuses)
+                started_at = (
+                    created_at + timedelta(hours=rng.uniform(1, 72))
+                    if status in ("in_progress", "completed")
+                    else None
+                )
+                assigned[assigned_to] = assigned.get(assigned_to, 0) + 1
+                if status == "completed":
+                    completed[assigned_to] = completed.get(assigned_to, 0) + 1
+                yield Task(
+                    title=f"Task {index} ({self.tag})",
+                    description=LOREM[: rng.randint(0, len(LOREM))],
+                    assigned_to_id=assigned_to,
+                    assigned_by_id=assigned_by,
+                    priority=rng.choice(priorities),
+                    status=status,
+                    started_at=started_at,
+                    completed_at=(
+                        started_at + timedelta(hours=rng.uniform(1, 240))
+                        if status == "completed"
+                        else None
+                    ),
+                    deadline=timezone.localdate(created_at) + timedelta(days=rng.randint(1, 30)),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+
+        self.bulk_create(Task, "tasks", rows(), count)
+
+        records = (
+            PerformanceRecord(
+                user_id=user_id,
+                tasks_assigned=assigned.get(user_id, 0),
+                tasks_completed=completed.get(user_id, 0),
+                created_at=self.end,
+                updated_at=self.end,
+            )
+            for user_id in user_ids
+        )
+        self.bulk_create(PerformanceRecord, "performance records", records, len(user_ids))
+
+    # Audit
+
+    def audit_logs(self, count, users, thread_ids):
+        from audit.enums import AuditModuleEnum, AuditStatusEnum, AuditTypeEnum
+        from audit.models import AuditLog
+
+        rng = self.rng("audit_logs")
+        modules = AuditModuleEnum.values()
+        audit_types = AuditTypeEnum.values()
+        correspondence_module = AuditModuleEnum.CORRESPONDENCE.raw_value
+        success, failure = AuditStatusEnum.SUCCESS.raw_value, AuditStatusEnum.FAILURE.raw_value
+
+        def rows():
+            for index in range(count):
+                user_id, name, email, role = rng.choice(users)
+                module = rng.choice(modules)
+                ip_address = ".".join(
+                    str(part)
+                    for part in (rng.randint(1, 223), rng.randrange(256), rng.randrange(256), rng.randint(1, 254))
+                )
+                yield AuditLog(
+                    id=uuid.UUID(int=rng.getrandbits(128), version=4),
+                    audit_module=module,
+                    audit_type=rng.choice(audit_types),
+                    status=success if rng.random() < 0.95 else failure,
+                    user_id=str(user_id),
+                    user_name=name.upper(),
+                    user_role=role,
+                    user_email=email,
+                    action=f"{name.upper()} performed action {index}",
+                    ip_address=ip_address,
+                    country=rng.choice(COUNTRIES),
+                    correspondence_id=(
+                        thread_ids[rng.randrange(len(thread_ids))]
+                        if module == correspondence_module and thread_ids
+                        else None
+                    ),
+                    request_meta={
+                        "ip_address": ip_address,
+                        "user_agent": rng.choice(USER_AGENTS),
+                        "path": f"/v1/{module}/",
+                    },
+                    request_id=uuid.UUID(int=rng.getrandbits(128), version=4).hex,
+                    created_at=self.timestamp(rng, index, count),
+                )
+
+        self.bulk_create(AuditLog, "audit logs", rows(), count)
+
+    def rebuild_rollups(self):
+        from audit.rollups import rebuild_rollups
+
+        self.progress("audit rollups", 0, 1)
+        rebuild_rollups(start=self.start, end=self.end + timedelta(microseconds=1))
+        self.progress("audit rollups", 1, 1)
+
+
+def generate(
+    users=200,
+    correspondence=2000,
+    tasks=2000,
+    audit_logs=2000,
+    departments=20,
+    replies=0.4,
+    seed=0,
+    days=365,
+    anchor=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    password=DEFAULT_PASSWORD,
+    progress=None,
+):
+    """
+    Generate the given volumes of data; returns the row count per table.
+    ``replies`` is the share of correspondence that replies to or forwards
+    an earlier thread.
+    """
+    from audit.models import AuditLog
+    from correspondence.models import Correspondence
+    from tasks.models import Task
+    from user.models.models import CustomUser, Department, PerformanceRecord
+
+    if users < 2:
+        raise ValueError("At least two users are needed to assign tasks.")
+    generator = Generator(seed, days, anchor, chunk_size, password, progress)
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            # These rows can be regenerated, so trade durability for speed.
+            cursor.execute("SET synchronous_commit TO OFF")
+
+    models = (CustomUser, Correspondence, Task, PerformanceRecord, AuditLog)
+    with _explicit_timestamps(*models):
+        staff = generator.users(users, generator.departments(departments))
+        thread_ids = generator.correspondence(correspondence, staff, replies)
+        generator.tasks(tasks, staff)
+        generator.audit_logs(audit_logs, staff, thread_ids)
+    if audit_logs:
+        generator.rebuild_rollups()
+    # bulk_create doesn't send the signals that invalidate cached responses.
+    for model in (Department, *models):
+        bump_model_version(model)
+    return {
+        "departments": departments,
+        "users": users,
+        "correspondence": correspondence,
+        "tasks": tasks,
+        "performance records": users,
+        "audit logs": audit_logs,
+    }
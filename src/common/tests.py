@@ -1,3 +1,77 @@
-from django.test import TestCase
+import time
 
-# Create your tests here.
+from django.db import DatabaseError, connection, transaction
+from django.test import TestCase, override_settings
+
+from common.models import RequestProfile, SlowQuery
+from common.slow_queries import _is_select, capture_slow_queries
+from utils.testing import APIQueryBudgetTestCase
+
+ADMINS_ONLY = {"super_admin": 200, "managing_director": 403, "staff": 403}
+
+
+class RequestProfileQueryTests(APIQueryBudgetTestCase):
+    def setUp(self):
+        self.profile = RequestProfile.objects.create(
+            user=self.users["super_admin"],
+            method="GET",
+            path="/v1/tasks/",
+            route="tasks-list",
+            mode="cprofile",
+            format="pstats",
+            status_code=200,
+            duration_ms=12.5,
+            size=4,
+            data=b"\x00\x01\x02\x03",
+        )
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(2, "get", "/v1/common/profiles", ADMINS_ONLY)
+
+    def test_token(self):
+        self.assertQueryBudgetByRole(
+            0,
+            "post",
+            "/v1/common/profiles/token",
+            {"super_admin": 200, "staff": 403},
+            {"mode": "sampling"},
+        )
+
+    def test_download(self):
+        self.assertQueryBudgetByRole(
+            1, "get", f"/v1/common/profiles/{self.profile.pk}/download", ADMINS_ONLY
+        )
+
+
+class SlowQueryCaptureTests(TestCase):
+    def capture(self, sql):
+        def slow(sql, params, many, context):
+            time.sleep(0.002)
+
+        with override_settings(SLOW_QUERY_THRESHOLD_MS=1):
+            capture_slow_queries(slow, sql, (), False, {"connection": connection})
+
+    def test_recorded_once_the_transaction_commits(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.capture("SELECT 1")
+            # Not written inside the caller's transaction.
+            self.assertFalse(SlowQuery.objects.exists())
+        self.assertEqual(SlowQuery.objects.get().occurrences, 1)
+
+    def test_dropped_when_the_transaction_rolls_back(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    self.capture("SELECT 1")
+                    raise DatabaseError
+            except DatabaseError:
+                pass
+        self.assertEqual(callbacks, [])
+        self.assertFalse(SlowQuery.objects.exists())
+
+    def test_only_plain_reads_are_explained(self):
+        self.assertTrue(_is_select("SELECT * FROM t"))
+        self.assertTrue(_is_select("WITH a AS (SELECT 'update') SELECT * FROM a"))
+        self.assertFalse(_is_select("WITH a AS (DELETE FROM t RETURNING *) SELECT * FROM a"))
+        self.assertFalse(_is_select("with a as (update t set x = 1 returning *) select 1"))
+        self.assertFalse(_is_select("UPDATE t SET x = 1"))
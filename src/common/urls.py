@@ -1,3 +1,8 @@
+from common.views.profiling import (
+    RequestProfileDownloadView,
+    RequestProfileListView,
+    RequestProfileTokenView,
+)
 from common.views.upload import DeleteMediaView, UploadMediaView
 from django.urls import path, include
 
@@ -6,4 +11,11 @@ app_name = "common"
 urlpatterns = [
     path("upload", UploadMediaView.as_view(), name="upload-media"),
     path("uploads/delete", DeleteMediaView.as_view(), name="delete-media"),
-]
\ No newline at end of file
+    path("profiles", RequestProfileListView.as_view(), name="request-profiles"),
+    path("profiles/token", RequestProfileTokenView.as_view(), name="request-profile-token"),
+    path(
+        "profiles/<int:pk>/download",
+        RequestProfileDownloadView.as_view(),
+        name="request-profile-download",
+    ),
+]
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, status
+
+from common.models import RequestProfile
+from common.profiling import TOKEN_HEADER, TOKEN_PARAM, make_token
+from common.serializers import ProfileTokenSerializer, RequestProfileSerializer
+from console.permissions import IsSuperAdmin
+from utils.pagination import CustomPagination
+from utils.response import Response
+
+
+class RequestProfileTokenView(generics.GenericAPIView):
+    """Issue a short-lived token that profiles the requests it is sent with."""
+
+    serializer_class = ProfileTokenSerializer
+    permission_classes = [IsSuperAdmin]
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(
+                success=False,
+                errors=serializer.errors,
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        mode = serializer.validated_data["mode"]
+        return Response(
+            success=True,
+            message="Profiling token issued",
+            data={
+                "token": make_token(request.user, mode),
+                "mode": mode,
+                "header": TOKEN_HEADER,
+                "query_param": TOKEN_PARAM,
+                "expires_in": settings.PROFILE_TOKEN_MAX_AGE,
+            },
+            status_code=status.HTTP_200_OK,
+        )
+
+
+class RequestProfileListView(generics.GenericAPIView):
+    serializer_class = RequestProfileSerializer
+    permission_classes = [IsSuperAdmin]
+    pagination_class = CustomPagination
+
+    def get_queryset(self):
+        return RequestProfile.objects.defer("data")
+
+    def get(self, request):
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
+class RequestProfileDownloadView(generics.GenericAPIView):
+    permission_classes = [IsSuperAdmin]
+    swagger_schema = None
+
+    def get(self, request, pk):
+        profile = get_object_or_404(RequestProfile, pk=pk)
+        response = HttpResponse(bytes(profile.data), content_type="application/octet-stream")
+        response["Content-Disposition"] = f'attachment; filename="{profile.filename}"'
+        return response
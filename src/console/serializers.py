@@ -5,8 +5,9 @@ from datetime import timedelta
 from audit.serializers import AuditLogSerializer
 from user.models.models import Department
 from correspondence.models import Correspondence
+from utils.serialization import SparseFieldsMixin
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Department
         fields = ['id', 'name', 'description', 'is_active']
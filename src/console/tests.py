@@ -1,3 +1,166 @@
-from django.test import TestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from user.models.admin import Permission, Role
+from user.models.models import CustomUser, Department
+from utils.testing import APIQueryBudgetTestCase
+
+EVERYONE = {
+    "super_admin": 200,
+    "managing_director": 200,
+    "hr": 200,
+    "staff": 200,
+    "no_role": 200,
+}
+STAFF_VIEWERS = {
+    "super_admin": 200,
+    "managing_director": 200,
+    "general_manager": 200,
+    "hr": 200,
+    "staff": 403,
+    "no_role": 403,
+}
+
+
+class DepartmentQueryTests(APIQueryBudgetTestCase):
+    def setUp(self):
+        self.department = Department.objects.order_by("pk").first()
+        self.url = f"/v1/console/departments/{self.department.pk}/"
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(1, "get", "/v1/console/departments/", EVERYONE)
+
+    def test_retrieve(self):
+        self.assertQueryBudgetByRole(1, "get", self.url, EVERYONE)
+
+    def test_create(self):
+        self.assertQueryBudgetByRole(
+            2,
+            "post",
+            "/v1/console/departments/",
+            {"hr": 201, "staff": 403},
+            {"name": "Procurement", "description": "Purchasing and vendors"},
+        )
+
+    def test_update(self):
+        self.assertQueryBudgetByRole(
+            3,
+            "patch",
+            self.url,
+            {"managing_director": 200, "staff": 403},
+            {"description": "Updated"},
+        )
+
+
+class StaffQueryTests(APIQueryBudgetTestCase):
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        user = self.users["hr"]
+        for url in ("/v1/console/staff/", "/v1/console/staff/?is_active=true&ordering=-created_at"):
+            with self.subTest(url=url):
+                self.assertConstantQueries(url, user)
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(5, "get", "/v1/console/staff/", STAFF_VIEWERS)
+
+    def test_list_is_coalesced_until_the_data_changes(self):
+        url = "/v1/console/staff/?ordering=name"
+        first, cold = self.request("get", url, self.users["hr"])
+        with CaptureQueriesContext(connection) as warm:
+            second = self.client.get(url)
+        self.assertEqual(second.json(), first.json())
+        self.assertLess(len(warm.captured_queries), len(cold))
+
+        staff = CustomUser.objects.get(pk=first.json()["data"][0]["id"])
+        staff.name = "AAA Renamed"
+        staff.save()
+        third = self.client.get(url)
+        self.assertEqual(third.json()["data"][0]["name"], "AAA Renamed")
+
+    def test_retrieve(self):
+        staff = CustomUser.objects.exclude(department=None).order_by("pk").first()
+        self.assertQueryBudgetByRole(8, "get", f"/v1/console/staff/{staff.pk}/", STAFF_VIEWERS)
+
+    def test_user_dropdown(self):
+        self.assertQueryBudgetByRole(1, "get", "/v1/console/user-dropdown/", EVERYONE)
+
+    def test_md_verify(self):
+        pending = CustomUser.objects.create_user(
+            email="pending@tests.local", password="password", name="Pending", is_active=False
+        )
+        self.assertQueryBudgetByRole(
+            3,
+            "patch",
+            f"/v1/console/MDVerify/{pending.pk}/",
+            {"general_manager": 403, "managing_director": 200},
+            {"is_active": True},
+        )
+
+
+class RoleQueryTests(APIQueryBudgetTestCase):
+    def setUp(self):
+        self.role = Role.objects.get(code="GENERAL_MANAGER")
+        self.url = f"/v1/console/roles/{self.role.pk}/"
+        self.permission_ids = list(
+            Permission.objects.exclude(roles=self.role).order_by("pk").values_list("pk", flat=True)[:5]
+        )
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        self.assertConstantQueries("/v1/console/roles/", self.users["super_admin"], sizes=(2, 20))
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(3, "get", "/v1/console/roles/", EVERYONE)
+
+    def test_retrieve(self):
+        self.assertQueryBudgetByRole(2, "get", self.url, EVERYONE)
+
+    def test_create(self):
+        data = {
+            "name": "Auditor",
+            "code": "AUDITOR",
+            "description": "Read-only access",
+            "permissions": self.permission_ids,
+        }
+        self.assertQueryBudgetByRole(
+            13, "post", "/v1/console/roles/", {"staff": 403, "hr": 201}, data
+        )
+
+    def test_update(self):
+        self.assertQueryBudgetByRole(
+            4,
+            "patch",
+            self.url,
+            {"hr": 403, "managing_director": 200},
+            {"description": "Department-level management and reporting"},
+        )
+
+    def test_add_and_remove_permissions(self):
+        data = {"permission_ids": self.permission_ids}
+        self.assertQueryBudget(
+            6, "post", f"{self.url}add-permissions/", self.users["hr"], data, 200
+        )
+        self.assertQueryBudget(
+            5, "post", f"{self.url}remove-permissions/", self.users["hr"], data, 200
+        )
+
+    def test_destroy_role_in_use(self):
+        self.assertQueryBudget(
+            3, "delete", self.url, self.users["managing_director"], status=400
+        )
+
+    def test_destroy_unused_role(self):
+        role = Role.objects.create(name="Temporary", code="TEMPORARY")
+        self.assertQueryBudget(
+            8, "delete", f"/v1/console/roles/{role.pk}/", self.users["managing_director"], status=204
+        )
+        self.assertFalse(Role.objects.filter(pk=role.pk).exists())
+
+
+class PermissionQueryTests(APIQueryBudgetTestCase):
+    def test_list(self):
+        self.assertQueryBudgetByRole(2, "get", "/v1/console/permissions/", EVERYONE)
+
+    def test_retrieve(self):
+        permission = Permission.objects.order_by("pk").first()
+        self.assertQueryBudgetByRole(
+            1, "get", f"/v1/console/permissions/{permission.pk}/", EVERYONE
+        )
@@ -10,6 +10,7 @@ from console.permissions import IsSuperAdmin
 from user.filters import PermissionFilter, RoleFilter
 from user.models.admin import Permission, Role
 from user.serializers.permissions import PermissionSerializer, RoleSerializer
+from utils.caching import cache_list_response
 from utils.pagination import CustomPagination
 from utils.response import Response
 from console.permissions import permissions_required
@@ -32,7 +33,7 @@ class PermissionViewSet(viewsets.ModelViewSet):
             200: PermissionSerializer,
         },
     )
-    
+    @cache_list_response(Permission)
     def list(self, request):
         queryset = self.filter_queryset(self.get_queryset())
         qs = self.paginate_queryset(queryset)
@@ -125,7 +126,7 @@ class PermissionViewSet(viewsets.ModelViewSet):
 
 
 class RoleViewSet(viewsets.ModelViewSet):
-    queryset = Role.objects.all().order_by("name", "-created_at")
+    queryset = Role.objects.select_related("parent").order_by("name", "-created_at")
     serializer_class = RoleSerializer
     permission_classes = [AllowAny]
     pagination_class = CustomPagination
@@ -139,7 +140,7 @@ class RoleViewSet(viewsets.ModelViewSet):
             200: RoleSerializer,
         },
     )
-    
+    @cache_list_response(Role, Permission)
     def list(self, request):
         queryset = self.filter_queryset(self.get_queryset())
         qs = self.paginate_queryset(queryset)
@@ -222,7 +223,7 @@ class RoleViewSet(viewsets.ModelViewSet):
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
         # Check if role is assigned to any users before deleting
-        if instance.users.exists():
+        if instance.customuser_set.exists():
             return Response(
                 success=False,
                 message="Cannot delete role as it is assigned to users",
@@ -9,6 +9,10 @@ from django.utils import timezone
 from django.shortcuts import get_object_or_404
 from datetime import timedelta
 from utils.pagination import CustomPagination
+from utils.caching import cache_list_response, coalesce_response
+from utils.conditional import conditional_list
+from utils.serialization import ValuesListMixin
+from user.models.admin import Role
 from user.models.models import CustomUser, Department, PerformanceRecord
 from user.serializers.staff_profile import (
     StaffListSerializer,
@@ -22,8 +26,12 @@ from console.permissions import permissions_required
 from utils.permissions import PERMISSIONS
 User = get_user_model()
 
+# Staff directory pages are keyed by the list's ETag, so this only bounds how
+# long an unchanged page is kept.
+STAFF_LIST_CACHE_TTL = 60 * 5
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+
+class DepartmentViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """ViewSet for managing departments."""
     queryset = Department.objects.all()
     permission_classes = [AllowAny]  
@@ -33,6 +41,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     ordering = ['name']
     serializer_class = DepartmentSerializer
 
+    @cache_list_response(Department)
     def list(self, request, *args, **kwargs):
         """Override list to return custom response format."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -111,7 +120,8 @@ class DepartmentViewSet(viewsets.ModelViewSet):
         )
 
 
-class StaffsProfileViewSet(mixins.ListModelMixin,
+class StaffsProfileViewSet(ValuesListMixin,
+                           mixins.ListModelMixin,
                            mixins.RetrieveModelMixin,
                            mixins.UpdateModelMixin,
                            viewsets.GenericViewSet):
@@ -135,6 +145,8 @@ class StaffsProfileViewSet(mixins.ListModelMixin,
         return StaffListSerializer
 
     @permissions_required([PERMISSIONS.CAN_VIEW_STAFF_DETAILS])
+    @conditional_list(Department, Role)
+    @coalesce_response(ttl=STAFF_LIST_CACHE_TTL)
     def list(self, request):
         queryset = self.filter_queryset(self.get_queryset())
         department_id = request.query_params.get('department_id')
@@ -0,0 +1,44 @@
+import time
+
+from django.conf import settings
+
+from core.resources import metrics
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetricsMiddleware:
+    """
+    Record SQL, cache, Celery and timing figures for each request (see
+    core.resources.metrics), report them in a ``Server-Timing`` header and
+    feed the per-route Prometheus histograms. Place it first so the total
+    covers the other middleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.server_timing = getattr(settings, "SERVER_TIMING_ENABLED", True)
+
+    def __call__(self, request):
+        with metrics.collect() as stats:
+            response = self.get_response(request)
+        finished_at = time.perf_counter()
+        total = finished_at - stats.started_at
+        view = None
+        if stats.view_started_at is not None:
+            view = finished_at - stats.view_started_at
+
+        if self.server_timing:
+            response["Server-Timing"] = stats.server_timing(total, view)
+
+        match = getattr(request, "resolver_match", None)
+        route = match.view_name if match is not None else UNMATCHED_ROUTE
+        metrics.observe_request(stats, route, request.method, response.status_code, total)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        stats = metrics.current()
+        if stats is not None:
+            stats.route = request.resolver_match.view_name
+            stats.view_started_at = time.perf_counter()
+        return None
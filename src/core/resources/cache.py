@@ -1,52 +1,97 @@
-import json
-import os
+"""
+Application cache facade over Django's ``CACHES``.
 
-import redis
-from django.conf import settings
+The default alias is Django's RedisCache (a shared, pooled client with pickle
+serialization and pipelined get_many/set_many); CACHE_BACKEND=locmem swaps in
+LocMemCache so tests and single-process runs work without a Redis server. Code that needs raw Redis commands (scripts, TTLs) goes through
+``Cache().client``, which is None on the local-memory fallback.
 
-ENVIRONMENT = os.environ.get("ENVIRONMENT", "development")
+Reads through the facade are counted as hits/misses in core.resources.metrics.
+"""
+import time
+
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+
+from core.resources import metrics
+
+_MISSING = object()
 
 
 class Cache:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Cache, cls).__new__(cls)
-            msg = f"REDIS-{ENVIRONMENT.upper()} INSTANTIATED SUCCESSFULLY"
-            print("===================================================")
-            print(msg)
-            print("===================================================")
-            cls._instance._redis = redis.Redis(
-                host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0
-            )
-        return cls._instance
+    def __init__(self, alias="default"):
+        self._cache = caches[alias]
+
+    @property
+    def backend(self):
+        return self._cache
+
+    @property
+    def client(self):
+        """The underlying redis client, or None when not backed by Redis."""
+        if isinstance(self._cache, RedisCache):
+            return self._cache._cache.get_client(write=True)
+        return None
+
+    def make_key(self, key):
+        return self._cache.make_key(key)
 
     def set(self, key, value, ttl=3600):
-        value = json.dumps(value)
-        self._redis.set(key, value, ex=ttl)
+        self._cache.set(key, value, timeout=ttl)
 
-    def get(self, key):
-        data = self._redis.get(key)
-        return json.loads(data) if data else None
+    def get(self, key, default=None):
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            metrics.record_cache(0, 1)
+            return default
+        metrics.record_cache(1, 0)
+        return value
+
+    def add(self, key, value, ttl=3600):
+        return self._cache.add(key, value, timeout=ttl)
+
+    def get_many(self, keys):
+        """Return values in the order of ``keys``, None for misses (one MGET)."""
+        found = self._cache.get_many(keys)
+        metrics.record_cache(len(found), len(keys) - len(found))
+        return [found.get(key) for key in keys]
+
+    def set_many(self, mapping, ttl=3600):
+        self._cache.set_many(mapping, timeout=ttl)
+
+    def incr(self, key, amount=1):
+        """Increment a counter, creating it (without expiry) if missing."""
+        try:
+            return self._cache.incr(key, amount)
+        except ValueError:
+            if self._cache.add(key, amount, timeout=None):
+                return amount
+            return self._cache.incr(key, amount)
 
     def delete(self, key):
-        self._redis.delete(key)
+        self._cache.delete(key)
+
+    def delete_many(self, keys):
+        self._cache.delete_many(keys)
 
     def flush(self):
-        self._redis.flushdb()
+        self._cache.clear()
 
     def expiry_time(self, key):
-        return self._redis.ttl(key)
+        client = self.client
+        if client is not None:
+            return client.ttl(self.make_key(key))
+        expires_at = getattr(self._cache, "_expire_info", {}).get(self.make_key(key))
+        if expires_at is None:
+            return -1
+        return max(0, int(expires_at - time.time()))
 
     def set_expiry(self, key, ttl):
-        self._redis.expire(key, ttl)
+        self._cache.touch(key, ttl)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self._redis.connection_pool.disconnect()
-
-    def __del__(self):
-        self._redis.connection_pool.disconnect()
+        # Connections belong to the shared pool; nothing to tear down.
+        return False
@@ -0,0 +1,136 @@
+"""
+Cross-worker invalidation bus for process-local caches.
+
+Writers publish the namespace whose version they bumped (for example
+``model-version:hr_config.attendancepolicy`` or
+``role:3:permissions:version``) on a Redis pub/sub channel, and every process
+runs a daemon subscriber thread that hands each message to the callbacks
+subscribed to a matching namespace prefix.
+
+Pub/sub is fire-and-forget, so local caches must only rely on the bus while
+``is_healthy()`` is true: when the subscriber loses its connection it reports
+unhealthy until it has resubscribed, then tells every subscriber to drop
+everything (``FLUSH_ALL``), since messages may have been missed in between.
+Callers fall back to TTLs/version checks in the meantime.
+
+Without Redis (the opt-in local-memory cache) the bus is in-process only:
+published messages are dispatched synchronously.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Callable, List, Tuple
+
+from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
+
+from core.resources.cache import Cache
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = getattr(settings, "CACHE_INVALIDATION_CHANNEL", "cache-invalidation")
+FLUSH_ALL = "*"
+RECONNECT_DELAY = 1
+MAX_RECONNECT_DELAY = 30
+
+_subscribers: List[Tuple[str, Callable[[str], None]]] = []
+_lock = threading.Lock()
+_state = {"pid": None, "thread": None, "healthy": False}
+
+
+def subscribe(prefix: str, callback: Callable[[str], None]):
+    """
+    Call ``callback(namespace)`` for every published namespace starting with
+    ``prefix``, and with FLUSH_ALL whenever messages may have been lost.
+    """
+    with _lock:
+        _subscribers.append((prefix, callback))
+
+
+def publish(namespace: str):
+    """Notify every process (this one synchronously) that ``namespace`` changed."""
+    _dispatch(namespace)
+    client = Cache().client
+    if client is None:
+        return
+    try:
+        client.publish(CHANNEL, namespace)
+    except Exception:
+        logger.warning("Could not publish cache invalidation for %s", namespace, exc_info=True)
+
+
+def is_healthy() -> bool:
+    """
+    True while this process is guaranteed to receive invalidations. Starts
+    the subscriber on first use, so nothing runs before workers fork.
+    """
+    cache = Cache()
+    if cache.client is None:
+        # Without Redis there is no bus to other processes. Only the opt-in
+        # local-memory cache (CACHE_BACKEND=locmem) is single-process by
+        # contract, so synchronous dispatch reaches every copy; with any other
+        # backend nothing process-local can be trusted.
+        return isinstance(cache.backend, LocMemCache)
+    _ensure_listener()
+    return _state["healthy"]
+
+
+def _dispatch(namespace: str):
+    with _lock:
+        subscribers = list(_subscribers)
+    for prefix, callback in subscribers:
+        if namespace == FLUSH_ALL or namespace.startswith(prefix):
+            try:
+                callback(namespace)
+            except Exception:
+                logger.exception("Cache invalidation callback failed for %s", namespace)
+
+
+def _ensure_listener():
+    if Cache().client is None:
+        return
+    pid = os.getpid()
+    with _lock:
+        thread = _state["thread"]
+        # A forked worker inherits the parent's state but not its thread.
+        if _state["pid"] == pid and thread is not None and thread.is_alive():
+            return
+        _state.update(pid=pid, healthy=False)
+        thread = threading.Thread(
+            target=_listen, name="cache-invalidation", daemon=True
+        )
+        _state["thread"] = thread
+    thread.start()
+
+
+def _listen():
+    delay = RECONNECT_DELAY
+    while True:
+        pubsub = None
+        try:
+            pubsub = Cache().client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CHANNEL)
+            # Anything published while we weren't listening is lost.
+            _dispatch(FLUSH_ALL)
+            _state["healthy"] = True
+            delay = RECONNECT_DELAY
+            while True:
+                # Poll rather than block in listen() so the pool's socket
+                # timeout doesn't look like a dropped connection.
+                message = pubsub.get_message(timeout=1.0)
+                if message is None or message.get("type") != "message":
+                    continue
+                data = message["data"]
+                _dispatch(data.decode() if isinstance(data, bytes) else data)
+        except Exception:
+            logger.warning("Cache invalidation subscriber disconnected", exc_info=True)
+        finally:
+            _state["healthy"] = False
+            if pubsub is not None:
+                try:
+                    pubsub.close()
+                except Exception:
+                    pass
+        time.sleep(delay)
+        delay = min(delay * 2, MAX_RECONNECT_DELAY)
@@ -0,0 +1,151 @@
+"""
+Request-level performance metrics.
+
+RequestMetricsMiddleware (core.middleware) opens a RequestStats for each
+request. While it is active, the database execute wrapper, the cache facade
+and Celery's publish signal add to it, and at the end of the request it is
+reported twice:
+
+- as a ``Server-Timing`` header on the response, for the request at hand,
+- into the Prometheus collectors below, labelled by route (the URL pattern's
+  view name), which MetricsView (core.views) exposes for scraping.
+
+Under gunicorn each worker has its own registry; set
+``PROMETHEUS_MULTIPROC_DIR`` to a writable, emptied-on-start directory so the
+endpoint aggregates all workers.
+"""
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+from celery.signals import before_task_publish
+from django.db import connections
+from prometheus_client import Counter, Histogram
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling a request, by route.",
+    ["route", "method"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS = Counter(
+    "http_requests_total",
+    "Requests handled, by route and response status.",
+    ["route", "method", "status"],
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL queries run per request, by route.",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+DB_LATENCY = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL per request, by route.",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache reads through core.resources.cache, by result.",
+    ["result"],
+)
+TASKS_PUBLISHED = Counter(
+    "celery_tasks_published_total",
+    "Celery tasks sent to the broker, by task name.",
+    ["task"],
+)
+
+_current: ContextVar[Optional["RequestStats"]] = ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    __slots__ = (
+        "route",
+        "started_at",
+        "view_started_at",
+        "db_queries",
+        "db_time",
+        "cache_hits",
+        "cache_misses",
+        "tasks_published",
+    )
+
+    def __init__(self):
+        self.route = None
+        self.started_at = time.perf_counter()
+        self.view_started_at = None
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.tasks_published = 0
+
+    def server_timing(self, total: float, view: Optional[float]) -> str:
+        metrics = [
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.db_queries} queries"',
+            f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+        ]
+        if self.tasks_published:
+            metrics.append(f'celery;desc="{self.tasks_published} tasks published"')
+        if view is not None:
+            metrics.append(f"view;dur={view * 1000:.1f}")
+        metrics.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+def _time_query(execute, sql, params, many, context):
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats = _current.get()
+        if stats is not None:
+            stats.db_queries += 1
+            stats.db_time += time.perf_counter() - started
+
+
+@contextmanager
+def collect():
+    """Collect a RequestStats for the code run inside the block."""
+    stats = RequestStats()
+    token = _current.set(stats)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_time_query))
+            yield stats
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def record_cache(hits: int, misses: int):
+    if hits:
+        CACHE_REQUESTS.labels("hit").inc(hits)
+    if misses:
+        CACHE_REQUESTS.labels("miss").inc(misses)
+    stats = _current.get()
+    if stats is not None:
+        stats.cache_hits += hits
+        stats.cache_misses += misses
+
+
+@before_task_publish.connect(weak=False, dispatch_uid="metrics.task-published")
+def record_task_published(sender=None, **kwargs):
+    # ``sender`` is the task name.
+    TASKS_PUBLISHED.labels(sender or "unknown").inc()
+    stats = _current.get()
+    if stats is not None:
+        stats.tasks_published += 1
+
+
+def observe_request(stats: RequestStats, route: str, method: str, status: int, total: float):
+    REQUEST_LATENCY.labels(route, method).observe(total)
+    REQUESTS.labels(route, method, str(status)).inc()
+    DB_QUERIES.labels(route).observe(stats.db_queries)
+    DB_LATENCY.labels(route).observe(stats.db_time)
@@ -1,7 +1,11 @@
 from datetime import timedelta
+from importlib.util import find_spec
 from pathlib import Path
 import os
+import sys
 import dj_database_url
+from celery.schedules import crontab
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -55,6 +59,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestMetricsMiddleware",
+    "common.profiling.RequestProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -101,12 +107,57 @@ db_port = os.getenv("POSTGRES_PORT")
 db_uri = os.getenv("DATABASE_URL")
 DATABASES = {"default": dj_database_url.parse(db_uri, conn_max_age=600)}
 
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+REDIS_DB = int(os.getenv("REDIS_DB", "0"))
+
+# Redis is the shared cache every worker relies on (throttles, token blacklist,
+# permission and response versions, the invalidation bus). The local-memory
+# cache is per process, so it must be asked for explicitly and is only meant
+# for tests, benchmarks and single-process development servers.
+CACHE_BACKEND = (
+    os.getenv("CACHE_BACKEND") or ("locmem" if sys.argv[1:2] == ["test"] else "redis")
+).lower()
+if CACHE_BACKEND == "redis":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}",
+            "KEY_PREFIX": "kmdmc",
+            "OPTIONS": {
+                "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
+                "socket_connect_timeout": 1,
+                "socket_timeout": 1,
+                "retry_on_timeout": True,
+                "health_check_interval": 30,
+            },
+        }
+    }
+elif CACHE_BACKEND == "locmem":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "kmdmc",
+        }
+    }
+else:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND must be 'redis' or 'locmem', not {CACHE_BACKEND!r}"
+    )
+
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 
 CELERY_RESULT_BACKEND = "django-db"
+CELERY_BEAT_SCHEDULE = {
+    "flush-expired-tokens": {
+        "task": "user.tasks.flush_expired_tokens_task",
+        "schedule": crontab(hour=2, minute=30),
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -164,17 +215,28 @@ AUTHENTICATION_BACKENDS = [
 # Django REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "user.authentication.ClaimsJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "utils.renderers.ORJSONRenderer",
+        # Optional: served for "Accept: application/msgpack" when installed.
+        *(["utils.renderers.MessagePackRenderer"] if find_spec("msgpack") else []),
     ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "utils.renderers.ORJSONParser",
     ],
+    # Proxies in front of the app (nginx in deploy/, which overwrites
+    # X-Forwarded-For). Throttles trust only that many X-Forwarded-For hops;
+    # set 0 when clients reach Django directly, so REMOTE_ADDR is used.
+    "NUM_PROXIES": int(os.getenv("NUM_PROXIES", "1")),
+    "DEFAULT_THROTTLE_RATES": {
+        # Token buckets for login attempts (see user.throttling)
+        "login_ip": os.getenv("LOGIN_THROTTLE_IP_RATE", "30/min"),
+        "login_email": os.getenv("LOGIN_THROTTLE_EMAIL_RATE", "5/min"),
+    },
 }
 
 # Swagger settings - Allow unauthenticated access to docs
@@ -204,6 +266,17 @@ SIMPLE_JWT = {
     "USER_ID_CLAIM": "user_id",
 }
 
+# Refresh token lifetime for sessions started with "remember me"
+REMEMBER_ME_REFRESH_LIFETIME = timedelta(days=30)
+
+# Build request.user for read requests from access token claims instead of the
+# database while the token's user/role versions are current.
+JWT_CLAIMS_USER_ENABLED = os.getenv("JWT_CLAIMS_USER_ENABLED", "False").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = DEBUG  # Only allow all origins in debug mode
 CORS_ALLOWED_ORIGINS = [
@@ -214,3 +287,29 @@ CORS_ALLOWED_ORIGINS = [
 # Email settings
 FROM_EMAIL = os.environ.get("FROM_EMAIL", "noreply@kmdmc.com")
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"  # Use console for dev
+
+# Audit archive settings
+AUDIT_ARCHIVE_DIR = os.getenv("AUDIT_ARCHIVE_DIR", str(BASE_DIR.parent / "archives" / "audit"))
+AUDIT_RETENTION_DAYS = int(os.getenv("AUDIT_RETENTION_DAYS", "180"))
+
+# Request metrics (core.middleware.RequestMetricsMiddleware, /metrics)
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "True").lower() in ("true", "1", "yes")
+# /metrics is disabled (404) until a scrape token is configured.
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Slow-query capture (common.slow_queries); 0 turns it off.
+SLOW_QUERY_THRESHOLD_MS = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", "0"))
+SLOW_QUERY_EXPLAIN_ANALYZE = os.getenv("SLOW_QUERY_EXPLAIN_ANALYZE", "False").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+SLOW_QUERY_MAX_ROWS = int(os.getenv("SLOW_QUERY_MAX_ROWS", "500"))
+
+# On-demand request profiling for admins (common.profiling)
+PROFILE_TOKEN_MAX_AGE = int(os.getenv("PROFILE_TOKEN_MAX_AGE", "600"))
+PROFILE_RATE_LIMIT = int(os.getenv("PROFILE_RATE_LIMIT", "20"))  # per admin per hour
+PROFILE_MAX_BYTES = int(os.getenv("PROFILE_MAX_BYTES", str(2 * 1024 * 1024)))
+PROFILE_MAX_ROWS = int(os.getenv("PROFILE_MAX_ROWS", "50"))
+PROFILE_SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+PROFILE_MAX_SAMPLES = int(os.getenv("PROFILE_MAX_SAMPLES", "20000"))
@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from core.resources import invalidation
+
+
+class InvalidationHealthTests(SimpleTestCase):
+    def test_local_memory_cache_is_trusted(self):
+        self.assertIs(invalidation.is_healthy(), True)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
+    def test_shared_cache_without_a_bus_is_not_trusted(self):
+        self.assertIs(invalidation.is_healthy(), False)
+
+
+class MetricsViewTests(SimpleTestCase):
+    @override_settings(METRICS_TOKEN="")
+    def test_disabled_without_a_token(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 404)
+
+    @override_settings(METRICS_TOKEN="scrape-token")
+    def test_requires_the_token(self):
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, 401)
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer wrong-token"
+        )
+        self.assertEqual(response.status_code, 401)
+        response = self.client.get(
+            reverse("metrics"), HTTP_AUTHORIZATION="Bearer scrape-token"
+        )
+        self.assertEqual(response.status_code, 200)
@@ -1,6 +1,16 @@
+import hmac
 import os
 
+from django.conf import settings
 from django.http import HttpResponse
+from django.views import View
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
 from rest_framework import generics, permissions, serializers, status
 from rest_framework.response import Response
 
@@ -27,3 +37,26 @@ class HealthCheckView(generics.GenericAPIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+class MetricsView(View):
+    """
+    Prometheus scrape endpoint for core.resources.metrics. Scrapers must send
+    METRICS_TOKEN as a bearer token; without a configured token the endpoint
+    is disabled.
+    """
+
+    def get(self, request, *args, **kwargs):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        if not token:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        supplied = request.headers.get("Authorization", "").removeprefix("Bearer ")
+        if not hmac.compare_digest(supplied.encode(), token.encode()):
+            return HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
+
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
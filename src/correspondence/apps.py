@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CorrespondenceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "correspondence"
+
+    def ready(self):
+        import correspondence.signals
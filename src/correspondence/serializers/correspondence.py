@@ -1,7 +1,10 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db.models import Count
 from django.utils import timezone
 from correspondence.models import Correspondence, CorrespondenceDelegate
+from utils.fragments import FragmentCachedListSerializer
+from utils.serialization import SparseFieldsMixin, ValuesField
 
 
 User = get_user_model()
@@ -26,7 +29,7 @@ class CorrespondenceUserSerializer(serializers.ModelSerializer):
 # Main Correspondence Serializers
 # ============================================================================
 
-class CorrespondenceListSerializer(serializers.ModelSerializer):
+class CorrespondenceListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for list views (table display)."""
     is_overdue = serializers.SerializerMethodField()
     parent_id = serializers.ReadOnlyField(source='parent.id')
@@ -38,8 +41,18 @@ class CorrespondenceListSerializer(serializers.ModelSerializer):
     sender = serializers.CharField(source='sender.name', read_only=True)
     sender_mail = serializers.CharField(source='sender.email', read_only=True)
 
+    values_fields = {
+        'is_overdue': ValuesField(
+            'due_date', func=lambda serializer, due_date: serializer.is_past_due(due_date)
+        ),
+        'reply_count': ValuesField(Count('replies')),
+    }
+    # Replies touch their parent's updated_at (see correspondence.signals).
+    fragment_depends_on = (User,)
+
     class Meta:
         model = Correspondence
+        list_serializer_class = FragmentCachedListSerializer
         fields = [
             'id',
             'subject', "type",
@@ -64,10 +77,18 @@ class CorrespondenceListSerializer(serializers.ModelSerializer):
             "image_urls"
         ]
 
-    def get_is_overdue(self, obj):
-        if obj.due_date:
-            return timezone.now().date() > obj.due_date
+    @staticmethod
+    def is_past_due(due_date):
+        if due_date:
+            return timezone.now().date() > due_date
         return False
+
+    def get_is_overdue(self, obj):
+        return self.is_past_due(obj.due_date)
+
+    def fragment_variant(self):
+        # is_overdue changes with the date.
+        return timezone.now().date()
     
 class CorrespondenceRetrieveSerializer(serializers.ModelSerializer):
     """Detailed serializer for retrieving a single correspondence."""
@@ -87,19 +108,29 @@ class CorrespondenceRetrieveSerializer(serializers.ModelSerializer):
             'status', 'priority',
             'requires_action', "reply_notes", "forwarded_notes"]
 
+    def get_replies(self, obj, status):
+        # Replied and forwarded notes come from one query, with their users.
+        replies = self.__dict__.setdefault("_replies", {})
+        if obj.pk not in replies:
+            replies[obj.pk] = list(
+                obj.replies.filter(status__in=['replied', 'forwarded'])
+                .select_related('sender', 'receiver')
+            )
+        return [reply for reply in replies[obj.pk] if reply.status == status]
+
     def get_reply_notes(self, obj):
         return [{"sender": reply.sender.name, 
                  "receiver": reply.receiver.name,
                  "sender_email": reply.sender.email,
                  "receiver_email": reply.receiver.email,
-                 "note": reply.note} for reply in obj.replies.filter(status='replied').all()]
+                 "note": reply.note} for reply in self.get_replies(obj, 'replied')]
 
     def get_forwarded_notes(self, obj):
         return [{"sender": forward.sender.name,
                  "receiver": forward.receiver.name,
                  "sender_email": forward.sender.email,
                  "receiver_email": forward.receiver.email,
-                 "note": forward.note} for forward in obj.replies.filter(status='forwarded').all()]
+                 "note": forward.note} for forward in self.get_replies(obj, 'forwarded')]
 
 class CorrespondenceCreateSerializer(serializers.ModelSerializer):
     parent = serializers.PrimaryKeyRelatedField(
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from correspondence.models import Correspondence
+
+
+@receiver(post_save, sender=Correspondence)
+@receiver(post_delete, sender=Correspondence)
+def touch_parent(sender, instance, **kwargs):
+    """
+    A reply changes its parent's reply_count: move the parent's updated_at
+    so its cached list fragment and ETag are refreshed.
+    """
+    if kwargs.get("created") is False or not instance.parent_id:
+        return
+    Correspondence.objects.filter(pk=instance.parent_id).update(updated_at=timezone.now())
@@ -1,3 +1,151 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.utils import timezone
+
+from correspondence.models import Correspondence, CorrespondenceDelegate
+from correspondence.utils import get_correspondence_stats
+from utils.testing import APIQueryBudgetTestCase
+
+VIEWERS = {
+    "super_admin": 200,
+    "managing_director": 200,
+    "general_manager": 200,
+    "staff": 200,
+    "hr": 403,
+    "no_role": 403,
+}
+
+
+class CorrespondenceQueryTests(APIQueryBudgetTestCase):
+    def setUp(self):
+        self.correspondence = Correspondence.objects.order_by("pk").first()
+        self.url = f"/v1/correspondence/{self.correspondence.pk}/"
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        for role in ("super_admin", "managing_director", "staff"):
+            with self.subTest(role=role):
+                self.assertConstantQueries("/v1/correspondence/", self.users[role])
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(5, "get", "/v1/correspondence/", VIEWERS)
+        self.assertQueryBudget(
+            5,
+            "get",
+            "/v1/correspondence/?status=new&ordering=-due_date&search=a",
+            self.users["super_admin"],
+            status=200,
+        )
+
+    def test_retrieve(self):
+        self.assertQueryBudgetByRole(12, "get", self.url, VIEWERS)
+
+    def test_retrieve_with_replies(self):
+        sender, receiver = self.users["general_manager"], self.users["staff"]
+        for index in range(6):
+            Correspondence.objects.create(
+                parent=self.correspondence,
+                subject=f"Re: note {index}",
+                status="replied" if index % 2 else "forwarded",
+                sender=sender,
+                receiver=receiver,
+            )
+        self.assertQueryBudget(12, "get", self.url, self.users["super_admin"], status=200)
+
+    def test_create(self):
+        data = {
+            "subject": "Quarterly budget",
+            "receiver": self.users["staff"].pk,
+            "status": "new",
+            "priority": "high",
+            "requires_action": True,
+            "due_date": (timezone.now().date() + timedelta(days=7)).isoformat(),
+            "category": "finance",
+        }
+        self.assertQueryBudgetByRole(
+            13,
+            "post",
+            "/v1/correspondence/",
+            {"super_admin": 201, "general_manager": 201, "hr": 403, "no_role": 403},
+            data,
+        )
+
+    def test_reply(self):
+        data = {
+            "subject": "Re: quarterly budget",
+            "parent": self.correspondence.pk,
+            "receiver": self.users["staff"].pk,
+            "status": "replied",
+            "note": "Approved.",
+        }
+        self.assertQueryBudget(
+            7, "post", "/v1/correspondence/", self.users["general_manager"], data, 201
+        )
+
+    def test_update(self):
+        self.assertQueryBudgetByRole(
+            13,
+            "patch",
+            self.url,
+            {"super_admin": 200, "general_manager": 200, "staff": 403, "no_role": 403},
+            {"priority": "urgent", "note": "Escalated."},
+        )
+
+    def test_delegates(self):
+        delegated_by, delegated_to = self.users["managing_director"], self.users["general_manager"]
+        for correspondence in Correspondence.objects.order_by("pk")[:10]:
+            CorrespondenceDelegate.objects.create(
+                correspondence=correspondence,
+                delegated_by=delegated_by,
+                delegated_to=delegated_to,
+            )
+        self.assertQueryBudget(
+            1, "get", "/v1/correspondence/delegates/", delegated_by, status=200
+        )
+
+    def test_delegate(self):
+        data = {
+            "correspondence": self.correspondence.pk,
+            "delegated_to": self.users["general_manager"].pk,
+            "note": "Please handle.",
+        }
+        self.assertQueryBudget(
+            10,
+            "post",
+            "/v1/correspondence/delegates/",
+            self.users["managing_director"],
+            data,
+            201,
+        )
+
+
+class CorrespondenceConditionalTests(APIQueryBudgetTestCase):
+    def test_list_etag_changes_with_the_date(self):
+        # is_overdue depends on today's date, so yesterday's ETag must not match.
+        response, _ = self.request("get", "/v1/correspondence/", self.users["super_admin"])
+        etag = response["ETag"]
+        response = self.client.get("/v1/correspondence/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        tomorrow = timezone.now() + timedelta(days=1)
+        with mock.patch("django.utils.timezone.now", return_value=tomorrow):
+            response = self.client.get("/v1/correspondence/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+
+class CorrespondenceStatsTests(APIQueryBudgetTestCase):
+    def test_stats_keep_their_keys_in_one_query(self):
+        queryset = Correspondence.objects.all()
+        with self.assertNumQueries(1):
+            stats = get_correspondence_stats(queryset)
+        self.assertEqual(
+            list(stats),
+            [
+                "total", "incoming", "outgoing", "new", "pending_action",
+                "in_progress", "assigned", "replied", "archived", "closed",
+                "overdue", "urgent", "high_priority", "confidential",
+                "requires_action", "last_7_days", "last_30_days",
+            ],
+        )
+        self.assertEqual(stats["total"], queryset.count())
+        self.assertEqual(stats["new"], queryset.filter(status="new").count())
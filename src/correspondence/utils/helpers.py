@@ -34,6 +34,8 @@ def get_correspondence_stats(queryset=None):
     """
     Calculate comprehensive statistics for correspondence.
     
+    All counts come from a single aggregate query.
+    
     Args:
         queryset: Optional filtered queryset. If None, uses all correspondence.
     
@@ -48,34 +50,31 @@ def get_correspondence_stats(queryset=None):
     today = timezone.now().date()
     last_7_days = today - timedelta(days=7)
     last_30_days = today - timedelta(days=30)
-    
-    stats = {
-        'total': queryset.count(),
-        'incoming': queryset.filter(correspondence_type='incoming').count(),
-        'outgoing': queryset.filter(correspondence_type='outgoing').count(),
-        'new': queryset.filter(status='new').count(),
-        'pending_action': queryset.filter(status='pending_action').count(),
-        'in_progress': queryset.filter(status='in_progress').count(),
-        'assigned': queryset.filter(status='assigned').count(),
-        'replied': queryset.filter(status='replied').count(),
-        'archived': queryset.filter(status='archived').count(),
-        'closed': queryset.filter(status='closed').count(),
-        'overdue': queryset.filter(
-            due_date__lt=today
-        ).exclude(status__in=['closed', 'archived']).count(),
-        'urgent': queryset.filter(priority='urgent').exclude(
-            status__in=['closed', 'archived']
-        ).count(),
-        'high_priority': queryset.filter(priority='high').exclude(
-            status__in=['closed', 'archived']
-        ).count(),
-        'confidential': queryset.filter(is_confidential=True).count(),
-        'requires_action': queryset.filter(requires_action=True).count(),
-        'last_7_days': queryset.filter(created_at__date__gte=last_7_days).count(),
-        'last_30_days': queryset.filter(created_at__date__gte=last_30_days).count(),
+    open_items = ~Q(status__in=['closed', 'archived'])
+    
+    # The original keys, including statuses and directions the current choices
+    # no longer use (those count 0); correspondence_type is now `type`.
+    counts = {
+        'total': Count('id'),
+        'incoming': Count('id', filter=Q(type='incoming')),
+        'outgoing': Count('id', filter=Q(type='outgoing')),
+        **{
+            status: Count('id', filter=Q(status=status))
+            for status in (
+                'new', 'pending_action', 'in_progress', 'assigned',
+                'replied', 'archived', 'closed',
+            )
+        },
+        'overdue': Count('id', filter=Q(due_date__lt=today) & open_items),
+        'urgent': Count('id', filter=Q(priority='urgent') & open_items),
+        'high_priority': Count('id', filter=Q(priority='high') & open_items),
+        'confidential': Count('id', filter=Q(is_confidential=True)),
+        'requires_action': Count('id', filter=Q(requires_action=True)),
+        'last_7_days': Count('id', filter=Q(created_at__date__gte=last_7_days)),
+        'last_30_days': Count('id', filter=Q(created_at__date__gte=last_30_days)),
     }
     
-    return stats
+    return queryset.order_by().aggregate(**counts)
 
 
 def create_activity_log(correspondence, action, description, user, metadata=None, is_automated=False):
@@ -7,6 +7,8 @@ from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
 from utils.pagination import CustomPagination
+from utils.conditional import conditional_list
+from utils.serialization import ValuesListMixin
 from datetime import timedelta
 from audit.enums import AuditModuleEnum, AuditStatusEnum, AuditTypeEnum, LogParams
 from audit.tasks import log_audit_event_task
@@ -25,7 +27,7 @@ from utils.activity_log import extract_api_request_metadata
 User = get_user_model()
 
 
-class CorrespondenceViewSet(viewsets.ModelViewSet):
+class CorrespondenceViewSet(ValuesListMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing correspondence (incoming and outgoing mail).
     """
@@ -65,11 +67,15 @@ class CorrespondenceViewSet(viewsets.ModelViewSet):
     
         user = self.request.user
         if user.role == "general_staff":
-            return Correspondence.objects.filter(receiver=user)
-        queryset = super().get_queryset()
+            queryset = Correspondence.objects.filter(receiver=user)
+        else:
+            queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            queryset = queryset.select_related('sender', 'receiver', 'through')
         return queryset
     
     @permissions_required([PERMISSIONS.CAN_VIEW_CORRESPONDENCE])
+    @conditional_list(User)
     def list(self, request, *args, **kwargs):
         """Override list to return custom response format."""
         queryset = self.filter_queryset(self.get_queryset())
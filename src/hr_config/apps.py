@@ -5,3 +5,6 @@ class HrConfigConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'hr_config'
     verbose_name = 'HR Configuration'
+
+    def ready(self):
+        import hr_config.signals
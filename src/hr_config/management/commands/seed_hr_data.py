@@ -8,8 +8,7 @@ from hr_config.models import (
     LeaveApprovalWorkflow,
     LeaveApprovalStage,
 )
-from user.models import Permission
-from user.models.admin import PermissionModule
+from user.models.admin import Permission, PermissionModule
 
 
 class Command(BaseCommand):
@@ -193,38 +192,38 @@ class Command(BaseCommand):
 
     def seed_permissions(self):
         """Create HR_CONFIG permissions."""
-        self.stdout.write('Seeding HR_CONFIG permissions...')
+        self.stdout.write('Seeding HR_SETTINGS permissions...')
 
         permissions = [
             {
                 'name': 'View HR Configuration',
                 'description': 'Can view HR configuration settings',
-                'module': PermissionModule.HR_CONFIG.value,
+                'module': PermissionModule.HR_SETTINGS.value,
             },
             {
                 'name': 'Manage Appraisal Templates',
                 'description': 'Can create, update, and delete appraisal templates',
-                'module': PermissionModule.HR_CONFIG.value,
+                'module': PermissionModule.HR_SETTINGS.value,
             },
             {
                 'name': 'Manage Leave Types',
                 'description': 'Can create, update, and delete leave types',
-                'module': PermissionModule.HR_CONFIG.value,
+                'module': PermissionModule.HR_SETTINGS.value,
             },
             {
                 'name': 'Manage Public Holidays',
                 'description': 'Can create, update, and delete public holidays',
-                'module': PermissionModule.HR_CONFIG.value,
+                'module': PermissionModule.HR_SETTINGS.value,
             },
             {
                 'name': 'Manage Attendance Policy',
                 'description': 'Can update attendance policy settings',
-                'module': PermissionModule.HR_CONFIG.value,
+                'module': PermissionModule.HR_SETTINGS.value,
             },
             {
                 'name': 'Manage Leave Approval Workflows',
                 'description': 'Can create, update, and delete leave approval workflows',
-                'module': PermissionModule.HR_CONFIG.value,
+                'module': PermissionModule.HR_SETTINGS.value,
             },
         ]
 
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.2 on 2026-10-19 01:26
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("hr_config", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="attendancepolicy",
+            name="shift_end_time",
+            field=models.TimeField(
+                default=datetime.time(17, 0),
+                help_text="Default shift end time (e.g., 17:00)",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="attendancepolicy",
+            name="shift_start_time",
+            field=models.TimeField(
+                default=datetime.time(9, 0),
+                help_text="Default shift start time (e.g., 09:00)",
+            ),
+        ),
+    ]
@@ -1,9 +1,13 @@
+import datetime
+
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 
+from utils.caching import VersionedLocalCache
+
 
 class AppraisalTemplate(models.Model):
     """
@@ -191,11 +195,11 @@ class AttendancePolicy(models.Model):
     Only one instance should exist.
     """
     shift_start_time = models.TimeField(
-        default='09:00',
+        default=datetime.time(9, 0),
         help_text="Default shift start time (e.g., 09:00)"
     )
     shift_end_time = models.TimeField(
-        default='17:00',
+        default=datetime.time(17, 0),
         help_text="Default shift end time (e.g., 17:00)"
     )
     late_grace_period_minutes = models.IntegerField(
@@ -253,7 +257,11 @@ class AttendancePolicy(models.Model):
 
     @classmethod
     def get_policy(cls):
-        """Get or create the singleton instance."""
+        """Get or create the singleton instance (cached per process)."""
+        return _attendance_policy_cache.get()
+
+    @classmethod
+    def _load_policy(cls):
         policy, created = cls.objects.get_or_create(pk=1)
         return policy
 
@@ -285,10 +293,22 @@ class LeaveApprovalWorkflow(models.Model):
 
     @classmethod
     def get_active_workflow(cls):
-        """Get the currently active workflow."""
+        """Get the currently active workflow (cached per process)."""
+        return _active_workflow_cache.get()
+
+    @classmethod
+    def _load_active_workflow(cls):
         return cls.objects.filter(is_active=True).first()
 
 
+_attendance_policy_cache = VersionedLocalCache(
+    AttendancePolicy._load_policy, AttendancePolicy
+)
+_active_workflow_cache = VersionedLocalCache(
+    LeaveApprovalWorkflow._load_active_workflow, LeaveApprovalWorkflow
+)
+
+
 class LeaveApprovalStage(models.Model):
     """
     Individual stages in a leave approval workflow.
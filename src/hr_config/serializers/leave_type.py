@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from hr_config.models import LeaveType
+from utils.serialization import SparseFieldsMixin
 
 
-class LeaveTypeListSerializer(serializers.ModelSerializer):
+class LeaveTypeListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for listing leave types."""
     accrual_display = serializers.SerializerMethodField()
     accrual_frequency_display = serializers.CharField(source='get_accrual_frequency_display', read_only=True)
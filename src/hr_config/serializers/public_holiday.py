@@ -1,9 +1,10 @@
 from rest_framework import serializers
 from django.utils import timezone
 from hr_config.models import PublicHoliday
+from utils.serialization import SparseFieldsMixin
 
 
-class PublicHolidayListSerializer(serializers.ModelSerializer):
+class PublicHolidayListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serializer for listing public holidays."""
     date_display = serializers.SerializerMethodField()
     holiday_type_display = serializers.CharField(source='get_holiday_type_display', read_only=True)
@@ -0,0 +1,12 @@
+from hr_config.models import (
+    AttendancePolicy,
+    LeaveApprovalStage,
+    LeaveApprovalWorkflow,
+    LeaveType,
+    PublicHoliday,
+)
+from utils.caching import track_model_versions
+
+track_model_versions(
+    AttendancePolicy, LeaveApprovalStage, LeaveApprovalWorkflow, LeaveType, PublicHoliday
+)
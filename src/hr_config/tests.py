@@ -0,0 +1,137 @@
+from datetime import date, timedelta
+
+from hr_config.models import AppraisalTemplate, LeaveType, PublicHoliday
+from utils.testing import APIQueryBudgetTestCase
+
+EVERYONE = {"super_admin": 200, "hr": 200, "staff": 200, "no_role": 200}
+
+
+class LeaveTypeQueryTests(APIQueryBudgetTestCase):
+    def setUp(self):
+        self.leave_types = LeaveType.objects.bulk_create(
+            LeaveType(leave_type_name=f"Leave {index}", allowance_days=10 + index)
+            for index in range(12)
+        )
+        self.url = f"/v1/hr-config/leave-types/{self.leave_types[0].pk}/"
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        self.assertConstantQueries("/v1/hr-config/leave-types/", self.users["hr"], sizes=(2, 10))
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(3, "get", "/v1/hr-config/leave-types/", EVERYONE)
+
+    def test_retrieve(self):
+        self.assertQueryBudgetByRole(2, "get", self.url, EVERYONE)
+
+    def test_create_update_destroy(self):
+        user = self.users["hr"]
+        data = {"leave_type_name": "Study", "allowance_days": "12.00", "accrual_frequency": "monthly"}
+        self.assertQueryBudget(3, "post", "/v1/hr-config/leave-types/", user, data, 201)
+        self.assertQueryBudget(3, "patch", self.url, user, {"is_paid": False}, 200)
+        self.assertQueryBudget(2, "delete", self.url, user, status=200)
+
+
+class PublicHolidayQueryTests(APIQueryBudgetTestCase):
+    def setUp(self):
+        self.year = date.today().year
+        self.holidays = [
+            PublicHoliday.objects.create(
+                holiday_name=f"Holiday {month}", date=date(self.year, month, 1)
+            )
+            for month in range(1, 13)
+        ]
+        self.url = f"/v1/hr-config/public-holidays/{self.holidays[0].pk}/"
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        self.assertConstantQueries(
+            "/v1/hr-config/public-holidays/", self.users["hr"], sizes=(2, 10)
+        )
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(3, "get", "/v1/hr-config/public-holidays/", EVERYONE)
+        self.assertQueryBudget(
+            1,
+            "get",
+            f"/v1/hr-config/public-holidays/by_year/?year={self.year}",
+            self.users["staff"],
+            status=200,
+        )
+
+    def test_retrieve(self):
+        self.assertQueryBudgetByRole(2, "get", self.url, EVERYONE)
+
+    def test_create_update_destroy(self):
+        user = self.users["hr"]
+        data = {
+            "holiday_name": "Founders' Day",
+            "date": (date.today() + timedelta(days=30)).isoformat(),
+            "holiday_type": "official",
+        }
+        self.assertQueryBudget(3, "post", "/v1/hr-config/public-holidays/", user, data, 201)
+        self.assertQueryBudget(3, "patch", self.url, user, {"description": "Moved"}, 200)
+        self.assertQueryBudget(2, "delete", self.url, user, status=200)
+
+
+class AppraisalTemplateQueryTests(APIQueryBudgetTestCase):
+    content = {
+        "sections": [
+            {
+                "section_name": "Delivery",
+                "weight": 100,
+                "criteria": [
+                    {"criterion_name": "Meets deadlines", "scoring_method": "rating", "weight": 100}
+                ],
+            }
+        ]
+    }
+
+    def setUp(self):
+        creator = self.users["hr"]
+        self.templates = [
+            AppraisalTemplate.objects.create(
+                template_name=f"Template {index}",
+                template_content=self.content,
+                created_by=creator,
+            )
+            for index in range(12)
+        ]
+        self.url = f"/v1/hr-config/appraisal-templates/{self.templates[0].pk}/"
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        self.assertConstantQueries(
+            "/v1/hr-config/appraisal-templates/", self.users["hr"], sizes=(2, 10)
+        )
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(
+            3, "get", "/v1/hr-config/appraisal-templates/", EVERYONE
+        )
+
+    def test_retrieve(self):
+        self.assertQueryBudgetByRole(2, "get", self.url, EVERYONE)
+
+    def test_create_update_destroy(self):
+        user = self.users["hr"]
+        data = {"template_name": "Annual review", "template_content": self.content}
+        self.assertQueryBudget(
+            3, "post", "/v1/hr-config/appraisal-templates/", user, data, 201
+        )
+        self.assertQueryBudget(4, "patch", self.url, user, {"description": "Revised"}, 200)
+        response = self.assertQueryBudget(2, "post", f"{self.url}activate/", user, status=200)
+        self.assertEqual(response.json()["data"]["status"], "active")
+        response = self.assertQueryBudget(2, "post", f"{self.url}archive/", user, status=200)
+        self.assertEqual(response.json()["data"]["status"], "archived")
+        self.assertQueryBudget(2, "delete", self.url, user, status=200)
+
+
+class AttendancePolicyQueryTests(APIQueryBudgetTestCase):
+    def test_list(self):
+        self.assertQueryBudgetByRole(5, "get", "/v1/hr-config/attendance-policy/", EVERYONE)
+
+    def test_update(self):
+        response, _ = self.request("get", "/v1/hr-config/attendance-policy/", self.users["hr"])
+        url = f"/v1/hr-config/attendance-policy/{response.json()['data']['id']}/"
+        self.assertQueryBudget(2, "get", url, self.users["staff"], status=200)
+        self.assertQueryBudget(
+            4, "patch", url, self.users["hr"], {"late_grace_period_minutes": 10}, 200
+        )
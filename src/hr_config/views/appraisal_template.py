@@ -6,8 +6,10 @@ from rest_framework import filters
 
 from utils.response import Response
 from utils.pagination import CustomPagination
+from utils.conditional import conditional_detail, conditional_list
 from console.permissions import IsSuperAdmin
 from hr_config.models import AppraisalTemplate
+from user.models import CustomUser
 from hr_config.serializers import (
     AppraisalTemplateListSerializer,
     AppraisalTemplateDetailSerializer,
@@ -47,6 +49,7 @@ class AppraisalTemplateViewSet(viewsets.ModelViewSet):
             return AppraisalTemplateUpdateSerializer
         return AppraisalTemplateListSerializer
 
+    @conditional_list(CustomUser)
     def list(self, request, *args, **kwargs):
         """List all appraisal templates."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -64,6 +67,7 @@ class AppraisalTemplateViewSet(viewsets.ModelViewSet):
             status_code=status.HTTP_200_OK
         )
 
+    @conditional_detail(CustomUser)
     def retrieve(self, request, *args, **kwargs):
         """Retrieve single appraisal template."""
         instance = self.get_object()
@@ -147,7 +151,7 @@ class AppraisalTemplateViewSet(viewsets.ModelViewSet):
         instance.status = 'archived'
         instance.save()
 
-        # serializer = AppraisalTemplateDetailSerializer(instance)
+        serializer = AppraisalTemplateDetailSerializer(instance)
         return Response(
             success=True,
             message="Appraisal template archived successfully",
@@ -161,10 +165,10 @@ class AppraisalTemplateViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         instance.status = 'active'
         instance.save()
-        # serializer = AppraisalTemplateDetailSerializer(instance)
+        serializer = AppraisalTemplateDetailSerializer(instance)
         return Response(
             success=True,
             message="Appraisal template activated successfully",
-            # data=serializer.data,
+            data=serializer.data,
             status_code=status.HTTP_200_OK
         )
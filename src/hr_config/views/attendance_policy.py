@@ -2,9 +2,12 @@ from rest_framework import viewsets, status
 from rest_framework.permissions import IsAuthenticated
 
 from utils.response import Response
+from utils.caching import cache_list_response
+from utils.conditional import conditional_list
 from console.permissions import IsSuperAdmin
 from hr_config.models import AttendancePolicy
 from hr_config.serializers import AttendancePolicySerializer
+from user.models import CustomUser
 
 
 class AttendancePolicyViewSet(viewsets.ModelViewSet):
@@ -17,6 +20,8 @@ class AttendancePolicyViewSet(viewsets.ModelViewSet):
     serializer_class = AttendancePolicySerializer
     permission_classes = [IsAuthenticated]
     
+    @conditional_list(CustomUser)
+    @cache_list_response(AttendancePolicy, CustomUser)
     def list(self, request, *args, **kwargs):
         """Return the singleton attendance policy."""
         policy = AttendancePolicy.get_policy()
@@ -30,6 +35,7 @@ class AttendancePolicyViewSet(viewsets.ModelViewSet):
         )
 
     
+    @conditional_list(CustomUser)
     def retrieve(self, request, *args, **kwargs):
         """Retrieve the attendance policy."""
         policy = AttendancePolicy.get_policy()
@@ -4,9 +4,11 @@ from rest_framework.permissions import IsAuthenticated
 from django_filters import rest_framework as django_filters
 from rest_framework import filters
 from django.db import transaction
+from django.utils import timezone
 
 from utils.response import Response
 from utils.pagination import CustomPagination
+from utils.conditional import conditional_detail, conditional_list
 from console.permissions import IsSuperAdmin
 from hr_config.models import LeaveApprovalWorkflow, LeaveApprovalStage
 from hr_config.serializers import (
@@ -48,6 +50,7 @@ class LeaveApprovalWorkflowViewSet(viewsets.ModelViewSet):
             return LeaveApprovalWorkflowUpdateSerializer
         return LeaveApprovalWorkflowListSerializer
 
+    @conditional_list(LeaveApprovalStage)
     def list(self, request, *args, **kwargs):
         """List all leave approval workflows."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -65,6 +68,7 @@ class LeaveApprovalWorkflowViewSet(viewsets.ModelViewSet):
             status_code=status.HTTP_200_OK
         )
 
+    @conditional_detail(LeaveApprovalStage)
     def retrieve(self, request, *args, **kwargs):
         """Retrieve single workflow with all stages."""
         instance = self.get_object()
@@ -160,8 +164,11 @@ class LeaveApprovalWorkflowViewSet(viewsets.ModelViewSet):
         """
         instance = self.get_object()
 
-        # Deactivate all other workflows
-        LeaveApprovalWorkflow.objects.exclude(pk=instance.pk).update(is_active=False)
+        # Deactivate all other workflows, stamping updated_at so their
+        # conditional GET validators change.
+        LeaveApprovalWorkflow.objects.filter(is_active=True).exclude(pk=instance.pk).update(
+            is_active=False, updated_at=timezone.now()
+        )
 
         # Activate this workflow
         instance.is_active = True
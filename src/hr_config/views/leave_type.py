@@ -5,6 +5,8 @@ from rest_framework import filters
 
 from utils.response import Response
 from utils.pagination import CustomPagination
+from utils.caching import cache_list_response
+from utils.conditional import conditional_detail, conditional_list
 from console.permissions import IsSuperAdmin
 from hr_config.models import LeaveType
 from hr_config.serializers import (
@@ -44,6 +46,8 @@ class LeaveTypeViewSet(viewsets.ModelViewSet):
             return LeaveTypeUpdateSerializer
         return LeaveTypeListSerializer
 
+    @conditional_list()
+    @cache_list_response(LeaveType)
     def list(self, request, *args, **kwargs):
         """List all leave types."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -61,6 +65,7 @@ class LeaveTypeViewSet(viewsets.ModelViewSet):
             status_code=status.HTTP_200_OK
         )
 
+    @conditional_detail()
     def retrieve(self, request, *args, **kwargs):
         """Retrieve single leave type."""
         instance = self.get_object()
@@ -6,6 +6,8 @@ from rest_framework import filters
 
 from utils.response import Response
 from utils.pagination import CustomPagination
+from utils.caching import cache_list_response
+from utils.conditional import conditional_detail, conditional_list
 from console.permissions import IsSuperAdmin
 from hr_config.models import PublicHoliday
 from hr_config.serializers import (
@@ -46,6 +48,8 @@ class PublicHolidayViewSet(viewsets.ModelViewSet):
             return PublicHolidayUpdateSerializer
         return PublicHolidayListSerializer
 
+    @conditional_list()
+    @cache_list_response(PublicHoliday)
     def list(self, request, *args, **kwargs):
         """List all public holidays."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -63,6 +67,7 @@ class PublicHolidayViewSet(viewsets.ModelViewSet):
             status_code=status.HTTP_200_OK
         )
 
+    @conditional_detail()
     def retrieve(self, request, *args, **kwargs):
         """Retrieve single public holiday."""
         instance = self.get_object()
@@ -2,13 +2,15 @@ from rest_framework import serializers
 from django.utils import timezone
 from tasks.models import Task
 from user.serializers.user import UserMinimalSerializer
+from utils.serialization import SparseFieldsMixin, ValuesListSerializer
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     assigned_to = serializers.CharField(source='assigned_to.name', read_only=True)
     assigned_by = serializers.CharField(source='assigned_by.name', read_only=True)
     class Meta:
         model = Task
+        list_serializer_class = ValuesListSerializer
         fields = [
             'id',
             'title',
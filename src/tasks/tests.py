@@ -1,3 +1,61 @@
-from django.test import TestCase
+from datetime import timedelta
 
-# Create your tests here.
+from django.utils import timezone
+
+from tasks.models import Task
+from utils.testing import APIQueryBudgetTestCase
+
+VIEWERS = {
+    "super_admin": 200,
+    "managing_director": 200,
+    "general_manager": 200,
+    "staff": 200,
+    "hr": 403,
+    "no_role": 403,
+}
+
+
+class TaskQueryTests(APIQueryBudgetTestCase):
+    def setUp(self):
+        self.task = Task.objects.order_by("pk").first()
+        self.url = f"/v1/tasks/{self.task.pk}/"
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        user = self.users["general_manager"]
+        for url in ("/v1/tasks/", "/v1/tasks/?filter=my_tasks", "/v1/tasks/?status=pending"):
+            with self.subTest(url=url):
+                self.assertConstantQueries(url, user)
+
+    def test_list(self):
+        self.assertQueryBudgetByRole(4, "get", "/v1/tasks/", VIEWERS)
+
+    def test_retrieve(self):
+        self.assertQueryBudgetByRole(3, "get", self.url, VIEWERS)
+
+    def test_create(self):
+        data = {
+            "title": "Prepare the board pack",
+            "assigned_to": self.users["staff"].pk,
+            "priority": "high",
+            "deadline": (timezone.now().date() + timedelta(days=3)).isoformat(),
+        }
+        self.assertQueryBudgetByRole(
+            19,
+            "post",
+            "/v1/tasks/",
+            {"managing_director": 201, "general_manager": 201, "staff": 403, "no_role": 403},
+            data,
+        )
+
+    def test_update(self):
+        self.assertQueryBudgetByRole(
+            19,
+            "patch",
+            self.url,
+            {"general_manager": 200, "staff": 200, "hr": 403},
+            {"status": "completed"},
+        )
+
+    def test_destroy(self):
+        self.assertQueryBudget(12, "delete", self.url, self.users["managing_director"], status=200)
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
@@ -12,14 +12,16 @@ from tasks.serializers import (
     TaskAdminUpdateSerializer,
 )
 from utils.pagination import CustomPagination
+from utils.conditional import conditional_detail, conditional_list
+from utils.serialization import ValuesListMixin
 from console.permissions import permissions_required
 from utils.permissions import PERMISSIONS
 from utils.activity_log import extract_api_request_metadata
 from audit.tasks import log_audit_event_task
 from audit.enums import AuditModuleEnum, AuditStatusEnum, AuditTypeEnum, LogParams
-from user.models.models import PerformanceRecord
+from user.models.models import CustomUser, PerformanceRecord
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(ValuesListMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     queryset = Task.objects.select_related('assigned_to', 'assigned_by').all()
     filterset_fields = ['assigned_to', 'assigned_by', 'status', 'priority']
@@ -49,6 +51,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         return queryset
 
     @permissions_required([PERMISSIONS.CAN_VIEW_TASKS])
+    @conditional_list(CustomUser)
     def list(self, request, *args, **kwargs):
         """List all tasks with custom response format."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -67,6 +70,7 @@ class TaskViewSet(viewsets.ModelViewSet):
         )
 
     @permissions_required([PERMISSIONS.CAN_VIEW_TASKS])
+    @conditional_detail(CustomUser)
     def retrieve(self, request, *args, **kwargs):
         """Retrieve a single task with custom response format."""
         instance = self.get_object()
@@ -135,7 +139,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             performance.save()
         
         # Return full task details
-        instance.refresh_from_db()
+        instance = Task.objects.select_related('assigned_to', 'assigned_by').get(pk=instance.pk)
         response_serializer = TaskSerializer(instance)
         user = request.user
         event = LogParams(
@@ -168,7 +172,7 @@ class TaskViewSet(viewsets.ModelViewSet):
             audit_type=AuditTypeEnum.DELETE_TASK.raw_value,
             audit_module=AuditModuleEnum.TASKS.raw_value,
             status=AuditStatusEnum.SUCCESS.raw_value,
-            user_id=str(user.id),
+            user_id=str(request.user.id),
             user_name=request.user.name.upper(),
             user_email=request.user.email,
             user_role=request.user.role.name,
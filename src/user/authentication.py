@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.db import router
+from django.db.models.base import DEFERRED
+from redis.exceptions import RedisError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from user.models import CustomUser
+from user.models.admin import Role
+from user.permission_cache import get_auth_versions
+from user.tokens import USER_CLAIMS
+
+REQUIRED_CLAIMS = USER_CLAIMS + ("role_name", "user_version", "perm_version")
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that, for safe requests, builds the user from the token
+    claims instead of querying the database.
+
+    The claims are trusted only while the user and role versions stamped in the
+    token still match the ones in Redis; otherwise, for unsafe methods, or when
+    JWT_CLAIMS_USER_ENABLED is off, the user is loaded as usual. Fields not
+    carried in the token are deferred; the first access loads them together.
+    """
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        if request.method in SAFE_METHODS:
+            user = self.get_claims_user(validated_token)
+            if user is not None:
+                return user, validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_claims_user(self, validated_token):
+        if not getattr(settings, "JWT_CLAIMS_USER_ENABLED", False):
+            return None
+        if any(claim not in validated_token for claim in REQUIRED_CLAIMS):
+            return None
+        if not validated_token["is_active"]:
+            # Let the regular path raise the proper "inactive" error.
+            return None
+
+        user_id = validated_token[api_settings.USER_ID_CLAIM]
+        role_id = validated_token["role_id"]
+        try:
+            versions = get_auth_versions(user_id, role_id)
+        except RedisError:
+            return None
+        if versions != (validated_token["user_version"], validated_token["perm_version"]):
+            return None
+
+        return self.build_user(validated_token)
+
+    def build_user(self, validated_token):
+        claims = {claim: validated_token[claim] for claim in USER_CLAIMS}
+        claims[CustomUser._meta.pk.attname] = validated_token[api_settings.USER_ID_CLAIM]
+
+        db = router.db_for_read(CustomUser)
+        field_names, values = [], []
+        for field in CustomUser._meta.concrete_fields:
+            field_names.append(field.attname)
+            if field.attname in claims:
+                values.append(field.to_python(claims[field.attname]))
+            else:
+                values.append(DEFERRED)
+        user = CustomUser.from_db(db, field_names, values)
+        user._load_deferred_together = True
+
+        if user.role_id is not None:
+            role = Role.from_db(
+                db, ["id", "name"], [user.role_id, validated_token["role_name"]]
+            )
+            CustomUser.role.field.set_cached_value(user, role)
+        return user
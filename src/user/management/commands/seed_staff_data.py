@@ -155,29 +155,28 @@ class Command(BaseCommand):
                 date=date,
                 defaults={
                     'activity_count': activity_count,
-                    'tasks_completed': random.randint(0, min(3, activity_count)),
-                    'approvals_given': random.randint(0, min(5, activity_count)),
+                    'correspondence_handled': random.randint(0, min(5, activity_count)),
+                    'approvals_pending': random.randint(0, min(3, activity_count)),
                 }
             )
         
         self.stdout.write(self.style.SUCCESS('Created activity heatmap data'))
         
         # Create performance records
-        for i in range(12):
-            month_date = (today.replace(day=1) - timedelta(days=30*i)).replace(day=1)
-            PerformanceRecord.objects.get_or_create(
-                user=sarah,
-                month=month_date,
-                defaults={
-                    'tasks_assigned': random.randint(15, 30),
-                    'tasks_completed': random.randint(12, 28),
-                    'tasks_on_time': random.randint(10, 25),
-                    'approvals_given': random.randint(100, 150),
-                    'avg_response_time_hours': random.uniform(1.0, 4.0),
-                    'performance_score': random.uniform(75, 95),
-                    'points_earned': random.randint(60, 100),
-                }
-            )
+        # Records carry no month of their own, so only seed them once.
+        if not PerformanceRecord.objects.filter(user=sarah).exists():
+            for i in range(12):
+                PerformanceRecord.objects.create(
+                    user=sarah,
+                    tasks_assigned=random.randint(15, 30),
+                    tasks_completed=random.randint(12, 28),
+                    tasks_on_time=random.randint(10, 25),
+                    correspondence_sent=random.randint(20, 60),
+                    correspondence_received=random.randint(40, 120),
+                    avg_response_time_hours=round(random.uniform(1.0, 4.0), 2),
+                    performance_score=round(random.uniform(75, 95), 2),
+                    points_earned=random.randint(60, 100),
+                )
         
         self.stdout.write(self.style.SUCCESS('Created performance records'))
         
@@ -10,6 +10,7 @@ from django.db import models, transaction
 from django.utils import timezone
 from django.conf import settings
 from user.models.admin import Role
+from user.permission_cache import get_role_permissions
 
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,9 @@ class Department(models.Model):
         return self.name
 
 
+NO_ROLE_DISPLAY = "No Role Assigned"
+
+
 class CustomUser(AbstractUser):
     LOCATION_CHOICES = [
         ('headquarters', 'Headquarters'),
@@ -118,16 +122,29 @@ class CustomUser(AbstractUser):
             self.phone = None
         super().save(*args, **kwargs)
 
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        # Users built from token claims (user.authentication) defer every
+        # field the token doesn't carry; the first deferred access loads all
+        # of them in one query instead of one query per field.
+        if fields is not None and getattr(self, "_load_deferred_together", False):
+            deferred = self.get_deferred_fields()
+            if deferred.issuperset(fields):
+                fields = deferred
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
 
     @property
     def initials(self):
-        if self.name:
-            parts = self.name.split()
+        return self.initials_for(self.name, self.email)
+
+    @staticmethod
+    def initials_for(name, email):
+        if name:
+            parts = name.split()
             return ''.join([p[0].upper() for p in parts[:2]])
-        return self.email[0].upper() if self.email else 'U'
+        return email[0].upper() if email else 'U'
     
     def role_display(self):
-        return self.role.name if self.role else "No Role Assigned"
+        return self.role.name if self.role else NO_ROLE_DISPLAY
 
     @property
     def full_position(self):
@@ -155,11 +172,9 @@ class CustomUser(AbstractUser):
     
     def has_permissions(self, permission_names):
         """Check if user has all specified permissions."""
-        if not self.role:
+        if not self.role_id:
             return False
-        return self.role.permissions.filter(name__in=permission_names).count() == len(
-            permission_names
-        )
+        return set(permission_names) <= get_role_permissions(self.role_id)
 
 
 class StaffActivity(models.Model):
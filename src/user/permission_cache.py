@@ -0,0 +1,282 @@
+"""
+Per-role permission and capability cache.
+
+Permission checks run on every protected request, and login/role payloads
+repeat the same permission walks, so each role gets one capability snapshot
+(its permissions, their names and the derived module lists) kept in process
+memory. Redis holds a version counter per role plus the snapshot for the
+current version, shared by every worker. Signals (see user.signals) bump the
+version whenever a role or its permissions change and announce it on the
+invalidation bus, which evicts the snapshot in every process. While the bus is
+healthy a snapshot is served without touching Redis; otherwise each check
+compares versions. Either way a stale process reloads the snapshot, from Redis
+when another worker already did the work, or from the database otherwise.
+
+Users get a version counter as well, bumped whenever the row is saved, so
+stateless JWT authentication (see user.authentication) can tell whether the
+claims baked into a token are still current.
+
+If Redis is unavailable the snapshot is built from the database so
+permissions are never served from data that can't be validated.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from redis.exceptions import RedisError
+
+from core.resources import invalidation
+from core.resources.cache import Cache
+from user.models.admin import Permission, PermissionModule
+from utils.caching import LOCAL_MAX_AGE
+from utils.utils import ADMIN_SIDEBAR_MODULES
+
+PERMISSION_CACHE_TTL = 60 * 60 * 24
+
+
+@dataclass(frozen=True)
+class RoleCapabilities:
+    permissions: Tuple[dict, ...]
+    names: FrozenSet[str]
+    modules: Tuple[str, ...]
+    allowed_modules: Tuple[str, ...]
+    sidebar_modules: Tuple[str, ...]
+
+    @classmethod
+    def from_permissions(cls, permissions: List[dict]) -> "RoleCapabilities":
+        modules = {permission["module"] for permission in permissions}
+        return cls(
+            permissions=tuple(permissions),
+            names=frozenset(permission["name"] for permission in permissions),
+            modules=tuple(sorted(modules)),
+            allowed_modules=tuple(sorted(modules & set(PermissionModule.values()))),
+            sidebar_modules=tuple(sorted(modules | set(ADMIN_SIDEBAR_MODULES))),
+        )
+
+
+EMPTY_CAPABILITIES = RoleCapabilities.from_permissions([])
+
+# role id -> (version, capabilities, monotonic time the snapshot was loaded)
+_local: Dict[int, Tuple[int, RoleCapabilities, float]] = {}
+# Roles this thread changed in a transaction that hasn't committed yet; read
+# straight from the database until the version bump lands.
+_state = threading.local()
+_lock = threading.Lock()
+
+
+def _version_key(role_id) -> str:
+    return f"role:{role_id}:permissions:version"
+
+
+def _snapshot_key(role_id, version) -> str:
+    return f"role:{role_id}:capabilities:{version}"
+
+
+def _user_version_key(user_id) -> str:
+    return f"user:{user_id}:auth:version"
+
+
+def _load_permissions(role_id) -> List[dict]:
+    return list(
+        Permission.objects.filter(roles__id=role_id)
+        .order_by("module", "name")
+        .values("id", "name", "module")
+    )
+
+
+def _pending_roles() -> set:
+    pending = getattr(_state, "pending", None)
+    if pending is None:
+        pending = _state.pending = set()
+    elif pending and not transaction.get_connection().in_atomic_block:
+        # The transaction is over. A commit would have cleared these through
+        # _bump_roles, so it rolled back and the cached state still holds.
+        pending.clear()
+    return pending
+
+
+def get_role_version(role_id) -> int:
+    return int(Cache().get(_version_key(role_id)) or 0)
+
+
+def get_auth_versions(user_id, role_id) -> Tuple[int, Optional[int]]:
+    """Return (user version, role version) in a single Redis round trip."""
+    keys = [_user_version_key(user_id)]
+    if role_id is not None:
+        keys.append(_version_key(role_id))
+    values = [int(value or 0) for value in Cache().get_many(keys)]
+    return values[0], (values[1] if role_id is not None else None)
+
+
+def get_role_capabilities(role_id: Optional[int]) -> RoleCapabilities:
+    """Return the capability snapshot of a role."""
+    if role_id is None:
+        return EMPTY_CAPABILITIES
+    if role_id in _pending_roles():
+        return RoleCapabilities.from_permissions(_load_permissions(role_id))
+
+    cached = _local.get(role_id)
+    now = time.monotonic()
+    if (
+        cached is not None
+        and now - cached[2] < LOCAL_MAX_AGE
+        and invalidation.is_healthy()
+    ):
+        return cached[1]
+
+    try:
+        cache = Cache()
+        version = get_role_version(role_id)
+        if cached is not None and cached[0] == version:
+            with _lock:
+                _local[role_id] = (version, cached[1], now)
+            return cached[1]
+
+        permissions = cache.get(_snapshot_key(role_id, version))
+        if permissions is None:
+            permissions = _load_permissions(role_id)
+            cache.set(_snapshot_key(role_id, version), permissions, ttl=PERMISSION_CACHE_TTL)
+    except RedisError:
+        return RoleCapabilities.from_permissions(_load_permissions(role_id))
+
+    capabilities = RoleCapabilities.from_permissions(permissions)
+    with _lock:
+        _local[role_id] = (version, capabilities, now)
+    return capabilities
+
+
+def get_roles_capabilities(role_ids: Iterable[int]) -> Dict[int, RoleCapabilities]:
+    """
+    Return the capability snapshots of several roles with one versions MGET,
+    one snapshots MGET and at most one database query, for list pages.
+    """
+    role_ids = {role_id for role_id in role_ids if role_id is not None}
+    result = {}
+    now = time.monotonic()
+    healthy = invalidation.is_healthy()
+    pending = _pending_roles()
+    missing = []
+    for role_id in role_ids:
+        cached = _local.get(role_id)
+        if (
+            role_id not in pending
+            and cached is not None
+            and now - cached[2] < LOCAL_MAX_AGE
+            and healthy
+        ):
+            result[role_id] = cached[1]
+        else:
+            missing.append(role_id)
+    if not missing:
+        return result
+
+    try:
+        cache = Cache()
+        versions = [
+            int(value or 0)
+            for value in cache.get_many([_version_key(role_id) for role_id in missing])
+        ]
+        snapshots = cache.get_many(
+            [_snapshot_key(role_id, version) for role_id, version in zip(missing, versions)]
+        )
+    except RedisError:
+        versions, snapshots = None, [None] * len(missing)
+
+    to_load = [
+        role_id
+        for role_id, permissions in zip(missing, snapshots)
+        if permissions is None or role_id in pending
+    ]
+    loaded = {role_id: [] for role_id in to_load}
+    if to_load:
+        rows = (
+            Permission.objects.filter(roles__id__in=to_load)
+            .order_by("module", "name")
+            .values("roles__id", "id", "name", "module")
+        )
+        for row in rows:
+            role_id = row.pop("roles__id")
+            loaded[role_id].append(row)
+
+    fresh = {}
+    for index, role_id in enumerate(missing):
+        permissions = loaded.get(role_id, snapshots[index])
+        capabilities = RoleCapabilities.from_permissions(permissions)
+        result[role_id] = capabilities
+        if versions is None or role_id in pending:
+            continue
+        if role_id in loaded:
+            fresh[_snapshot_key(role_id, versions[index])] = permissions
+        with _lock:
+            _local[role_id] = (versions[index], capabilities, now)
+
+    if fresh:
+        try:
+            cache.set_many(fresh, ttl=PERMISSION_CACHE_TTL)
+        except RedisError:
+            pass
+    return result
+
+
+def get_role_permissions(role_id: Optional[int]) -> FrozenSet[str]:
+    """Return the permission names granted to a role."""
+    return get_role_capabilities(role_id).names
+
+
+def _bump(keys: Iterable[str]):
+    cache = Cache()
+    for key in keys:
+        try:
+            cache.incr(key)
+        except RedisError:
+            # Other workers keep their copy until Redis is back; the next
+            # successful bump invalidates it.
+            pass
+
+
+def _bump_roles(role_ids):
+    _bump(_version_key(role_id) for role_id in role_ids)
+    _pending_roles().difference_update(role_ids)
+    for role_id in role_ids:
+        invalidation.publish(_version_key(role_id))
+
+
+def _evict(namespace: str):
+    with _lock:
+        if namespace == invalidation.FLUSH_ALL:
+            _local.clear()
+            return
+        try:
+            role_id = int(namespace.split(":")[1])
+        except (IndexError, ValueError):
+            return
+        _local.pop(role_id, None)
+
+
+invalidation.subscribe("role:", _evict)
+
+
+def invalidate_roles(role_ids: Iterable[int]):
+    """
+    Bump the version of the given roles once the current transaction commits,
+    so no worker can cache the pre-commit state under the new version. Until
+    then this thread reads those roles from the database; a rollback drops
+    them again.
+    """
+    role_ids = {role_id for role_id in role_ids if role_id is not None}
+    if not role_ids:
+        return
+    _pending_roles().update(role_ids)
+    with _lock:
+        for role_id in role_ids:
+            _local.pop(role_id, None)
+    transaction.on_commit(lambda: _bump_roles(role_ids))
+
+
+def invalidate_users(user_ids: Iterable[int]):
+    """Bump the auth version of the given users once the transaction commits."""
+    keys = [_user_version_key(user_id) for user_id in user_ids if user_id is not None]
+    if keys:
+        transaction.on_commit(lambda: _bump(keys))
@@ -1,5 +1,10 @@
 from django.contrib.auth import authenticate
 from rest_framework import serializers
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from user.models import CustomUser
+from user.tokens import ClaimsRefreshToken
 from .user import UserMinimalSerializer
 
 
@@ -56,5 +61,52 @@ class LoginResponseSerializer(serializers.Serializer):
     """Serializer for login response."""
 
     token = serializers.CharField(help_text="Authentication token")
+    refresh = serializers.CharField(help_text="Refresh token")
     user = UserMinimalSerializer(help_text="User details")
     message = serializers.CharField(help_text="Response message")
+
+
+class TokenRefreshSerializer(serializers.Serializer):
+    """Exchange a refresh token for a new access/refresh pair."""
+
+    refresh = serializers.CharField(help_text="Refresh token issued at login")
+
+    def validate(self, attrs):
+        try:
+            refresh = ClaimsRefreshToken(attrs["refresh"])
+        except TokenError:
+            raise serializers.ValidationError(
+                "Refresh token is invalid or expired.", code="token_not_valid"
+            )
+
+        user = (
+            CustomUser.objects.select_related("role")
+            .filter(**{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]})
+            .first()
+        )
+        if user is None or not user.is_active:
+            raise serializers.ValidationError(
+                "This account is no longer active.", code="authorization"
+            )
+
+        if api_settings.BLACKLIST_AFTER_ROTATION:
+            # Whoever blacklists the token first wins, so a refresh token can
+            # only ever be rotated once even under concurrent requests.
+            _, created = refresh.blacklist()
+            if not created:
+                raise serializers.ValidationError(
+                    "Refresh token is invalid or expired.", code="token_not_valid"
+                )
+
+        attrs["user"] = user
+        attrs["token"] = ClaimsRefreshToken.for_user(
+            user, remember_me=refresh.get("remember_me", False)
+        )
+        return attrs
+
+
+class TokenRefreshResponseSerializer(serializers.Serializer):
+    """Serializer for token refresh response."""
+
+    token = serializers.CharField(help_text="Authentication token")
+    refresh = serializers.CharField(help_text="Refresh token")
\ No newline at end of file
@@ -1,7 +1,9 @@
+from django.db import models
 from rest_framework import serializers
 
 from utils.utils import ADMIN_SIDEBAR_MODULES
 from user.models.admin import Permission, Role
+from user.permission_cache import get_role_capabilities, get_roles_capabilities
 
 
 class PermissionSerializer(serializers.ModelSerializer):
@@ -19,14 +21,39 @@ class PermissionMinimalSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "module"]
 
 
-class RoleSerializer(serializers.ModelSerializer):
+class RoleCapabilitiesMixin:
+    """Read a role's permissions and module lists from its cached snapshot."""
+
+    capabilities_role_field = "pk"
+
+    def get_capabilities(self, obj):
+        role_id = getattr(obj, self.capabilities_role_field)
+        snapshots = self.__dict__.setdefault("_capabilities", {})
+        if role_id not in snapshots:
+            snapshots[role_id] = get_role_capabilities(role_id)
+        return snapshots[role_id]
+
+    def prime_capabilities(self, objs):
+        role_ids = {getattr(obj, self.capabilities_role_field) for obj in objs}
+        snapshots = self.__dict__.setdefault("_capabilities", {})
+        snapshots.update(get_roles_capabilities(role_ids - snapshots.keys()))
+
+
+class RoleCapabilitiesListSerializer(serializers.ListSerializer):
+    """Load the snapshots of every role on the page in one go."""
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        self.child.prime_capabilities(items)
+        return super().to_representation(items)
+
+
+class RoleSerializer(RoleCapabilitiesMixin, serializers.ModelSerializer):
     
     permissions = serializers.PrimaryKeyRelatedField(
         queryset=Permission.objects.all(), many=True, required=False, write_only=True
     )
-    permission_details = PermissionMinimalSerializer(
-        source="permissions", many=True, read_only=True
-    )
+    permission_details = serializers.SerializerMethodField()
     create_once = serializers.BooleanField(write_only=True, required=False, default=False)
     parent_name = serializers.CharField(source="parent.name", read_only=True)
     allowed_modules = serializers.SerializerMethodField()
@@ -34,6 +61,7 @@ class RoleSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Role
+        list_serializer_class = RoleCapabilitiesListSerializer
         fields = [
             "id",
             "name",
@@ -70,26 +98,24 @@ class RoleSerializer(serializers.ModelSerializer):
                     )
             return super().validate(attrs)
 
+    def get_permission_details(self, obj):
+        return list(self.get_capabilities(obj).permissions)
+
     def get_allowed_modules(self, obj):
-        modules = set()
-        for permission in obj.permissions.all():
-            modules.add(permission.module)
-        return list(modules)
+        return list(self.get_capabilities(obj).modules)
 
     def get_sidebar_modules(self, obj):
-        modules = set()
-        for permission in obj.permissions.all():
-            modules.add(permission.module)
-        return list(modules.union(set(ADMIN_SIDEBAR_MODULES)))
+        return list(self.get_capabilities(obj).sidebar_modules)
 
 
-class RoleMinimalSerializer(serializers.ModelSerializer):
-    permissions = PermissionMinimalSerializer(many=True, read_only=True)
+class RoleMinimalSerializer(RoleCapabilitiesMixin, serializers.ModelSerializer):
+    permissions = serializers.SerializerMethodField()
     allowed_modules = serializers.SerializerMethodField()
     sidebar_modules = serializers.SerializerMethodField()
 
     class Meta:
         model = Role
+        list_serializer_class = RoleCapabilitiesListSerializer
         fields = [
             "name",
             "code",
@@ -99,14 +125,12 @@ class RoleMinimalSerializer(serializers.ModelSerializer):
             "permissions",
         ]
 
+    def get_permissions(self, obj):
+        return list(self.get_capabilities(obj).permissions)
+
     def get_allowed_modules(self, obj):
-        modules = set()
-        for permission in obj.permissions.all():
-            modules.add(permission.module)
-        return list(modules)
+        return list(self.get_capabilities(obj).modules)
 
     def get_sidebar_modules(self, obj):
-        modules = set()
-        for permission in obj.permissions.all():
-            modules.add(permission.module)
-        return list(modules.intersection(set(ADMIN_SIDEBAR_MODULES)))
+        modules = self.get_capabilities(obj).modules
+        return [module for module in modules if module in ADMIN_SIDEBAR_MODULES]
@@ -1,9 +1,12 @@
 from rest_framework import serializers
+from user.models.admin import Role
 from user.models.models import (CustomUser, Department, StaffActivity,
-                         PerformanceRecord)
+                         PerformanceRecord, NO_ROLE_DISPLAY)
 from correspondence.models import Correspondence
 from tasks.serializers import TaskSummarySerializer 
 from django.contrib.auth import get_user_model
+from utils.fragments import FragmentCachedListSerializer
+from utils.serialization import SparseFieldsMixin, ValuesField
 
 User = get_user_model()
 
@@ -41,15 +44,44 @@ class PerformanceRecordSerializer(serializers.ModelSerializer):
             'completion_rate', 'on_time_rate'
         ]
 
-class StaffListSerializer(serializers.ModelSerializer):
+class StaffListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Lightweight serializer for staff directory listing."""
     department_name = serializers.CharField(source='department.name', read_only=True)
     location_display = serializers.CharField(source='get_location_display', read_only=True)
     initials = serializers.ReadOnlyField()
     profile_photo_url = serializers.SerializerMethodField()
 
+    location_labels = dict(CustomUser._meta.get_field('location').flatchoices)
+    values_fields = {
+        'location_display': ValuesField(
+            'location',
+            func=lambda serializer, location: (
+                None if location is None
+                else str(serializer.location_labels.get(location, location))
+            ),
+        ),
+        'role_display': ValuesField(
+            'role',
+            'role__name',
+            func=lambda serializer, role_id, role_name: (
+                role_name if role_id is not None else NO_ROLE_DISPLAY
+            ),
+        ),
+        'initials': ValuesField(
+            'name',
+            'email',
+            func=lambda serializer, name, email: CustomUser.initials_for(name, email),
+        ),
+        'profile_photo_url': ValuesField(
+            'profile_photo',
+            func=lambda serializer, photo: serializer.photo_url(photo),
+        ),
+    }
+    fragment_depends_on = (Department, Role)
+
     class Meta:
         model = CustomUser
+        list_serializer_class = FragmentCachedListSerializer
         fields = [
             'id', 'name', 'email', 'employee_id',
             'department_name', 'location', 'location_display',
@@ -57,14 +89,23 @@ class StaffListSerializer(serializers.ModelSerializer):
             'is_active'
         ]
 
-    def get_profile_photo_url(self, obj):
-        if obj.profile_photo:
+    def photo_url(self, photo):
+        # profile_photo is a URL field: absolute-ize it, it has no .url.
+        if photo:
             request = self.context.get('request')
             if request:
-                return request.build_absolute_uri(obj.profile_photo.url)
-            return obj.profile_photo.url
+                return request.build_absolute_uri(photo)
+            return photo
         return None
 
+    def get_profile_photo_url(self, obj):
+        return self.photo_url(obj.profile_photo)
+
+    def fragment_variant(self):
+        # profile_photo_url is absolute on the request's host.
+        request = self.context.get('request')
+        return request.build_absolute_uri('/') if request else None
+
 class StaffProfileSerializer(serializers.ModelSerializer):
     department = serializers.StringRelatedField()
     activity = StaffActivitySerializer(many=True, source='staffactivity_set', read_only=True)
@@ -0,0 +1,79 @@
+import logging
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from user.models import CustomUser
+from user.models.admin import Permission, Role
+from user.models.models import Department
+from user.permission_cache import invalidate_roles, invalidate_users
+from user.tokens import mark_blacklist_cold, mark_blacklisted
+from utils.caching import track_model_versions
+
+logger = logging.getLogger(__name__)
+
+track_model_versions(CustomUser, Department, Permission, Role)
+
+
+@receiver(m2m_changed, sender=Role.permissions.through)
+def role_permissions_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_roles([instance.pk])
+        return
+
+    # Changed from the permission side: instance is a Permission.
+    if action == "pre_clear":
+        instance._cleared_role_ids = list(instance.roles.values_list("id", flat=True))
+    elif action in ("post_add", "post_remove"):
+        invalidate_roles(pk_set or [])
+    elif action == "post_clear":
+        invalidate_roles(getattr(instance, "_cleared_role_ids", []))
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def role_changed(sender, instance, **kwargs):
+    invalidate_roles([instance.pk])
+
+
+@receiver(post_save, sender=Permission)
+def permission_saved(sender, instance, created, **kwargs):
+    if not created:
+        # A rename changes the cached names of every role holding it.
+        invalidate_roles(instance.roles.values_list("id", flat=True))
+
+
+@receiver(pre_delete, sender=Permission)
+def permission_deleted(sender, instance, **kwargs):
+    invalidate_roles(list(instance.roles.values_list("id", flat=True)))
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def user_changed(sender, instance, **kwargs):
+    invalidate_users([instance.pk])
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def token_blacklisted(sender, instance, created, **kwargs):
+    if not created:
+        return
+    jti, expires_at = instance.token.jti, instance.token.expires_at
+
+    def mirror():
+        try:
+            mark_blacklisted(jti, expires_at)
+        except RedisError:
+            # The mirror is now incomplete: mark it cold so lookups fall back
+            # to the database until the next warm_blacklist_cache run.
+            logger.warning("Could not mirror blacklisted token %s", jti, exc_info=True)
+            try:
+                mark_blacklist_cold()
+            except RedisError:
+                logger.error("Could not mark the token blacklist mirror cold", exc_info=True)
+
+    transaction.on_commit(mirror)
@@ -1,5 +1,7 @@
 from celery import shared_task
+from django.core.management import call_command
 from core.resources.email_service_v2 import EmailClientV2
+from user.tokens import warm_blacklist_cache
 
 from django.contrib.auth import get_user_model
 
@@ -82,3 +84,10 @@ User = get_user_model()
 def recalculate_user_performance(self, user_id):
     user = User.objects.get(id=user_id)
     update_user_avg_task_time(user)
+
+
+@shared_task
+def flush_expired_tokens_task():
+    """Prune expired outstanding/blacklisted JWTs and re-warm the Redis mirror."""
+    call_command("flushexpiredtokens")
+    return warm_blacklist_cache()
@@ -1,3 +1,173 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.management import call_command
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from redis.exceptions import RedisError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from core.resources.cache import Cache
+from user import permission_cache
+from user.authentication import ClaimsJWTAuthentication
+from user.models import CustomUser
+from user.models.admin import Role
+from user.models.models import PerformanceRecord, StaffActivity
+from user.throttling import LoginIPThrottle
+from user.tokens import ClaimsRefreshToken, is_blacklisted, warm_blacklist_cache
+from utils.testing import APIQueryBudgetTestCase
+
+
+class AuthQueryTests(APIQueryBudgetTestCase):
+    def test_login(self):
+        for role in ("super_admin", "staff"):
+            with self.subTest(role=role):
+                self.assertQueryBudget(
+                    13,
+                    "post",
+                    "/v1/auth/login/",
+                    data={"login": f"{role}@tests.local", "password": "password"},
+                    status=200,
+                )
+
+    def test_token_refresh(self):
+        response, _ = self.request(
+            "post",
+            "/v1/auth/login/",
+            data={"login": "staff@tests.local", "password": "password"},
+        )
+        refresh = response.json()["data"]["refresh"]
+        self.assertQueryBudget(
+            8, "post", "/v1/auth/token/refresh/", data={"refresh": refresh}, status=200
+        )
+
+    def test_change_password(self):
+        data = {
+            "current_password": "password",
+            "new_password": "N3w-password!",
+            "confirm_password": "N3w-password!",
+        }
+        self.assertQueryBudget(
+            1, "post", "/v1/auth/change-password/", self.users["staff"], data, 200
+        )
+
+
+class StaffProfileQueryTests(APIQueryBudgetTestCase):
+    def test_profile(self):
+        self.assertQueryBudgetByRole(
+            5,
+            "get",
+            "/v1/auth/staff/profile/",
+            {"super_admin": 200, "hr": 200, "staff": 200, "no_role": 200},
+        )
+
+    def test_performance_overview(self):
+        PerformanceRecord.objects.bulk_create(
+            PerformanceRecord(user=user, tasks_assigned=4, tasks_completed=3)
+            for user in self.users.values()
+        )
+        self.assertQueryBudget(1, "get", "/v1/auth/performance/overview/", status=200)
+
+
+class LoginIPThrottleTests(SimpleTestCase):
+    def setUp(self):
+        Cache().flush()
+        self.factory = APIRequestFactory()
+
+    def attempts(self, forwarded_for):
+        throttle = LoginIPThrottle()
+        allowed = 0
+        for index in range(35):
+            request = self.factory.post(
+                "/v1/auth/login/",
+                REMOTE_ADDR="127.0.0.1",
+                HTTP_X_FORWARDED_FOR=forwarded_for(index),
+            )
+            allowed += throttle.allow_request(Request(request), None)
+        return allowed
+
+    def test_rotating_forwarded_for_behind_proxy(self):
+        # The client's own header comes first; the proxy appends the real address.
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}):
+            self.assertEqual(self.attempts(lambda index: f"10.0.0.{index}, 203.0.113.7"), 30)
+
+    def test_forwarded_for_ignored_without_proxy(self):
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 0}):
+            self.assertEqual(self.attempts(lambda index: f"10.0.0.{index}"), 30)
+
+
+class BlacklistMirrorTests(TestCase):
+    def test_failed_mirror_write_falls_back_to_the_database(self):
+        user = CustomUser.objects.create_user(email="mirror@tests.local", password="password")
+        refresh = ClaimsRefreshToken.for_user(user)
+        jti = refresh[api_settings.JTI_CLAIM]
+        warm_blacklist_cache()
+        self.assertIs(is_blacklisted(jti), False)
+
+        with mock.patch("user.signals.mark_blacklisted", side_effect=RedisError):
+            with self.assertLogs("user.signals", "WARNING"):
+                with self.captureOnCommitCallbacks(execute=True):
+                    refresh.blacklist()
+
+        self.assertIsNone(is_blacklisted(jti))
+        with self.assertRaises(TokenError):
+            refresh.check_blacklist()
+
+
+class SeedStaffDataTests(TestCase):
+    def test_command_runs_twice(self):
+        CustomUser.objects.create_user(email="gm@kmdmc.go.tz", password="password", name="GM")
+        for _ in range(2):
+            call_command("seed_staff_data", stdout=StringIO())
+        sarah = CustomUser.objects.get(email="sarah.jenkins@kmdmc.go.tz")
+        self.assertEqual(sarah.assigned_tasks.count(), 3)
+        self.assertEqual(PerformanceRecord.objects.filter(user=sarah).count(), 12)
+        self.assertTrue(StaffActivity.objects.filter(user=sarah).exists())
+
+
+class PendingRoleTests(TransactionTestCase):
+    def setUp(self):
+        Cache().flush()
+        self.role = Role.objects.create(code="PENDING_ROLE", name="Pending role")
+
+    def test_rollback_drops_pending_roles(self):
+        permission_cache.get_role_capabilities(self.role.id)
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                permission_cache.invalidate_roles([self.role.id])
+                self.assertIn(self.role.id, permission_cache._pending_roles())
+                raise RuntimeError
+        self.assertNotIn(self.role.id, permission_cache._pending_roles())
+
+        # The role is cached again rather than read from the database each time.
+        permission_cache.get_role_capabilities(self.role.id)
+        with self.assertNumQueries(0):
+            permission_cache.get_role_capabilities(self.role.id)
+
+    def test_commit_bumps_the_version(self):
+        version = permission_cache.get_role_version(self.role.id)
+        with transaction.atomic():
+            permission_cache.invalidate_roles([self.role.id])
+        self.assertNotIn(self.role.id, permission_cache._pending_roles())
+        self.assertEqual(permission_cache.get_role_version(self.role.id), version + 1)
+
+
+class ClaimsUserTests(TestCase):
+    def test_deferred_fields_load_in_one_query(self):
+        user = CustomUser.objects.create_user(
+            email="claims@tests.local", password="password", name="Claims User",
+            employee_id="KMD-1234", bio="Bio",
+        )
+        token = ClaimsRefreshToken.for_user(user).access_token
+        claims_user = ClaimsJWTAuthentication().build_user(token)
+        self.assertTrue(claims_user.get_deferred_fields())
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                (claims_user.employee_id, claims_user.bio, claims_user.date_joined),
+                (user.employee_id, user.bio, user.date_joined),
+            )
+        self.assertFalse(claims_user.get_deferred_fields())
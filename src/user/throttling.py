@@ -0,0 +1,133 @@
+"""
+Redis token-bucket throttles for the login endpoint.
+
+Every login attempt costs a full password hash, so bursts are rejected before
+the view runs: DRF checks throttles ahead of request validation, and a
+rejection is a single Redis script call with no hashing or database access.
+Buckets live in Redis so all workers share the same counters; on the
+local-memory cache fallback the same algorithm runs in-process.
+
+Rates use DRF's "<count>/<period>" syntax from
+REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]; a bucket holds ``count`` tokens and
+refills at ``count`` per period.
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from redis.exceptions import RedisError
+from rest_framework.throttling import SimpleRateThrottle
+
+from core.resources.cache import Cache
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1] bucket; ARGV capacity, refill rate (tokens/second), tokens requested.
+# Returns {allowed (0/1), seconds until enough tokens are available}.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+    allowed = 1
+else
+    wait = (requested - tokens) / rate
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(wait)}
+"""
+
+_script = None
+_local_lock = threading.Lock()
+
+
+def _consume_local(cache, key, capacity, rate, requested):
+    with _local_lock:
+        now = time.time()
+        tokens, ts = cache.get(key) or (capacity, now)
+        tokens = min(capacity, tokens + max(0, now - ts) * rate)
+        allowed, wait = 0, 0
+        if tokens >= requested:
+            tokens -= requested
+            allowed = 1
+        else:
+            wait = (requested - tokens) / rate
+        cache.set(key, (tokens, now), ttl=math.ceil(capacity / rate) + 1)
+    return allowed, wait
+
+
+def consume(key, capacity, rate, requested=1):
+    """Take ``requested`` tokens from the bucket; returns (allowed, wait)."""
+    global _script
+    cache = Cache()
+    client = cache.client
+    if client is None:
+        return _consume_local(cache, key, capacity, rate, requested)
+    if _script is None:
+        _script = client.register_script(TOKEN_BUCKET_SCRIPT)
+    return _script(keys=[cache.make_key(key)], args=[capacity, rate, requested])
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Token bucket keyed by ``get_cache_key``. Fails open when Redis is down so
+    an outage doesn't lock everyone out of login.
+    """
+
+    cache_format = "throttle:%(scope)s:%(ident)s"
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        key = self.get_cache_key(request, view)
+        if key is None:
+            return True
+
+        try:
+            allowed, wait = consume(
+                key, self.num_requests, self.num_requests / self.duration
+            )
+        except RedisError:
+            logger.warning("Login throttle unavailable, allowing request", exc_info=True)
+            return True
+
+        self._wait = float(wait)
+        return bool(allowed)
+
+    def wait(self):
+        return getattr(self, "_wait", None)
+
+
+class LoginIPThrottle(TokenBucketThrottle):
+    scope = "login_ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginEmailThrottle(TokenBucketThrottle):
+    scope = "login_email"
+
+    def get_cache_key(self, request, view):
+        email = request.data.get("login") if hasattr(request.data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None
+        # Hash the normalised address so the key doesn't store the email.
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
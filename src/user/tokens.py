@@ -0,0 +1,111 @@
+"""
+JWTs carrying enough about the user to authenticate read requests without a
+database lookup (see user.authentication.ClaimsJWTAuthentication).
+"""
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from redis.exceptions import RedisError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.resources.cache import Cache
+from user.permission_cache import get_auth_versions
+
+USER_CLAIMS = ("name", "email", "role_id", "is_active", "is_admin", "is_superuser")
+
+
+def add_user_claims(token, user):
+    """Stamp the user's current identity, role and auth versions onto ``token``."""
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    token["role_name"] = user.role.name if user.role_id else None
+
+    try:
+        user_version, role_version = get_auth_versions(user.pk, user.role_id)
+    except RedisError:
+        # Without versions the token can't be validated statelessly, so
+        # authentication always loads the user from the database.
+        return token
+
+    token["user_version"] = user_version
+    token["perm_version"] = role_version
+    return token
+
+
+# Blacklisted JTIs are mirrored into Redis until their token expires. While
+# the warm marker exists the mirror is complete, so a miss means "not
+# blacklisted" and the database isn't consulted at all.
+BLACKLIST_WARM_KEY = "jwt:blacklist:warm"
+BLACKLIST_WARM_TTL = 60 * 60 * 36
+
+
+def _blacklist_key(jti) -> str:
+    return f"jwt:blacklist:{jti}"
+
+
+def mark_blacklisted(jti, expires_at: datetime):
+    ttl = int((expires_at - datetime.now(timezone.utc)).total_seconds())
+    if ttl > 0:
+        Cache().set(_blacklist_key(jti), 1, ttl=ttl)
+
+
+def mark_blacklist_cold():
+    """Drop the warm marker so lookups go to the database until re-warmed."""
+    Cache().delete(BLACKLIST_WARM_KEY)
+
+
+def is_blacklisted(jti):
+    """
+    Return True/False from the Redis mirror, or None when it can't answer
+    (cache cold or Redis unavailable) and the database must be checked.
+    """
+    try:
+        hit, warm = Cache().get_many([_blacklist_key(jti), BLACKLIST_WARM_KEY])
+    except RedisError:
+        return None
+    if hit:
+        return True
+    return False if warm else None
+
+
+def warm_blacklist_cache() -> int:
+    """Mirror every unexpired blacklisted JTI into Redis and mark it complete."""
+    now = datetime.now(timezone.utc)
+    tokens = BlacklistedToken.objects.filter(token__expires_at__gt=now).values_list(
+        "token__jti", "token__expires_at"
+    )
+    count = 0
+    for jti, expires_at in tokens.iterator(chunk_size=2000):
+        mark_blacklisted(jti, expires_at)
+        count += 1
+    Cache().set(BLACKLIST_WARM_KEY, 1, ttl=BLACKLIST_WARM_TTL)
+    return count
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """
+    Refresh token whose derived access tokens carry the user claims.
+
+    ``remember_me`` is kept as a claim so rotated tokens get the same extended
+    lifetime as the one issued at login. Blacklist checks go to the Redis
+    mirror first.
+    """
+
+    @classmethod
+    def for_user(cls, user, remember_me=False):
+        token = add_user_claims(super().for_user(user), user)
+        if remember_me:
+            token["remember_me"] = True
+            token.set_exp(lifetime=settings.REMEMBER_ME_REFRESH_LIFETIME)
+        return token
+
+    def check_blacklist(self):
+        blacklisted = is_blacklisted(self.payload[api_settings.JTI_CLAIM])
+        if blacklisted is None:
+            return super().check_blacklist()
+        if blacklisted:
+            raise TokenError(_("Token is blacklisted"))
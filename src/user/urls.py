@@ -1,6 +1,6 @@
 from django.urls import path
 
-from user.views.login import LoginView
+from user.views.login import LoginView, TokenRefreshView
 from user.views.register import RegisterView
 from user.views.password import (
     ChangePasswordView,
@@ -17,6 +17,7 @@ app_name = "user"
 urlpatterns = [
     # Authentication
     path("login/", LoginView.as_view(), name="login"),
+    path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("register/", RegisterView.as_view(), name="register"),
     path("logout/", LogoutView.as_view(), name="logout"),
     
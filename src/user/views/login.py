@@ -1,11 +1,13 @@
 from rest_framework import status
+from rest_framework.exceptions import Throttled
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import AllowAny
 from utils.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 from audit.enums import AuditModuleEnum, AuditStatusEnum, AuditTypeEnum, LogParams
-from user.serializers.login import LoginSerializer
+from user.serializers.login import LoginSerializer, TokenRefreshSerializer
 from user.serializers.user import UserMinimalSerializer
+from user.throttling import LoginEmailThrottle, LoginIPThrottle
+from user.tokens import ClaimsRefreshToken
 from utils.activity_log import extract_api_request_metadata
 from audit.tasks import log_audit_event_task
 
@@ -15,6 +17,19 @@ class LoginView(GenericAPIView):
     serializer_class = LoginSerializer
     permission_classes = [AllowAny]
     authentication_classes = []
+    throttle_classes = [LoginIPThrottle, LoginEmailThrottle]
+
+    def handle_exception(self, exc):
+        if isinstance(exc, Throttled):
+            response = Response(
+                success=False,
+                message="Too many login attempts. Please try again later.",
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
+            if exc.wait is not None:
+                response["Retry-After"] = str(max(1, round(exc.wait)))
+            return response
+        return super().handle_exception(exc)
 
     def post(self, request):
         
@@ -31,10 +46,7 @@ class LoginView(GenericAPIView):
         user = serializer.validated_data["user"]
         remember_me = serializer.validated_data.get("remember_me", False)
 
-        refresh = RefreshToken.for_user(user)
-        
-        if remember_me:
-            refresh.set_exp(lifetime=30 * 24 * 60 * 60)
+        refresh = ClaimsRefreshToken.for_user(user, remember_me=remember_me)
 
         user_data = UserMinimalSerializer(user).data
         event = LogParams(
@@ -55,7 +67,41 @@ class LoginView(GenericAPIView):
             message=f"Welcome back, {user.name}!",
             data={
                 "token": str(refresh.access_token),
+                "refresh": str(refresh),
                 "user": user_data,
             },
             status_code=status.HTTP_200_OK,
         )
+
+
+class TokenRefreshView(GenericAPIView):
+    """
+    Rotate a refresh token into a new access/refresh pair. The old refresh
+    token is blacklisted, so each one can be used only once.
+    """
+
+    serializer_class = TokenRefreshSerializer
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+
+        if not serializer.is_valid():
+            return Response(
+                success=False,
+                message="Validation error",
+                errors=serializer.errors,
+                status_code=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        refresh = serializer.validated_data["token"]
+        return Response(
+            success=True,
+            message="Token refreshed successfully.",
+            data={
+                "token": str(refresh.access_token),
+                "refresh": str(refresh),
+            },
+            status_code=status.HTTP_200_OK,
+        )
@@ -113,4 +113,5 @@ class ChangePasswordView(GenericAPIView):
         return Response(
             success=True,
             message="Password changed successfully.",
+            status_code=status.HTTP_200_OK,
         )
\ No newline at end of file
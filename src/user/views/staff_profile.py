@@ -1,3 +1,4 @@
+from django.db.models import Count, Q
 from rest_framework import status, generics
 from utils.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -8,6 +9,9 @@ from user.serializers.staff_profile import (
 )
 from user.serializers.user import PerformanceOverviewSerializer
 from user.models.models import PerformanceRecord
+from utils.caching import coalesce_response
+
+PERFORMANCE_OVERVIEW_CACHE_TTL = 60 * 5
 
 class StaffProfileView(APIView):
     """View for current user's profile."""
@@ -30,9 +34,19 @@ class PerformanceOverviewView(generics.GenericAPIView):
     authentication_classes = []
     serializer_class = PerformanceOverviewSerializer
 
+    @coalesce_response(ttl=PERFORMANCE_OVERVIEW_CACHE_TTL)
     def get(self, request):
         """Retrieve performance overview data."""
-        queryset = PerformanceRecord.objects.all()
+        queryset = PerformanceRecord.objects.select_related("user__department").annotate(
+            active_tasks=Count(
+                "user__assigned_tasks",
+                filter=Q(user__assigned_tasks__status__in=["pending", "in_progress"]),
+            ),
+            over_due_tasks=Count(
+                "user__assigned_tasks",
+                filter=Q(user__assigned_tasks__status="overdue"),
+            ),
+        )
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
@@ -1,6 +1,8 @@
 from rest_framework import serializers, status
 from rest_framework.generics import GenericAPIView, RetrieveUpdateAPIView, UpdateAPIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.shortcuts import get_object_or_404
 from utils.response import Response 
@@ -17,27 +19,22 @@ class LogoutView(GenericAPIView):
     serializer_class = LogoutSerializer
 
     def post(self, request):
-        try:
-            refresh_token = request.data.get("refresh")
-            if refresh_token:
+        refresh_token = request.data.get("refresh")
+        if refresh_token:
+            try:
                 token = RefreshToken(refresh_token)
-                token.blacklist()
+                # Only the owner of a refresh token can revoke it.
+                if str(token.get(api_settings.USER_ID_CLAIM)) == str(request.user.pk):
+                    token.blacklist()
+            except TokenError:
+                # Already expired or blacklisted: nothing left to revoke.
+                pass
 
-            return Response(
-                {
-                    "success": True,
-                    "message": "Logged out successfully.",
-                },
-                status=status.HTTP_200_OK,
-            )
-        except Exception:
-            return Response(
-                {
-                    "success": True,
-                    "message": "Logged out successfully.",
-                },
-                status=status.HTTP_200_OK,
-            )
+        return Response(
+            success=True,
+            message="Logged out successfully.",
+            status_code=status.HTTP_200_OK,
+        )
 
 
 
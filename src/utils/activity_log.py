@@ -1,3 +1,4 @@
+import ipaddress
 from typing import Any, Dict, Optional, Union
 from uuid import UUID
 
@@ -24,6 +25,12 @@ def get_user_agent(request: HttpRequest) -> str:
 def get_geo_location(ip: str) -> Dict[str, str]:
     if not ip:  # Check if IP is None or an empty string
         return {}
+    try:
+        if not ipaddress.ip_address(ip.strip()).is_global:
+            # Private/loopback addresses can't be located; skip the HTTP lookup.
+            return {}
+    except ValueError:
+        return {}
 
     # Use geocoder to get the city and country from the IP address.
     g = geocoder.ip(ip)
@@ -0,0 +1,309 @@
+"""
+Versioned response caching for rarely-changing reference data.
+
+Each tracked model has a version counter in the cache, bumped (after commit)
+whenever one of its rows is saved or deleted. A cached list payload is stored
+together with the versions of the models it was built from, so a read is a
+single MGET of the payload and the current versions: the payload is served
+only when every version still matches.
+
+get_or_compute (and the coalesce_response decorator built on it) covers
+TTL-cached aggregates instead: one worker recomputes an expired value under a
+short lock while the others serve the stale copy or wait for it, and values
+are refreshed probabilistically ahead of expiry so popular keys don't all
+expire at once.
+
+VersionedLocalCache applies the same versions to values memoized in process
+memory, for singletons read in tight loops. Version bumps are also announced
+on the invalidation bus (core.resources.invalidation) so every worker evicts
+its local copy straight away.
+"""
+import copy
+import hashlib
+import math
+import random
+import threading
+import time
+import uuid
+from functools import wraps
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from redis.exceptions import RedisError
+from rest_framework.response import Response as DRFResponse
+
+from core.resources import invalidation
+from core.resources.cache import Cache
+
+LIST_CACHE_TTL = 60 * 60 * 24
+# How long an expired aggregate may still be served while it is recomputed.
+STALE_TTL = 60 * 5
+# How long a recompute may hold the single-flight lock.
+COMPUTE_LOCK_TTL = 30
+# How long a worker with nothing to serve waits for another one's recompute.
+COMPUTE_WAIT_TIMEOUT = 5
+COMPUTE_POLL_INTERVAL = 0.05
+# XFetch beta: > 1 favours earlier refreshes, < 1 later ones.
+EARLY_REFRESH_BETA = 1.0
+# How long a process trusts a local value before re-reading model versions
+# when the invalidation bus is down.
+LOCAL_VERSION_CHECK_INTERVAL = 5
+# Upper bound on a local value's age even while the bus is healthy, in case a
+# pub/sub message was lost.
+LOCAL_MAX_AGE = 300
+
+
+def model_version_key(model) -> str:
+    return f"model-version:{model._meta.label_lower}"
+
+
+def bump_model_version(model):
+    def bump():
+        try:
+            Cache().incr(model_version_key(model))
+        except RedisError:
+            # Entries built on the old version live until they expire.
+            pass
+        invalidation.publish(model_version_key(model))
+
+    transaction.on_commit(bump)
+
+
+def track_model_versions(*models):
+    """
+    Bump a model's version on save/delete, and on changes to any of its
+    many-to-many relations. Call from an app's signals module.
+    """
+    for model in models:
+
+        def receiver(sender, model=model, **kwargs):
+            bump_model_version(model)
+
+        uid = f"track-model-version:{model._meta.label_lower}"
+        post_save.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(receiver, sender=model, weak=False, dispatch_uid=uid)
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                receiver,
+                sender=field.remote_field.through,
+                weak=False,
+                dispatch_uid=f"{uid}:{field.name}",
+            )
+
+
+def _list_cache_key(view, request, prefix="list-response") -> str:
+    params = sorted(
+        (key, sorted(values)) for key, values in request.query_params.lists()
+    )
+    digest = hashlib.md5(repr(params).encode(), usedforsecurity=False).hexdigest()
+    return f"{prefix}:{type(view).__module__}.{type(view).__name__}:{digest}"
+
+
+def cache_list_response(*models, ttl=LIST_CACHE_TTL):
+    """
+    Cache the successful responses of a viewset ``list`` per query string,
+    invalidated whenever any of ``models`` changes (see track_model_versions).
+    Apply below permission decorators so access checks still run.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(self, request, *args, **kwargs):
+            cache = Cache()
+            key = _list_cache_key(self, request)
+            version_keys = [model_version_key(model) for model in models]
+            try:
+                cached, *versions = cache.get_many([key, *version_keys])
+            except RedisError:
+                return view_func(self, request, *args, **kwargs)
+            versions = [version or 0 for version in versions]
+
+            if cached is not None and cached["versions"] == versions:
+                return DRFResponse(cached["data"], status=cached["status"])
+
+            response = view_func(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                payload = {
+                    "versions": versions,
+                    "data": response.data,
+                    "status": response.status_code,
+                }
+                try:
+                    cache.set(key, payload, ttl=ttl)
+                except RedisError:
+                    pass
+            return response
+
+        return _wrapped_view
+
+    return decorator
+
+
+def _needs_refresh(entry, beta) -> bool:
+    # XFetch: refresh early with a probability that grows as expiry nears and
+    # with how long the value takes to compute.
+    jitter = entry["delta"] * beta * -math.log(1.0 - random.random())
+    return time.time() + jitter >= entry["expires_at"]
+
+
+def _compute_and_store(cache, key, compute, ttl, stale_ttl, should_cache):
+    started = time.monotonic()
+    value = compute()
+    if should_cache(value):
+        entry = {
+            "value": value,
+            "expires_at": time.time() + ttl,
+            "delta": time.monotonic() - started,
+        }
+        try:
+            cache.set(key, entry, ttl=ttl + stale_ttl)
+        except RedisError:
+            pass
+    return value
+
+
+def get_or_compute(
+    key,
+    compute,
+    ttl,
+    stale_ttl=STALE_TTL,
+    lock_ttl=COMPUTE_LOCK_TTL,
+    wait_timeout=COMPUTE_WAIT_TIMEOUT,
+    beta=EARLY_REFRESH_BETA,
+    should_cache=lambda value: True,
+):
+    """
+    Return the cached value of ``key``, calling ``compute()`` at most once
+    across all workers when it is missing, expired or due an early refresh.
+
+    The worker that takes the lock recomputes; the others keep serving the
+    previous value for up to ``stale_ttl`` seconds after it expired, or, when
+    there is none, wait up to ``wait_timeout`` seconds for the new one before
+    computing it themselves. Values rejected by ``should_cache`` are returned
+    but not stored. Falls back to ``compute()`` when Redis is unavailable.
+    """
+    cache = Cache()
+    try:
+        entry = cache.get(key)
+    except RedisError:
+        return compute()
+    if entry is not None and not _needs_refresh(entry, beta):
+        return entry["value"]
+
+    lock_key = f"{key}:lock"
+    token = uuid.uuid4().hex
+    try:
+        locked = cache.add(lock_key, token, ttl=lock_ttl)
+    except RedisError:
+        return compute()
+
+    if locked:
+        try:
+            return _compute_and_store(cache, key, compute, ttl, stale_ttl, should_cache)
+        finally:
+            try:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+            except RedisError:
+                pass
+
+    if entry is not None:
+        return entry["value"]
+
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(COMPUTE_POLL_INTERVAL)
+        try:
+            entry = cache.get(key)
+        except RedisError:
+            break
+        if entry is not None:
+            return entry["value"]
+    return _compute_and_store(cache, key, compute, ttl, stale_ttl, should_cache)
+
+
+def coalesce_response(ttl, stale_ttl=STALE_TTL):
+    """
+    Cache the successful responses of a read-only view per query string for
+    ``ttl`` seconds, recomputed through get_or_compute so an expiry never sends
+    every concurrent request to the database. Only for views whose response
+    doesn't depend on the requesting user beyond the permission decorators
+    applied above it.
+
+    Below utils.conditional's decorators the key also carries the ETag, so
+    any change to the data starts a new entry rather than serving the old
+    response for up to ``ttl``.
+    """
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(self, request, *args, **kwargs):
+            def compute():
+                response = view_func(self, request, *args, **kwargs)
+                return {"data": response.data, "status": response.status_code}
+
+            key = _list_cache_key(self, request, prefix="coalesced-response")
+            etag = getattr(request, "conditional_etag", None)
+            if etag is not None:
+                key = f"{key}:{etag}"
+            cached = get_or_compute(
+                key,
+                compute,
+                ttl=ttl,
+                stale_ttl=stale_ttl,
+                should_cache=lambda value: value["status"] == 200,
+            )
+            return DRFResponse(cached["data"], status=cached["status"])
+
+        return _wrapped_view
+
+    return decorator
+
+
+class VersionedLocalCache:
+    """
+    Memoize ``loader()`` in process memory until any of ``models`` changes.
+
+    The value is evicted when the invalidation bus announces a version bump for
+    one of the models. While the bus is unhealthy, the shared model versions
+    are re-read at most every ``check_interval`` seconds instead. Callers get a
+    copy, so mutating the result (e.g. through a serializer) never touches the
+    cached value.
+    """
+
+    def __init__(self, loader, *models, check_interval=LOCAL_VERSION_CHECK_INTERVAL):
+        self.loader = loader
+        self.version_keys = [model_version_key(model) for model in models]
+        self.check_interval = check_interval
+        self._entry = None
+        self._lock = threading.Lock()
+        for key in self.version_keys:
+            invalidation.subscribe(key, lambda namespace: self.invalidate())
+
+    def invalidate(self):
+        with self._lock:
+            self._entry = None
+
+    def get(self):
+        now = time.monotonic()
+        entry = self._entry
+        if entry is not None:
+            age = now - entry["checked_at"]
+            if age < self.check_interval or (
+                age < LOCAL_MAX_AGE and invalidation.is_healthy()
+            ):
+                return copy.copy(entry["value"])
+
+        try:
+            versions = [version or 0 for version in Cache().get_many(self.version_keys)]
+        except RedisError:
+            return self.loader()
+
+        if entry is not None and entry["versions"] == versions:
+            entry["checked_at"] = now
+            return copy.copy(entry["value"])
+
+        value = self.loader()
+        with self._lock:
+            self._entry = {"versions": versions, "value": value, "checked_at": now}
+        return copy.copy(value)
@@ -0,0 +1,146 @@
+"""
+Conditional GET support (ETag / Last-Modified) for viewset list and detail
+actions.
+
+Validators are computed before the view runs, from one cheap query:
+
+- lists: ``MAX(updated_at)`` and ``COUNT(*)`` over the filtered queryset,
+- details: the object's ``updated_at``,
+
+combined with the request variant (view, query string, negotiated media type,
+and the serializer's ``fragment_variant`` -- e.g. the date, for fields such as
+``is_overdue`` that change without a write) and the versions of any related models the representation embeds (see
+utils.caching.track_model_versions). A matching ``If-None-Match`` or
+``If-Modified-Since`` returns ``304 Not Modified`` without serializing
+anything; otherwise the regular envelope response gets the validators.
+
+Lists only carry an ETag: a deleted row lowers the count without moving
+``MAX(updated_at)``, so a date alone can't prove a list unchanged. Likewise,
+Last-Modified is left out when related models are involved.
+
+Apply below permission decorators so access checks still run first.
+"""
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from redis.exceptions import RedisError
+
+from core.resources.cache import Cache
+from utils.caching import model_version_key
+from utils.serialization import filtered_model_queryset
+
+
+def _serializer_variant(view):
+    # Same time- or request-dependent parts as the fragment cache key.
+    if not hasattr(view, "get_serializer"):
+        return None
+    serializer = view.get_serializer()
+    if not hasattr(serializer, "fragment_variant"):
+        return None
+    return serializer.fragment_variant()
+
+
+def _variant(view, request):
+    params = sorted(
+        (key, sorted(values)) for key, values in request.query_params.lists()
+    )
+    return (
+        f"{type(view).__module__}.{type(view).__name__}",
+        params,
+        getattr(request, "accepted_media_type", None),
+        _serializer_variant(view),
+    )
+
+
+def _versions(models):
+    if not models:
+        return []
+    keys = [model_version_key(model) for model in models]
+    return [version or 0 for version in Cache().get_many(keys)]
+
+
+def _etag(*parts) -> str:
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'"{digest}"'
+
+
+def _respond(view_func, view, request, args, kwargs, etag, last_modified=None):
+    timestamp = last_modified.timestamp() if last_modified is not None else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is None:
+        # Lets coalesce_response key on the data version (see utils.caching).
+        request.conditional_etag = etag
+        response = view_func(view, request, *args, **kwargs)
+        if response.status_code != 200:
+            return response
+    response["ETag"] = etag
+    if timestamp is not None:
+        response["Last-Modified"] = http_date(timestamp)
+    # Let clients keep the payload but always revalidate it.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_list(*depends_on, field="updated_at"):
+    """ETag a list (or singleton) action from its filtered queryset."""
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(self, request, *args, **kwargs):
+            try:
+                versions = _versions(depends_on)
+            except RedisError:
+                return view_func(self, request, *args, **kwargs)
+
+            fingerprint = (
+                filtered_model_queryset(self)
+                .order_by()
+                .aggregate(last_modified=Max(field), count=Count("pk"))
+            )
+            etag = _etag(
+                _variant(self, request),
+                versions,
+                fingerprint["last_modified"],
+                fingerprint["count"],
+            )
+            return _respond(view_func, self, request, args, kwargs, etag)
+
+        return _wrapped_view
+
+    return decorator
+
+
+def conditional_detail(*depends_on, field="updated_at"):
+    """ETag and Last-Modified a detail action from the object's timestamp."""
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(self, request, *args, **kwargs):
+            try:
+                versions = _versions(depends_on)
+            except RedisError:
+                return view_func(self, request, *args, **kwargs)
+
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            updated_at = (
+                filtered_model_queryset(self)
+                .filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+                .values_list(field, flat=True)
+                .first()
+            )
+            if updated_at is None:
+                # Missing (404) or never stamped: nothing to validate against.
+                return view_func(self, request, *args, **kwargs)
+
+            variant = _variant(self, request)
+            etag = _etag(variant, versions, kwargs[lookup_url_kwarg], updated_at)
+            # A date alone can't validate a representation with extra inputs.
+            last_modified = None if depends_on or variant[-1] is not None else updated_at
+            return _respond(view_func, self, request, args, kwargs, etag, last_modified)
+
+        return _wrapped_view
+
+    return decorator
@@ -0,0 +1,113 @@
+"""
+Per-object fragment cache for list pages.
+
+The same rows show up on many list pages (different filters, orderings and
+page numbers), so serializers that set ``Meta.list_serializer_class =
+FragmentCachedListSerializer`` cache each object's rendered representation
+separately. A page is then built in three steps:
+
+1. the paginated queryset only selects ``(pk, updated_at)``,
+2. one multi-get fetches the fragments for those stamps, together with the
+   versions of the related models the representation embeds,
+3. the misses are loaded in a single ``values_list()`` query, rendered
+   through the compiled serializer (see utils.serialization) and stored.
+
+The key covers the model, pk and ``updated_at``, so saving an object makes
+its old fragment unreachable; they are left to expire. It also covers the
+serializer class, its ``fragment_version`` and the (sparse) field set.
+
+Serializers describe anything else their output depends on with:
+
+- ``fragment_depends_on``: related models whose changes must invalidate
+  every fragment (see utils.caching.track_model_versions),
+- ``fragment_variant(self)``: request- or time-dependent parts of the key,
+  e.g. the host absolute URLs are built for,
+- ``fragment_version``: bump it when the representation changes shape.
+"""
+import hashlib
+from typing import List
+
+from django.db.models import QuerySet
+from redis.exceptions import RedisError
+
+from core.resources.cache import Cache
+from utils.caching import model_version_key
+from utils.serialization import ValuesListSerializer, get_compiled
+
+FRAGMENT_CACHE_TTL = 60 * 60 * 6
+STAMP_FIELD = "updated_at"
+
+
+def _fragment_prefix(child, names) -> str:
+    child_class = type(child)
+    variant = child.fragment_variant() if hasattr(child, "fragment_variant") else ()
+    digest = hashlib.md5(
+        repr((names, variant)).encode(), usedforsecurity=False
+    ).hexdigest()
+    return (
+        f"fragment:{child.Meta.model._meta.label_lower}:"
+        f"{child_class.__module__}.{child_class.__qualname__}:"
+        f"v{getattr(child_class, 'fragment_version', 1)}:{digest}"
+    )
+
+
+class FragmentCachedListSerializer(ValuesListSerializer):
+    """
+    ValuesListSerializer that renders each row from its cached fragment and
+    only queries and renders the rows missing from the cache.
+    """
+
+    @classmethod
+    def list_queryset(cls, child_class, names, queryset: QuerySet) -> QuerySet:
+        return queryset.values_list("pk", STAMP_FIELD)
+
+    def render_rows(self, rows) -> List[dict]:
+        child = self.child
+        names = tuple(child.fields)
+        prefix = _fragment_prefix(child, names)
+        keys = [
+            f"{prefix}:{pk}:{stamp.isoformat() if stamp is not None else ''}"
+            for pk, stamp in rows
+        ]
+        version_keys = [
+            model_version_key(model) for model in getattr(child, "fragment_depends_on", ())
+        ]
+
+        cache = Cache()
+        try:
+            found = cache.get_many([*version_keys, *keys])
+        except RedisError:
+            cache, found = None, [None] * (len(version_keys) + len(keys))
+        versions = [version or 0 for version in found[: len(version_keys)]]
+        cached = found[len(version_keys):]
+
+        fragments = {}
+        misses = []
+        for (pk, _), entry in zip(rows, cached):
+            if entry is not None and entry["versions"] == versions:
+                fragments[pk] = entry["data"]
+            else:
+                misses.append(pk)
+
+        if misses:
+            compiled = get_compiled(type(child), names)
+            queryset = child.Meta.model._default_manager.filter(pk__in=misses)
+            miss_rows = list(compiled.values_queryset(queryset, "pk"))
+            rendered = compiled.to_representation(child, miss_rows)
+            fresh = {row[-1]: data for row, data in zip(miss_rows, rendered)}
+            fragments.update(fresh)
+            if cache is not None and fresh:
+                key_for = dict(zip((pk for pk, _ in rows), keys))
+                try:
+                    cache.set_many(
+                        {
+                            key_for[pk]: {"versions": versions, "data": data}
+                            for pk, data in fresh.items()
+                        },
+                        ttl=FRAGMENT_CACHE_TTL,
+                    )
+                except RedisError:
+                    pass
+
+        # Rows deleted since the page was selected are left out.
+        return [fragments[pk] for pk, _ in rows if pk in fragments]
@@ -0,0 +1,348 @@
+"""
+Fast read-only serialization for list endpoints.
+
+A ModelSerializer resolves every field's ``source`` attribute by attribute on
+a model instance, which dominates the cost of large list pages. Serializers
+that set ``Meta.list_serializer_class = ValuesListSerializer`` are instead
+compiled once into a ``values_list()`` column list plus one converter per
+field, and list rows are built straight from the result tuples. The output is
+the same as the regular serializer's: values still go through each field's
+``to_representation`` and fields on a missing relation are left out, exactly
+as DRF skips them.
+
+Plain fields and dotted ``source`` paths across forward foreign keys compile
+automatically. Anything else (method fields, model properties) must be
+described in the serializer's ``values_fields`` mapping with a ValuesField.
+
+Views opt in with ValuesListMixin, which filters the ``list`` action down to
+the ``values_list()`` form of the queryset so rows never become model
+instances.
+
+SparseFieldsMixin adds ``?fields=``/``?exclude=`` to a serializer. On the
+values path a narrowed serializer compiles to fewer columns, joins and
+annotations; other list querysets are narrowed with ``only()``.
+"""
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import QuerySet
+from django.db.models.manager import BaseManager
+from django.db.models.query import ModelIterable
+from rest_framework import serializers
+from rest_framework.fields import Field
+from rest_framework.relations import PrimaryKeyRelatedField
+
+SKIP = object()
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+class ValuesField:
+    """
+    How to build one output field from ``values_list()`` columns.
+
+    ``columns`` are lookups or query expressions (annotated on the fly), and
+    ``func(serializer, *values)`` returns the output value, or SKIP to leave
+    the field out. Without ``func`` the single column is passed through the
+    DRF field's ``to_representation`` (None stays None).
+    """
+
+    def __init__(self, *columns, func: Optional[Callable] = None):
+        self.columns = columns
+        self.func = func
+
+
+class CompiledSerializer:
+    def __init__(self, columns, annotations, fields):
+        # Lookups/aliases to pass to values_list(), in order.
+        self.columns: List[str] = columns
+        self.annotations: Dict[str, object] = annotations
+        # (field name, column indexes, func(serializer, *values))
+        self.fields: List[Tuple[str, Tuple[int, ...], Callable]] = fields
+
+    def values_queryset(self, queryset: QuerySet, *extra) -> QuerySet:
+        """``extra`` lookups are appended after the compiled columns."""
+        if self.annotations:
+            queryset = queryset.annotate(**self.annotations)
+        return queryset.values_list(*self.columns, *extra)
+
+    def to_representation(self, serializer, rows) -> List[dict]:
+        fields = self.fields
+        data = []
+        for row in rows:
+            item = {}
+            for name, indexes, func in fields:
+                value = func(serializer, *[row[index] for index in indexes])
+                if value is not SKIP:
+                    item[name] = value
+            data.append(item)
+        return data
+
+
+def _convert(field: Field):
+    def func(serializer, value):
+        return None if value is None else field.to_representation(value)
+
+    return func
+
+
+def _convert_related(field: Field):
+    def func(serializer, related_pk, value):
+        if related_pk is None:
+            return SKIP
+        return None if value is None else field.to_representation(value)
+
+    return func
+
+
+def _convert_related_pk(field: Field):
+    def func(serializer, related_pk):
+        return SKIP if related_pk is None else field.to_representation(related_pk)
+
+    return func
+
+
+def _pk_related(serializer, value):
+    return value
+
+
+def _resolve_source(model, field: Field):
+    """
+    Walk a field's ``source`` over forward relations; returns the relation
+    names, the cumulative relation lookups and the final model field.
+    """
+    attrs = field.source_attrs
+    if not attrs:
+        raise ImproperlyConfigured(
+            f"Field '{field.field_name}' has source='*'; describe it in values_fields."
+        )
+
+    path, relations = [], []
+    current = model
+    try:
+        for attr in attrs[:-1]:
+            model_field = current._meta.get_field(attr)
+            if not (model_field.many_to_one or model_field.one_to_one) or not model_field.concrete:
+                raise FieldDoesNotExist(attr)
+            path.append(attr)
+            relations.append("__".join(path))
+            current = model_field.related_model
+        model_field = current._meta.get_field(attrs[-1])
+    except FieldDoesNotExist:
+        raise ImproperlyConfigured(
+            f"Field '{field.field_name}' (source '{field.source}') isn't a model "
+            "column or forward relation; describe it in values_fields."
+        )
+    return path, relations, model_field
+
+
+def _compile_field(model, field: Field) -> ValuesField:
+    """Map a plain or dotted-source field onto values_list() lookups."""
+    attrs = field.source_attrs
+    path, relations, model_field = _resolve_source(model, field)
+
+    if isinstance(field, PrimaryKeyRelatedField):
+        if relations:
+            raise ImproperlyConfigured(
+                f"Related field '{field.field_name}' must not use a dotted source."
+            )
+        return ValuesField(attrs[-1], func=_pk_related)
+    if model_field.is_relation:
+        raise ImproperlyConfigured(
+            f"Field '{field.field_name}' serializes a relation; describe it in values_fields."
+        )
+
+    if not relations:
+        return ValuesField(attrs[-1], func=_convert(field))
+    # Fields on a missing related object are skipped, as DRF does; the
+    # innermost relation's key tells a null relation from a null value.
+    if model_field.primary_key and len(relations) == 1:
+        # parent.id is just the foreign key column: no join needed.
+        return ValuesField(relations[0], func=_convert_related_pk(field))
+    lookup = "__".join([*path, attrs[-1]])
+    return ValuesField(relations[-1], lookup, func=_convert_related(field))
+
+
+def compile_serializer(serializer_class, names=None) -> CompiledSerializer:
+    """Compile ``serializer_class``, limited to the field ``names`` if given."""
+    serializer = serializer_class()
+    model = serializer.Meta.model
+    overrides = getattr(serializer_class, "values_fields", {})
+
+    columns, annotations, fields = [], {}, []
+    positions: Dict[str, int] = {}
+
+    def position(column) -> int:
+        if not isinstance(column, str):
+            alias = f"_values_{len(annotations)}"
+            annotations[alias] = column
+            column = alias
+        if column not in positions:
+            positions[column] = len(columns)
+            columns.append(column)
+        return positions[column]
+
+    for name, field in serializer.fields.items():
+        if field.write_only or (names is not None and name not in names):
+            continue
+        spec = overrides.get(name)
+        if spec is None:
+            spec = _compile_field(model, field)
+        func = spec.func
+        if func is None:
+            if len(spec.columns) != 1:
+                raise ImproperlyConfigured(
+                    f"ValuesField for '{name}' reads several columns and needs a func."
+                )
+            func = _convert(field)
+        indexes = tuple(position(column) for column in spec.columns)
+        fields.append((name, indexes, func))
+    return CompiledSerializer(columns, annotations, fields)
+
+
+@lru_cache(maxsize=256)
+def get_compiled(serializer_class, names: Optional[Tuple[str, ...]] = None) -> CompiledSerializer:
+    return compile_serializer(serializer_class, names)
+
+
+def only_lookups(serializer) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    The ``only()`` lookups and ``select_related()`` paths covering every
+    readable field of ``serializer``, or None when a field reads something
+    other than model columns (method fields, properties).
+    """
+    model = serializer.Meta.model
+    lookups, relations = [], []
+    try:
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            path, field_relations, model_field = _resolve_source(model, field)
+            if model_field.is_relation and not isinstance(field, PrimaryKeyRelatedField):
+                return None
+            lookups.extend(field_relations)
+            lookups.append("__".join([*path, field.source_attrs[-1]]))
+            relations.extend(field_relations)
+    except ImproperlyConfigured:
+        return None
+    return list(dict.fromkeys(lookups)), list(dict.fromkeys(relations))
+
+
+def is_model_queryset(data) -> bool:
+    return isinstance(data, QuerySet) and issubclass(data._iterable_class, ModelIterable)
+
+
+class ValuesListSerializer(serializers.ListSerializer):
+    """
+    ``many=True`` serializer that renders ``values_list()`` rows (or a model
+    queryset, converted first) through the child's compiled field mapping.
+    Lists of model instances still take the regular path.
+    """
+
+    @classmethod
+    def list_queryset(cls, child_class, names, queryset: QuerySet) -> QuerySet:
+        """The rows ``render_rows`` expects, from a model queryset."""
+        return get_compiled(child_class, names).values_queryset(queryset)
+
+    def to_representation(self, data):
+        if isinstance(data, BaseManager):
+            data = data.all()
+        if is_model_queryset(data):
+            data = self.list_queryset(type(self.child), tuple(self.child.fields), data)
+        rows = list(data)
+        if rows and not isinstance(rows[0], tuple):
+            return super().to_representation(rows)
+        return self.render_rows(rows)
+
+    def render_rows(self, rows) -> List[dict]:
+        compiled = get_compiled(type(self.child), tuple(self.child.fields))
+        return compiled.to_representation(self.child, rows)
+
+
+def values_list_class(serializer_class):
+    """The serializer's ValuesListSerializer subclass, if it uses one."""
+    meta = getattr(serializer_class, "Meta", None)
+    list_class = getattr(meta, "list_serializer_class", None)
+    if list_class is not None and issubclass(list_class, ValuesListSerializer):
+        return list_class
+    return None
+
+
+class ValuesListMixin:
+    """
+    Shape list-action querysets after the (possibly sparse) list serializer:
+    use ``values_list()`` rows when it supports them, so pages are
+    rendered without building model instances and only the requested
+    columns and joins are queried; otherwise narrow a sparse request with
+    ``only()``.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if getattr(self, "action", None) == "list" and is_model_queryset(queryset):
+            queryset = self.shape_list_queryset(queryset)
+        return queryset
+
+    def shape_list_queryset(self, queryset):
+        serializer = self.get_serializer()
+        names = tuple(serializer.fields)
+        list_class = values_list_class(type(serializer))
+        if list_class is not None:
+            return list_class.list_queryset(type(serializer), names, queryset)
+        if getattr(serializer, "is_sparse", False):
+            lookups = only_lookups(serializer)
+            if lookups is not None:
+                only, relations = lookups
+                queryset = queryset.select_related(None)
+                if relations:
+                    queryset = queryset.select_related(*relations)
+                return queryset.only(*only)
+        return queryset
+
+
+def _requested_names(request, param) -> Optional[set]:
+    value = request.query_params.get(param)
+    if value is None:
+        return None
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsMixin:
+    """
+    Let GET requests narrow the top-level serializer with ``?fields=a,b``
+    and/or ``?exclude=c``; unknown names are ignored. Nested serializers and
+    writes always use their full field set.
+    """
+
+    is_sparse = False
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is None or request.method not in ("GET", "HEAD") or not self._is_root():
+            return fields
+
+        only = _requested_names(request, FIELDS_PARAM)
+        exclude = _requested_names(request, EXCLUDE_PARAM)
+        if only is not None:
+            fields = {name: field for name, field in fields.items() if name in only}
+        if exclude:
+            fields = {name: field for name, field in fields.items() if name not in exclude}
+        self.is_sparse = only is not None or bool(exclude)
+        return fields
+
+    def _is_root(self):
+        parent = self.parent
+        return parent is None or (
+            isinstance(parent, serializers.ListSerializer) and parent.parent is None
+        )
+
+
+def filtered_model_queryset(view):
+    """The view's filtered queryset, before ValuesListMixin reshapes it."""
+    queryset = view.get_queryset()
+    if isinstance(view, ValuesListMixin):
+        return super(ValuesListMixin, view).filter_queryset(queryset)
+    return view.filter_queryset(queryset)
@@ -0,0 +1,139 @@
+"""
+Shared base for the API query-count regression tests in each app's tests.py.
+
+APIQueryBudgetTestCase seeds one realistic dataset per test class (the roles
+and permissions from ``seed_roles_permissions`` plus benchmarks.data) and
+creates a user for each role in ROLES. Its assertions run a request with
+every cache emptied first, so budgets describe the cold path and don't
+depend on test order:
+
+- ``assertQueryBudget`` fails when a request runs more queries than its
+  budget, listing the query shapes that ran more than once (the usual sign
+  of an N+1);
+- ``assertConstantQueries`` fails when a list endpoint's query count grows
+  with the page size.
+"""
+import io
+from collections import Counter
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from benchmarks import data
+from common.slow_queries import normalize
+from core.celery import app as celery_app
+from core.resources import invalidation
+from core.resources.cache import Cache
+
+# Test users: role code from seed_roles_permissions, plus account flags.
+ROLES = {
+    "super_admin": ("SUPER_ADMIN", {"is_admin": True, "is_superuser": True}),
+    "managing_director": ("MANAGING_DIRECTOR", {}),
+    "general_manager": ("GENERAL_MANAGER", {}),
+    "hr": ("HR", {}),
+    "staff": ("STAFF", {}),
+    "no_role": (None, {}),
+}
+
+SMALL_PAGE = 5
+LARGE_PAGE = 50
+
+
+def duplicate_shapes(queries):
+    """``(count, normalized sql)`` for each query shape run more than once."""
+    shapes = Counter(normalize(query["sql"]) for query in queries)
+    return [(count, shape) for shape, count in shapes.most_common() if count > 1]
+
+
+def describe_queries(queries) -> str:
+    duplicates = duplicate_shapes(queries)
+    if not duplicates:
+        return "no query shape ran more than once"
+    lines = ["query shapes run more than once:"]
+    lines.extend(f"  {count}x {shape}" for count, shape in duplicates)
+    return "\n".join(lines)
+
+
+class APIQueryBudgetTestCase(APITestCase):
+    dataset = {"users": 60, "correspondence": 120, "tasks": 120, "audit_logs": 120}
+
+    @classmethod
+    def setUpClass(cls):
+        cls._task_always_eager = celery_app.conf.task_always_eager
+        celery_app.conf.task_always_eager = True
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        celery_app.conf.task_always_eager = cls._task_always_eager
+
+    @classmethod
+    def setUpTestData(cls):
+        from user.models.admin import Role
+        from user.models.models import CustomUser
+
+        call_command("seed_roles_permissions", stdout=io.StringIO())
+        data.seed(**cls.dataset, seed=0)
+        roles = {role.code: role for role in Role.objects.all()}
+        cls.users = {
+            name: CustomUser.objects.create_user(
+                email=f"{name}@tests.local",
+                password="password",
+                name=name.replace("_", " ").title(),
+                role=roles.get(code),
+                is_verified=True,
+                **flags,
+            )
+            for name, (code, flags) in ROLES.items()
+        }
+
+    def reset_caches(self):
+        Cache().flush()
+        invalidation.publish(invalidation.FLUSH_ALL)
+
+    def request(self, method, url, user=None, data=None):
+        """Run one request on a cold cache; returns (response, queries)."""
+        self.client.force_authenticate(user)
+        self.reset_caches()
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method.lower())(url, data, format="json")
+        return response, context.captured_queries
+
+    def assertQueryBudget(self, budget, method, url, user=None, data=None, status=None):
+        response, queries = self.request(method, url, user, data)
+        if status is not None:
+            self.assertEqual(
+                response.status_code, status, f"{method} {url}: {response.content[:500]!r}"
+            )
+        self.assertLessEqual(
+            len(queries),
+            budget,
+            f"{method} {url} ran {len(queries)} queries (budget {budget}); "
+            f"{describe_queries(queries)}",
+        )
+        return response
+
+    def assertQueryBudgetByRole(self, budget, method, url, statuses, data=None):
+        """assertQueryBudget as each role in ``statuses`` (role -> expected status)."""
+        for role, status in statuses.items():
+            with self.subTest(role=role):
+                self.assertQueryBudget(budget, method, url, self.users[role], data, status)
+
+    def assertConstantQueries(self, url, user=None, sizes=(SMALL_PAGE, LARGE_PAGE)):
+        """A list endpoint runs as many queries for a large page as a small one."""
+        separator = "&" if "?" in url else "?"
+        counts = {}
+        for size in sizes:
+            response, queries = self.request("get", f"{url}{separator}size={size}", user)
+            self.assertEqual(response.status_code, 200, f"GET {url}: {response.content[:500]!r}")
+            counts[size] = queries
+        small, large = counts[sizes[0]], counts[sizes[-1]]
+        self.assertEqual(
+            len(small),
+            len(large),
+            f"GET {url} ran {len(small)} queries for {sizes[0]} rows but {len(large)} "
+            f"for {sizes[-1]}; {describe_queries(large)}",
+        )